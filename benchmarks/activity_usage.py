@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.db_profiles import USAGES_START, seed_db
+from daily_flow.db.engine import build_engine, dispose_engine
+from daily_flow.db.repositories.activity.activity_usage_repo import ActivityUsageRepo
+
+# запит -> індекс, який він мусить використати
+EXPECTED_INDEXES = {
+    "get_activity_usages_by_period": "ix_activity_usage_used_at",
+    "get_last_activity_usages": "ix_activity_usage_used_at",
+    "get_activity_usages_by_activity": "ix_activity_usage_activity_id_used_at",
+}
+
+
+def get_queries(repo: ActivityUsageRepo) -> dict:
+    period_end = USAGES_START + timedelta(days=5 * 365)
+    return {
+        "get_activity_usages_by_period": lambda: repo.get_activity_usages_by_period(
+            period_end - timedelta(days=30), period_end
+        ),
+        "get_last_activity_usages": lambda: repo.get_last_activity_usages(20),
+        "get_activity_usages_by_activity": lambda: repo.get_activity_usages_by_activity(7),
+    }
+
+
+async def capture_statement(engine: AsyncEngine, query) -> tuple[str, tuple]:
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+    try:
+        await query()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+
+    return captured[-1]
+
+
+async def explain_query_plan(engine: AsyncEngine, query) -> list[str]:
+    statement, parameters = await capture_statement(engine, query)
+    async with engine.connect() as conn:
+        rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in rows]
+
+
+async def check_query_plans(engine: AsyncEngine) -> list[str]:
+    """Problems found in the plans: the expected index is not used or rows are sorted."""
+    problems = []
+    for name, query in get_queries(ActivityUsageRepo(engine)).items():
+        plan = await explain_query_plan(engine, query)
+        print(f"{name}: {' | '.join(plan)}")
+
+        if not any(EXPECTED_INDEXES[name] in step for step in plan):
+            problems.append(f"{name} does not use {EXPECTED_INDEXES[name]}")
+        if any("TEMP B-TREE" in step for step in plan):
+            problems.append(f"{name} sorts rows in a temp b-tree")
+    return problems
+
+
+async def measure_latency(engine: AsyncEngine, calls: int) -> dict[str, tuple[float, float]]:
+    """p50 and p95 seconds per call."""
+    timings = {}
+    for name, query in get_queries(ActivityUsageRepo(engine)).items():
+        await query()
+
+        samples = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            await query()
+            samples.append(time.perf_counter() - started)
+        timings[name] = (float(np.percentile(samples, 50)), float(np.percentile(samples, 95)))
+    return timings
+
+
+async def drop_indexes(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        for index_name in sorted(set(EXPECTED_INDEXES.values())):
+            await conn.exec_driver_sql(f"DROP INDEX {index_name}")
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as db_dir:
+        db_url = f"sqlite+aiosqlite:///{Path(db_dir) / 'bench.db'}"
+        await seed_db(db_url, args.usages)
+
+        engine = await build_engine(db_url)
+        try:
+            problems = await check_query_plans(engine)
+            with_indexes = await measure_latency(engine, args.calls)
+
+            await drop_indexes(engine)
+            without_indexes = await measure_latency(engine, args.calls)
+        finally:
+            await dispose_engine(engine)
+
+    print(f"\nactivity_usage rows: {args.usages}")
+    for name, (p50, p95) in with_indexes.items():
+        base_p50, base_p95 = without_indexes[name]
+        print(
+            f"{name:<34} p50={p50 * 1000:.3f}ms p95={p95 * 1000:.3f}ms "
+            f"(no indexes: p50={base_p50 * 1000:.3f}ms p95={base_p95 * 1000:.3f}ms)"
+        )
+
+    for problem in problems:
+        print(f"QUERY PLAN REGRESSION: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--usages", type=int, default=1_000_000)
+    p.add_argument("--calls", type=int, default=100)
+    args = p.parse_args()
+
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.generators import make_mood_log_payload
+from daily_flow.db.engine import build_engine, dispose_engine
+from daily_flow.db.init import init_db
+from daily_flow.db.repositories.activity.activity_repo import ActivityRepo
+from daily_flow.db.repositories.activity.activity_usage_repo import ActivityUsageRepo
+from daily_flow.db.repositories.activity.category_repo import CategoryRepo
+from daily_flow.db.repositories.idea_repo import IdeaRepo
+from daily_flow.db.repositories.mood_log_repo import MoodLogRepo
+from daily_flow.db.schema import activity, activity_usage, category, idea
+from daily_flow.ingest.schemas.mood_log import MOOD_LOG_INGEST_CONTRACT
+
+USAGES_START = datetime(2020, 1, 1)
+
+
+async def seed_db(db_url: str, n_usages: int, seed: int = 42) -> None:
+    rng = np.random.default_rng(seed)
+    engine = await build_engine(db_url, profile="ingest")
+
+    try:
+        await init_db(engine)
+
+        n_activities = 300
+        async with engine.begin() as conn:
+            await conn.execute(
+                activity.insert(),
+                [
+                    {"title": f"activity {i}", "description": "x" * int(rng.integers(20, 400))}
+                    for i in range(n_activities)
+                ],
+            )
+            await conn.execute(category.insert(), [{"name": f"category {i}"} for i in range(30)])
+            await conn.execute(
+                idea.insert(),
+                [{"title": f"idea {i}", "description": "y" * 200} for i in range(2_000)],
+            )
+
+            minutes = np.sort(rng.integers(0, 6 * 365 * 24 * 60, size=n_usages))
+            activity_ids = rng.integers(1, n_activities + 1, size=n_usages)
+            await conn.execute(
+                activity_usage.insert(),
+                [
+                    {
+                        "activity_id": int(activity_id),
+                        "used_at": USAGES_START + timedelta(minutes=int(minute)),
+                    }
+                    for activity_id, minute in zip(activity_ids, minutes, strict=True)
+                ],
+            )
+
+        await MoodLogRepo(engine).batch_upsert_mood_logs(
+            make_mood_log_payload(5_000, MOOD_LOG_INGEST_CONTRACT, seed)
+        )
+    finally:
+        await dispose_engine(engine)
+
+
+async def run_bot_queries(db_url: str, profile: str, calls: int) -> dict[str, float]:
+    """Mean seconds per call of the queries behind the bot's list, history and log screens."""
+    engine = await build_engine(db_url, profile=profile)
+
+    activity_repo = ActivityRepo(engine)
+    activity_usage_repo = ActivityUsageRepo(engine)
+    category_repo = CategoryRepo(engine)
+    idea_repo = IdeaRepo(engine)
+    mood_log_repo = MoodLogRepo(engine)
+
+    month_end = USAGES_START + timedelta(days=5 * 365)
+    queries = {
+        "get_all_activities": activity_repo.get_all_activities,
+        "get_all_categories": category_repo.get_all_categories,
+        "get_all_ideas": idea_repo.get_all_ideas,
+        "get_last_activity_usages": lambda: activity_usage_repo.get_last_activity_usages(20),
+        "get_activity_usages_by_activity": lambda: (
+            activity_usage_repo.get_activity_usages_by_activity(7)
+        ),
+        "get_activity_usages_by_period": lambda: activity_usage_repo.get_activity_usages_by_period(
+            month_end - timedelta(days=30), month_end
+        ),
+        "mood_log.list_by_date_range": lambda: mood_log_repo.list_by_date_range(
+            date(1700, 1, 1), date(1700, 3, 1)
+        ),
+        # одиночний коміт, як після кожного натискання в боті: тут і видно synchronous
+        "upsert_activity_usage (write)": lambda: activity_usage_repo.upsert_activity_usage(
+            activity_id=7, used_at=month_end, payload={}
+        ),
+    }
+
+    try:
+        timings = {}
+        for name, query in queries.items():
+            # перший виклик прогріває пул зʼєднань і кеш сторінок
+            await query()
+
+            started = time.perf_counter()
+            for _ in range(calls):
+                await query()
+            timings[name] = (time.perf_counter() - started) / calls
+        return timings
+    finally:
+        await dispose_engine(engine)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as db_dir:
+        db_url = f"sqlite+aiosqlite:///{Path(db_dir) / 'bench.db'}"
+        await seed_db(db_url, args.usages)
+
+        results = {
+            profile: await run_bot_queries(db_url, profile, args.calls) for profile in args.profiles
+        }
+
+    baseline = results[args.profiles[0]]
+    for name in baseline:
+        line = " ".join(
+            f"{profile}={results[profile][name] * 1000:.3f}ms" for profile in args.profiles
+        )
+        speedup = baseline[name] / results[args.profiles[-1]][name]
+        print(f"{name:<34} {line} speedup={speedup:.2f}x")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--usages", type=int, default=200_000)
+    p.add_argument("--calls", type=int, default=50)
+    p.add_argument("--profiles", nargs="+", default=["default", "bot"])
+    args = p.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
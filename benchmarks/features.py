@@ -0,0 +1,182 @@
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from daily_flow.analytics.datasets.schema import BAD_MOOD_COLUMNS, GOOD_MOOD_COLUMNS, MOOD_COLUMNS
+from daily_flow.analytics.features import DEFAULT_WINDOWS, FeatureSpec, build_feature_matrix
+
+# Reference implementations copied from notebook 05
+
+
+def extract_lag_features(df, col_name, lags):
+    features = pd.DataFrame(index=df.index)
+    for lag in lags:
+        features[f"{col_name}_lag_{lag}"] = df[col_name].shift(lag)
+    return features
+
+
+def extract_rolling_mean_features(df, col_name, windows):
+    features = pd.DataFrame(index=df.index)
+    for w in windows:
+        features[f"{col_name}_sma_{w}d"] = df[col_name].shift(1).rolling(window=w).mean()
+    return features
+
+
+def extract_ewm_features(df, spans=DEFAULT_WINDOWS):
+    features = {}
+    target_cols = list(dict.fromkeys(GOOD_MOOD_COLUMNS + BAD_MOOD_COLUMNS))
+    df_shifted = df[target_cols].shift(1)
+
+    for s in spans:
+        ewm_df = df_shifted.ewm(span=s).mean()
+
+        for col in target_cols:
+            features[f"{col}_ewm_{s}"] = ewm_df[col]
+
+    return pd.DataFrame(features, index=df.index)
+
+
+def extract_std_features(df, max_window=7):
+    features = pd.DataFrame(index=df.index)
+
+    all_cols = MOOD_COLUMNS + ["target_final"]
+
+    for col in all_cols:
+        for window in range(2, max_window + 1):
+            features[f"{col}_std_{window}d"] = (
+                df[col].shift(1).rolling(window=window, min_periods=2).std().fillna(0)
+            )
+    return features
+
+
+def extract_mood_deltas_features(df, max_days=8):
+    features = pd.DataFrame(index=df.index)
+
+    for col in MOOD_COLUMNS:
+        base_lag_1 = df[col].shift(1)
+        for days in range(1, max_days + 1):
+            features[f"{col}_delta_{days}d"] = base_lag_1 - df[col].shift(days + 1)
+
+    return features
+
+
+def extract_rolling_interactions(df, windows=DEFAULT_WINDOWS):
+    features = {}
+    target_cols = list(dict.fromkeys(GOOD_MOOD_COLUMNS + BAD_MOOD_COLUMNS))
+    df_shifted = df[target_cols].shift(1)
+
+    for w in windows:
+        rolling_df = df_shifted.rolling(window=w).mean()
+
+        for good in GOOD_MOOD_COLUMNS:
+            for bad in BAD_MOOD_COLUMNS:
+                features[f"{good}_x_{bad}_roll_{w}"] = rolling_df[good] * rolling_df[bad]
+
+    return pd.DataFrame(features, index=df.index)
+
+
+def extract_cross_interactions_features(df, max_days=8):
+    features = pd.DataFrame(index=df.index)
+
+    for days in range(1, max_days + 1):
+        for good_col in GOOD_MOOD_COLUMNS:
+            for bad_col in BAD_MOOD_COLUMNS:
+                good_lag = df[good_col].shift(days)
+                bad_lag = df[bad_col].shift(days)
+
+                features[f"{good_col}_x_{bad_col}_lag_{days}"] = good_lag * bad_lag
+                features[f"{good_col}_plus_{bad_col}_lag_{days}"] = good_lag + bad_lag
+
+    return features
+
+
+def extract_calendar_features(df):
+    features = pd.DataFrame(index=df.index)
+
+    features["is_weekend"] = df.index.dayofweek.isin([5, 6]).astype(int)
+    features["mood_volatility_7d"] = df["target_final"].shift(1).rolling(window=7).std()
+    features["mood_weekly_context"] = df["target_final"].shift(1).rolling(window=7).mean()
+    features["week_of_year"] = df.index.isocalendar().week.astype(int)
+
+    days_in_month = 30.5
+    features["month_day_sin"] = np.sin(2 * np.pi * df.index.day / days_in_month)
+    features["month_day_cos"] = np.cos(2 * np.pi * df.index.day / days_in_month)
+
+    return features
+
+
+def build_notebook_features(df: pd.DataFrame, spec: FeatureSpec) -> pd.DataFrame:
+    series_columns = [*MOOD_COLUMNS, "target_final"]
+
+    frames = [extract_lag_features(df, col, spec.lags) for col in series_columns]
+    frames += [extract_rolling_mean_features(df, col, spec.sma_windows) for col in series_columns]
+    frames += [
+        extract_ewm_features(df, spec.ewm_spans),
+        extract_std_features(df, spec.std_max_window),
+        extract_mood_deltas_features(df, spec.delta_max_days),
+        extract_rolling_interactions(df, spec.rolling_interaction_windows),
+        extract_cross_interactions_features(df, spec.cross_max_days),
+        extract_calendar_features(df),
+    ]
+    return pd.concat(frames, axis=1)
+
+
+def make_mood_frame(n_rows: int, seed: int = 42, missing_share: float = 0.1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+
+    moods = rng.integers(1, 5, size=(n_rows, len(MOOD_COLUMNS))).astype(float)
+    moods[rng.random(moods.shape) < missing_share] = np.nan
+
+    df = pd.DataFrame(
+        moods,
+        columns=MOOD_COLUMNS,
+        index=pd.date_range("2000-01-01", periods=n_rows, freq="D", name="day"),
+    )
+    df["target_final"] = rng.uniform(1, 7, size=n_rows)
+    return df
+
+
+def _timed(repeat: int, func, *args):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return result, min(timings)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000])
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    # notebook versions fragment the frame by design, that is what is being measured
+    warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+
+    spec = FeatureSpec()
+
+    for n_rows in args.rows:
+        df = make_mood_frame(n_rows)
+
+        reference, reference_time = _timed(args.repeat, build_notebook_features, df, spec)
+        matrix, matrix_time = _timed(args.repeat, build_feature_matrix, df, spec)
+
+        reference = reference[matrix.columns].to_numpy(dtype=np.float32)
+        max_abs_diff = np.nanmax(np.abs(reference - matrix.values))
+        same_nans = np.array_equal(np.isnan(reference), np.isnan(matrix.values))
+
+        print(
+            f"rows={n_rows} features={len(matrix.columns)} "
+            f"notebook={reference_time:.3f}s vectorized={matrix_time:.3f}s "
+            f"speedup={reference_time / matrix_time:.1f}x "
+            f"max_abs_diff={max_abs_diff:.2e} same_nans={same_nans}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from daily_flow.db.repositories.common_mood_repo import DayPayload as CommonMoodLogDayPayload
+from daily_flow.db.repositories.mood_log_repo import DayPayload as MoodLogDayPayload
+from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
+from daily_flow.ingest.sources.common_mood_log_csv import column_mapping as csv_column_mapping
+from daily_flow.ingest.sources.mood_log_excel import column_mapping as excel_column_mapping
+from daily_flow.ingest.transforms.common_mood_log import COMMON_MOODS
+
+# bump when the generated data changes, so cached files are not reused
+GENERATOR_VERSION = 1
+
+# datetime64[ns] тримає лише ~584 роки: після CALENDAR_DAYS рядків дні йдуть по колу,
+# тож у файлах це дублікати днів, а в payload — повторні upsert тих самих днів
+CALENDAR_START = np.datetime64("1700-01-01", "D")
+CALENDAR_DAYS = int((np.datetime64("2261-12-31", "D") - CALENDAR_START).astype(int)) + 1
+
+MOOD_LOG_SHEET_ROWS = 50_000
+
+NOTES = ("", "walk", "work", "gym, friends", "slept badly", 'Нотатка з комою, і лапками "так"')
+
+
+def make_days(rng: np.random.Generator, n_rows: int) -> np.ndarray:
+    """Consecutive calendar days with missing and duplicated days sprinkled in (NaT = missing)."""
+    days = CALENDAR_START + (np.arange(n_rows) % CALENDAR_DAYS).astype("timedelta64[D]")
+    days = days.astype("datetime64[s]")
+
+    duplicated = rng.random(n_rows) < 0.001
+    duplicated[0] = False
+    days[duplicated] = days[np.flatnonzero(duplicated) - 1]
+    days[rng.random(n_rows) < 0.001] = np.datetime64("NaT")
+    return days
+
+
+def make_mood_values(rng: np.random.Generator, n_rows: int, n_moods: int) -> np.ndarray:
+    """Mood scores 1..4 with NaNs, empty and sleep-only rows, out-of-range and fractional values."""
+    values = rng.integers(1, 5, size=(n_rows, n_moods)).astype(float)
+    values[rng.random((n_rows, n_moods)) < 0.1] = np.nan
+    values[rng.random(n_rows) < 0.01] = np.nan
+    values[rng.random((n_rows, n_moods)) < 0.001] = 7.0
+    values[rng.random((n_rows, n_moods)) < 0.001] = 2.5
+
+    # останній стовпець — сон
+    sleep_only = rng.random(n_rows) < 0.005
+    values[sleep_only, :-1] = np.nan
+    return values
+
+
+def make_normalized_mood_log(
+    n_rows: int, contract: MoodLogIngestContract, seed: int = 42
+) -> pd.DataFrame:
+    """Normalized mood_log frame with every kind of issue sprinkled in."""
+    rng = np.random.default_rng(seed)
+
+    # 1M різних днів не влазять у datetime64[ns], тож "дні" тут погодинні — валідатору байдуже
+    days = pd.Series(pd.date_range("1970-01-01", periods=n_rows, freq="h"))
+    days[rng.random(n_rows) < 0.001] = pd.NaT
+    duplicated = rng.random(n_rows) < 0.001
+    days[duplicated] = days.shift(1)[duplicated]
+
+    values = make_mood_values(rng, n_rows, len(contract.mood_columns))
+
+    df = pd.DataFrame(values, columns=list(contract.mood_columns)).astype("Float64")
+    df.insert(0, "day", days)
+    return df
+
+
+def _to_cells(values: np.ndarray) -> list[list]:
+    cells = values.astype(object)
+    cells[pd.isna(values)] = None
+    return cells.tolist()
+
+
+def make_raw_mood_log(n_rows: int, contract: MoodLogIngestContract, seed: int = 42) -> pd.DataFrame:
+    """mood_log rows as read from the workbook (mapped column names, untyped values)."""
+    rng = np.random.default_rng(seed)
+
+    df = pd.DataFrame(
+        make_mood_values(rng, n_rows, len(contract.mood_columns)),
+        columns=list(contract.mood_columns),
+    )
+    df.insert(0, "day", make_days(rng, n_rows))
+    return df
+
+
+def write_mood_log_workbook(
+    path: Path, n_rows: int, contract: MoodLogIngestContract, seed: int = 42
+) -> Path:
+    """
+    mood_log workbook as the source exports it: Ukrainian headers, one sheet per
+    MOOD_LOG_SHEET_ROWS days and one unrelated sheet the reader must skip.
+    """
+    df = make_raw_mood_log(n_rows, contract, seed)
+
+    excel_columns = {column: header for header, column in excel_column_mapping.items()}
+    header = [excel_columns[column] for column in df.columns]
+
+    day_cells = df["day"].to_numpy().astype("datetime64[s]").astype(object)
+    mood_cells = _to_cells(df[list(contract.mood_columns)].to_numpy())
+
+    workbook = Workbook(write_only=True)
+
+    notes = workbook.create_sheet("Нотатки")
+    notes.append(["Що", "Коли"])
+    notes.append(["generated", str(CALENDAR_START)])
+
+    for sheet_number, start in enumerate(range(0, n_rows, MOOD_LOG_SHEET_ROWS), start=1):
+        sheet = workbook.create_sheet(f"Аркуш {sheet_number}")
+        sheet.append(header)
+
+        for day, moods in zip(
+            day_cells[start : start + MOOD_LOG_SHEET_ROWS],
+            mood_cells[start : start + MOOD_LOG_SHEET_ROWS],
+            strict=True,
+        ):
+            sheet.append([day, *moods])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workbook.save(path)
+    return path
+
+
+def make_raw_common_mood_log(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    common_mood_log export rows with source headers: one entry per day logged in the evening,
+    with missing times, duplicated days, empty notes and an extra column the reader must drop.
+    """
+    rng = np.random.default_rng(seed)
+
+    days = make_days(rng, n_rows)
+    minutes = rng.integers(18 * 60, 24 * 60, size=n_rows).astype("timedelta64[m]")
+
+    labels = np.array(list(COMMON_MOODS))[rng.integers(0, len(COMMON_MOODS), size=n_rows)]
+    notes = np.array(NOTES)[rng.integers(0, len(NOTES), size=n_rows)]
+
+    csv_columns = {column: header for header, column in csv_column_mapping.items()}
+
+    return pd.DataFrame(
+        {
+            csv_columns["day"]: pd.Series(days + minutes).dt.strftime("%Y-%m-%d %H:%M"),
+            csv_columns["mood"]: labels,
+            csv_columns["note"]: notes,
+            "Extra": rng.integers(0, 100, size=n_rows),
+        }
+    )
+
+
+def write_common_mood_log_csv(path: Path, n_rows: int, seed: int = 42) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    make_raw_common_mood_log(n_rows, seed).to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
+def make_mood_log_payload(
+    n_rows: int, contract: MoodLogIngestContract, seed: int = 42
+) -> list[MoodLogDayPayload]:
+    """Already clean batch_upsert_mood_logs payload: valid scores or None, no empty days."""
+    rng = np.random.default_rng(seed)
+
+    days = (CALENDAR_START + (np.arange(n_rows) % CALENDAR_DAYS)).astype(object)
+
+    values = make_mood_values(rng, n_rows, len(contract.mood_columns))
+    values[~np.isin(values, (1, 2, 3, 4))] = np.nan
+
+    # порожні дні відкидає ще transform, у payload їх не буває
+    has_any = ~np.isnan(values).all(axis=1)
+    days, values = days[has_any], values[has_any]
+
+    scores = np.nan_to_num(values).astype(int).astype(object)
+    scores[np.isnan(values)] = None
+
+    return [
+        {"day": day, "values": dict(zip(contract.mood_columns, row, strict=True))}
+        for day, row in zip(days, scores.tolist(), strict=True)
+    ]
+
+
+def make_common_mood_log_payload(n_rows: int, seed: int = 42) -> list[CommonMoodLogDayPayload]:
+    rng = np.random.default_rng(seed)
+
+    days = (CALENDAR_START + (np.arange(n_rows) % CALENDAR_DAYS)).astype(object)
+    moods = rng.integers(1, len(COMMON_MOODS) + 1, size=n_rows).tolist()
+    notes = np.array(NOTES)[rng.integers(0, len(NOTES), size=n_rows)].tolist()
+
+    return [
+        {"day": day, "values": {"mood": mood, "note": note or None}}
+        for day, mood, note in zip(days, moods, notes, strict=True)
+    ]
+
+
+def get_mood_log_workbook(
+    data_dir: Path, n_rows: int, contract: MoodLogIngestContract, seed: int = 42
+) -> Path:
+    # генерація 1M рядків xlsx триває хвилини, тож файли кешуються між запусками
+    path = data_dir / f"mood_log_v{GENERATOR_VERSION}_{n_rows}_{seed}.xlsx"
+    if not path.exists():
+        # перерваний запис не лишає в кеші битий файл
+        partial = write_mood_log_workbook(path.with_suffix(".partial"), n_rows, contract, seed)
+        partial.replace(path)
+    return path
+
+
+def get_common_mood_log_csv(data_dir: Path, n_rows: int, seed: int = 42) -> Path:
+    path = data_dir / f"common_mood_log_v{GENERATOR_VERSION}_{n_rows}_{seed}.csv"
+    if not path.exists():
+        write_common_mood_log_csv(path.with_suffix(".partial"), n_rows, seed).replace(path)
+    return path
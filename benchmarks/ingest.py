@@ -0,0 +1,327 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.features import _timed
+from benchmarks.generators import (
+    CALENDAR_DAYS,
+    get_common_mood_log_csv,
+    get_mood_log_workbook,
+    make_common_mood_log_payload,
+    make_mood_log_payload,
+    make_raw_mood_log,
+)
+from daily_flow.analytics.datasets.loader import _load_mood_mart_df
+from daily_flow.analytics.datasets.reader import analytics_connection, close_analytics_connections
+from daily_flow.db.engine import build_engine
+from daily_flow.db.init import init_db
+from daily_flow.db.repositories.common_mood_repo import CommonMoodLogRepo
+from daily_flow.db.repositories.ingest_fingerprint_repo import IngestFingerprintRepo
+from daily_flow.db.repositories.ingest_quarantine_repo import IngestQuarantineRepo
+from daily_flow.db.repositories.ingest_run_repo import IngestRunRepo
+from daily_flow.db.repositories.mood_log_repo import MoodLogRepo
+from daily_flow.ingest.runner.common_mood_log import common_mood_log_runner
+from daily_flow.ingest.runner.mood_log import mood_log_runner
+from daily_flow.ingest.schemas.common_mood_log import COMMON_MOOD_LOG_INGEST_CONTRACT
+from daily_flow.ingest.schemas.mood_log import MOOD_LOG_INGEST_CONTRACT
+from daily_flow.ingest.sources.common_mood_log_csv import read_common_mood_log_csv
+from daily_flow.ingest.transforms.common_mood_log import transform_common_mood_log
+from daily_flow.ingest.transforms.mood_log import transform_mood_log_sheet
+from daily_flow.ingest.validators.common_mood_log.validator import validate_common_mood_log
+from daily_flow.ingest.validators.mood_log.validator import validate_mood_log
+from daily_flow.utils.profiling import StageProfiler
+
+BENCHMARKS = ("ingest", "validate", "batch_upsert", "mood_mart")
+
+DEFAULT_DATA_DIR = Path(tempfile.gettempdir()) / "daily_flow_benchmarks"
+
+
+@contextlib.asynccontextmanager
+async def fresh_engine(data_dir: Path) -> AsyncIterator[AsyncEngine]:
+    # кожен повтор пише в порожню БД, інакше інжест пропустить уже завантажений файл
+    with tempfile.TemporaryDirectory(dir=data_dir) as db_dir:
+        db_path = Path(db_dir) / "bench.db"
+        engine = await build_engine(f"sqlite+aiosqlite:///{db_path}", is_database_echo=False)
+        try:
+            await init_db(engine)
+            yield engine
+        finally:
+            close_analytics_connections()
+            await engine.dispose()
+
+
+async def _count_rows(engine: AsyncEngine) -> dict[str, int]:
+    async with engine.connect() as conn:
+        res = await conn.execute(
+            text("""
+                SELECT
+                    (SELECT COUNT(*) FROM mood_log) AS mood_log,
+                    (SELECT COUNT(*) FROM common_mood_log) AS common_mood_log,
+                    (SELECT COUNT(*) FROM ingest_quarantine) AS quarantined
+            """)
+        )
+        return dict(res.mappings().one())
+
+
+async def run_ingest(
+    data_dir: Path, mood_log_path: Path, common_mood_log_path: Path
+) -> dict[str, dict[str, Any]]:
+    """
+    Full ingest of both files into one fresh DB, then a full mood-mart load over it.
+    Stage timings come from the runners' StageProfiler. Above CALENDAR_DAYS rows the files
+    repeat days, so the extra rows measure the quarantine path rather than the load.
+    """
+    results = {}
+
+    async with fresh_engine(data_dir) as engine:
+        ingest_run_repo = IngestRunRepo(engine)
+        ingest_quarantine_repo = IngestQuarantineRepo(engine)
+
+        mood_log_profiler = StageProfiler()
+        common_mood_log_profiler = StageProfiler()
+
+        started = time.perf_counter()
+        mood_log_status = await mood_log_runner(
+            file_path=mood_log_path,
+            contract=MOOD_LOG_INGEST_CONTRACT,
+            ingest_run_repo=ingest_run_repo,
+            mood_log_repo=MoodLogRepo(engine),
+            ingest_fingerprint_repo=IngestFingerprintRepo(engine),
+            ingest_quarantine_repo=ingest_quarantine_repo,
+            profiler=mood_log_profiler,
+        )
+        mood_log_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        common_mood_log_status = await common_mood_log_runner(
+            file_path=common_mood_log_path,
+            contract=COMMON_MOOD_LOG_INGEST_CONTRACT,
+            ingest_run_repo=ingest_run_repo,
+            common_mood_log_repo=CommonMoodLogRepo(engine),
+            ingest_fingerprint_repo=IngestFingerprintRepo(engine),
+            ingest_quarantine_repo=ingest_quarantine_repo,
+            profiler=common_mood_log_profiler,
+        )
+        common_mood_log_seconds = time.perf_counter() - started
+
+        counts = await _count_rows(engine)
+
+        results["ingest.mood_log"] = {
+            "seconds": round(mood_log_seconds, 6),
+            "status": str(mood_log_status),
+            "stages": _stage_seconds(mood_log_profiler),
+        }
+        results["ingest.common_mood_log"] = {
+            "seconds": round(common_mood_log_seconds, 6),
+            "status": str(common_mood_log_status),
+            "stages": _stage_seconds(common_mood_log_profiler),
+        }
+        results["ingest.db_rows"] = counts
+
+        with analytics_connection(str(engine.url)) as conn:
+            mart, mart_seconds = _timed(1, _load_mood_mart_df, conn)
+        results["mood_mart.load"] = {"seconds": round(mart_seconds, 6), "mart_rows": len(mart)}
+
+    return results
+
+
+def _stage_seconds(profiler: StageProfiler) -> dict[str, float]:
+    return {name: stage["seconds"] for name, stage in profiler.to_metrics()["stages"].items()}
+
+
+async def run_batch_upsert(data_dir: Path, n_rows: int, seed: int) -> dict[str, dict[str, Any]]:
+    mood_log_payload = make_mood_log_payload(n_rows, MOOD_LOG_INGEST_CONTRACT, seed)
+    common_mood_log_payload = make_common_mood_log_payload(n_rows, seed)
+
+    async with fresh_engine(data_dir) as engine:
+        started = time.perf_counter()
+        mood_log_result = await MoodLogRepo(engine).batch_upsert_mood_logs(mood_log_payload)
+        mood_log_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        common_mood_log_result = await CommonMoodLogRepo(engine).batch_upsert_common_mood_logs(
+            common_mood_log_payload
+        )
+        common_mood_log_seconds = time.perf_counter() - started
+
+    return {
+        "batch_upsert.mood_log": {
+            "seconds": round(mood_log_seconds, 6),
+            "rows_written": mood_log_result.rows_written,
+        },
+        "batch_upsert.common_mood_log": {
+            "seconds": round(common_mood_log_seconds, 6),
+            "rows_written": common_mood_log_result.rows_written,
+        },
+    }
+
+
+def run_validate(
+    n_rows: int, common_mood_log_path: Path, seed: int, repeat: int
+) -> dict[str, dict[str, Any]]:
+    # ті самі дані, що у файлі, але без openpyxl: валідатору потрібен лише нормалізований кадр
+    df_mood_log = transform_mood_log_sheet(
+        make_raw_mood_log(n_rows, MOOD_LOG_INGEST_CONTRACT, seed), MOOD_LOG_INGEST_CONTRACT
+    )
+    df_common_mood_log = transform_common_mood_log(
+        read_common_mood_log_csv(common_mood_log_path), COMMON_MOOD_LOG_INGEST_CONTRACT
+    )
+
+    mood_log_result, mood_log_seconds = _timed(
+        repeat, validate_mood_log, df_mood_log, MOOD_LOG_INGEST_CONTRACT
+    )
+    common_mood_log_result, common_mood_log_seconds = _timed(
+        repeat, validate_common_mood_log, df_common_mood_log, COMMON_MOOD_LOG_INGEST_CONTRACT
+    )
+
+    return {
+        "validate.mood_log": {
+            "seconds": round(mood_log_seconds, 6),
+            "bad_rows": int(mood_log_result.bad_row_mask.sum()),
+        },
+        "validate.common_mood_log": {
+            "seconds": round(common_mood_log_seconds, 6),
+            "bad_rows": int(common_mood_log_result.bad_row_mask.sum()),
+        },
+    }
+
+
+def _fastest(runs: list[dict[str, dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+    return {
+        name: min((run[name] for run in runs), key=lambda result: result.get("seconds", 0))
+        for name in runs[0]
+    }
+
+
+async def run_suite(
+    rows: list[int], benchmarks: list[str], repeat: int, seed: int, data_dir: Path
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Returns {benchmark: {rows: result}}; with repeat > 1 the fastest run is kept."""
+    suite: dict[str, dict[str, dict[str, Any]]] = {}
+
+    for n_rows in rows:
+        mood_log_path = get_mood_log_workbook(data_dir, n_rows, MOOD_LOG_INGEST_CONTRACT, seed)
+        common_mood_log_path = get_common_mood_log_csv(data_dir, n_rows, seed)
+
+        results = {}
+        if "ingest" in benchmarks or "mood_mart" in benchmarks:
+            # mood-mart читає БД, яку щойно наповнив інжест
+            results |= _fastest(
+                [
+                    await run_ingest(data_dir, mood_log_path, common_mood_log_path)
+                    for _ in range(repeat)
+                ]
+            )
+        if "validate" in benchmarks:
+            results |= run_validate(n_rows, common_mood_log_path, seed, repeat)
+        if "batch_upsert" in benchmarks:
+            results |= _fastest(
+                [await run_batch_upsert(data_dir, n_rows, seed) for _ in range(repeat)]
+            )
+
+        for name, result in results.items():
+            if name.split(".")[0] in benchmarks:
+                suite.setdefault(name, {})[str(n_rows)] = result
+
+    return suite
+
+
+def get_meta(args: argparse.Namespace) -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "calendar_days": CALENDAR_DAYS,
+    }
+
+
+def compare_with_baseline(
+    suite: dict[str, dict[str, dict[str, Any]]], baseline_path: Path, threshold: float
+) -> list[str]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+
+    regressions = []
+    for name, by_rows in suite.items():
+        for n_rows, result in by_rows.items():
+            before = baseline.get(name, {}).get(n_rows, {}).get("seconds")
+            if "seconds" not in result or not before:
+                continue
+
+            ratio = result["seconds"] / before
+            line = f"{name:<30} rows={n_rows:<8} {before:9.3f}s -> {result['seconds']:9.3f}s"
+            print(f"{line}  x{ratio:.2f}", file=sys.stderr)
+            if ratio > threshold:
+                regressions.append(line)
+
+    return regressions
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description="Times ingest, validators, batch upserts and the mood-mart load on "
+        "deterministic synthetic data and writes the results as JSON."
+    )
+    p.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    p.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS))
+    p.add_argument("--repeat", type=int, default=1)
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    p.add_argument("--output", type=Path, help="Write JSON here instead of stdout")
+    p.add_argument("--baseline", type=Path, help="JSON of an earlier run to compare against")
+    p.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Slowdown ratio against --baseline reported as a regression",
+    )
+    args = p.parse_args()
+
+    args.data_dir.mkdir(parents=True, exist_ok=True)
+
+    suite = asyncio.run(
+        run_suite(args.rows, args.benchmarks, args.repeat, args.seed, args.data_dir)
+    )
+
+    report = json.dumps(
+        {"meta": get_meta(args), "results": suite}, indent=2, sort_keys=True, default=str
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+    if args.baseline:
+        regressions = compare_with_baseline(suite, args.baseline, args.threshold)
+        if regressions:
+            raise SystemExit(f"{len(regressions)} regression(s) over x{args.threshold}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import argparse
+from functools import partial
+
+import pandas as pd
+
+from benchmarks.features import _timed
+from benchmarks.generators import make_normalized_mood_log
+from daily_flow.ingest.schemas.mood_log import MOOD_LOG_INGEST_CONTRACT, MoodLogIngestContract
+from daily_flow.ingest.validators.checks.column_has_any_duplicates import (
+    check_column_has_any_duplicates,
+)
+from daily_flow.ingest.validators.checks.column_has_any_na import check_column_has_any_na
+from daily_flow.ingest.validators.checks.column_is_integer import check_column_is_integer
+from daily_flow.ingest.validators.checks.column_out_of_range import check_column_out_of_range
+from daily_flow.ingest.validators.common import ValidationResult
+from daily_flow.ingest.validators.engine import _base_validator
+from daily_flow.ingest.validators.mood_log.checks.columns_moods_missing import (
+    check_columns_moods_missing,
+)
+from daily_flow.ingest.validators.mood_log.checks.columns_moods_mostly_missing import (
+    check_columns_moods_mostly_missing,
+)
+from daily_flow.ingest.validators.mood_log.checks.columns_only_sleep_filled import (
+    check_columns_only_sleep_filled,
+)
+from daily_flow.ingest.validators.mood_log.definitions import MoodLogValidationErrors
+from daily_flow.ingest.validators.mood_log.metrics import get_mood_log_metrics
+from daily_flow.ingest.validators.mood_log.validator import validate_mood_log
+
+# Reference: per-check validator as it was before the compiled plan
+
+
+def validate_mood_log_per_check(df: pd.DataFrame, contract: MoodLogIngestContract):
+    mood_columns = list(contract.mood_columns)
+    common_checks = [
+        partial(check_column_has_any_na, df, "day", MoodLogValidationErrors.MISSING_DAY),
+        partial(check_column_has_any_duplicates, df, "day", MoodLogValidationErrors.DAY_DUPLICATE),
+        partial(
+            check_column_out_of_range,
+            df,
+            mood_columns,
+            MoodLogValidationErrors.MOOD_IS_OUT_OF_RANGE,
+            1,
+            4,
+        ),
+        partial(
+            check_column_is_integer, df, mood_columns, MoodLogValidationErrors.MOOD_IS_ONLY_INT
+        ),
+    ]
+
+    def metrics_call(_df, _errs, _warns, _metrics):
+        # до плану rows_with_any_mood рахувався окремим проходом
+        metrics = get_mood_log_metrics(_df, _errs, _warns, contract, _metrics)
+        if len(_df):
+            metrics["rows_with_any_mood"] = int(_df[mood_columns].notna().any(axis=1).sum())
+        return metrics
+
+    return _base_validator(
+        df=df,
+        contract=contract,
+        checks=common_checks,
+        metrics_func=metrics_call,
+        error_codes_class=MoodLogValidationErrors,
+        extra_error_checks=[partial(check_columns_moods_missing, df, contract)],
+        extra_warning_checks=[
+            partial(check_columns_moods_mostly_missing, df, contract, 0.5),
+            partial(check_columns_only_sleep_filled, df, contract),
+        ],
+    )
+
+
+def _same_result(left: ValidationResult, right: ValidationResult) -> bool:
+    # per-check маски мають nullable "boolean" dtype від Float64, план дає звичайний bool
+    return (
+        left.ok == right.ok
+        and left.issues == right.issues
+        and left.bad_row_mask.astype(bool).equals(right.bad_row_mask)
+        and left.warnings_row_mask.astype(bool).equals(right.warnings_row_mask)
+        and left.metrics == right.metrics
+    )
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    contract = MOOD_LOG_INGEST_CONTRACT
+
+    for n_rows in args.rows:
+        df = make_normalized_mood_log(n_rows, contract)
+
+        reference, reference_time = _timed(args.repeat, validate_mood_log_per_check, df, contract)
+        result, plan_time = _timed(args.repeat, validate_mood_log, df, contract)
+
+        print(
+            f"rows={n_rows} issues={len(result.issues)} "
+            f"per_check={reference_time:.3f}s plan={plan_time:.3f}s "
+            f"speedup={reference_time / plan_time:.1f}x "
+            f"same_result={_same_result(reference, result)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -238,6 +238,23 @@ FINETUNE_PARAMS = {
     },
 }
 
+# Features of the final CatBoost model (notebook 05, section 10)
+BEST_FEATURES = [
+    "target_final_lag_1",
+    "joy_delta_1d",
+    "interest_delta_5d",
+    "fatigue_lag_2",
+    "joy_x_irritation_lag_4",
+    "mood_volatility_7d",
+]
+
+CATBOOST_FIXED_PARAMS = {
+    "bootstrap_type": "Bernoulli",
+    "random_seed": 42,
+    "verbose": 0,
+    "allow_writing_files": False,
+}
+
 # FINETUNE_PARAMS_DEFAULT = {
 #     'model__ridge__alpha': np.logspace(-2, 3, 10).tolist(),
 # }
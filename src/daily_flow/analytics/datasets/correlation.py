@@ -1,7 +1,7 @@
 import pandas as pd
 
 from daily_flow.analytics.datasets.constants import DatasetPeriod
-from daily_flow.analytics.datasets.pipeline import prepare_temporal_data
+from daily_flow.analytics.datasets.pipeline import prepare_excluded_targets, prepare_temporal_data
 from daily_flow.analytics.datasets.schema import MOOD_COLUMNS
 from daily_flow.analytics.datasets.time_series import analyze_temporal_memory
 
@@ -22,9 +22,14 @@ def get_clean_cross_corr(dfs: dict, target_type: str = "real", max_window: int =
     )
     target_col = "common_mood_log" if target_type == "real" else "target_final"
 
+    df_base = prepare_temporal_data(dfs, periods)
+    # Targets WITHOUT each emotion (same as exclude_cols=[emotion]), built in one pass
+    targets = prepare_excluded_targets(df_base, MOOD_COLUMNS)
+
     for emotion in MOOD_COLUMNS:
-        # Prepare the target WITHOUT the current emotion (exclude_cols)
-        df_clean = prepare_temporal_data(dfs, periods, exclude_cols=[emotion])
+        df_clean = df_base.copy()
+        if target_col == "target_final":
+            df_clean[target_col] = targets[emotion]
 
         # Remove empty values for correct calculation
         df_clean = df_clean.dropna(subset=[target_col])
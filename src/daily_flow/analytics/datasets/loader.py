@@ -1,46 +1,116 @@
 import asyncio
+import sqlite3
+from pathlib import Path
 
-import nest_asyncio
 import pandas as pd
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateTable
 
 from daily_flow.analytics.datasets.clean import clean_mood_mart
-from daily_flow.analytics.datasets.mood_mart_sql import MART_QUERY
-from daily_flow.analytics.datasets.schema import apply_schema
+from daily_flow.analytics.datasets.mood_mart_sql import (
+    MART_DELTA_QUERY,
+    MART_QUERY,
+    SOURCE_STATS_QUERY,
+    WATERMARK_SELECT_QUERY,
+    WATERMARK_UPSERT_QUERY,
+)
+from daily_flow.analytics.datasets.reader import analytics_connection, read_mood_mart_frame
+from daily_flow.analytics.datasets.snapshot import (
+    MOOD_MART_SNAPSHOT_VERSION,
+    get_snapshot_path,
+    merge_snapshot,
+    read_snapshot,
+    write_snapshot,
+)
 from daily_flow.config.db import load_db_settings
-from daily_flow.db.engine import build_engine
+from daily_flow.db.schema import mood_mart_watermark
 
+_WATERMARK_DDL = str(
+    CreateTable(mood_mart_watermark, if_not_exists=True).compile(dialect=sqlite.dialect())
+)
 
-async def _load_mood_mart_df(engine: AsyncEngine) -> pd.DataFrame:
-    async with engine.connect() as conn:
-        result = await conn.execute(text(MART_QUERY))
-        rows = result.fetchall()
-        columns = list(result.keys())
 
-    df = pd.DataFrame(rows, columns=columns)
-
-    df = apply_schema(df)
+def to_mood_mart_df(df: pd.DataFrame) -> pd.DataFrame:
     df = clean_mood_mart(df)
 
     df = df.sort_values("day")
     df = df.set_index("day")
 
+    return df
+
+
+def _load_mood_mart_df(conn: sqlite3.Connection) -> pd.DataFrame:
+    df = read_mood_mart_frame(conn, MART_QUERY)
+
+    return to_mood_mart_df(df).copy()
+
+
+def _load_mood_mart_incremental_df(conn: sqlite3.Connection, snapshot_path: Path) -> pd.DataFrame:
+    with conn:
+        conn.execute(_WATERMARK_DDL)
+
+    conn.row_factory = sqlite3.Row
+    try:
+        watermark = conn.execute(
+            WATERMARK_SELECT_QUERY, {"snapshot_path": str(snapshot_path)}
+        ).fetchone()
+
+        since = watermark["max_updated_at"] if watermark else None
+        stats = conn.execute(SOURCE_STATS_QUERY, {"since": since or ""}).fetchone()
+    finally:
+        conn.row_factory = None
+
+    snapshot = None
+    if watermark and watermark["snapshot_version"] == MOOD_MART_SNAPSHOT_VERSION:
+        snapshot = read_snapshot(snapshot_path)
+
+    # правки днів видно з updated_at, а видалення — лише з кількості рядків:
+    # якщо вона не сходиться, перебудовуємо повністю
+    is_consistent = (
+        watermark is not None
+        and since is not None
+        and stats["mood_log_rows"] == watermark["mood_log_rows"] + stats["mood_log_new_rows"]
+        and stats["common_mood_log_rows"]
+        == watermark["common_mood_log_rows"] + stats["common_mood_log_new_rows"]
+    )
+
+    if snapshot is None or not is_consistent:
+        df = _load_mood_mart_df(conn)
+    else:
+        raw_delta = read_mood_mart_frame(conn, MART_DELTA_QUERY, {"since": since})
+        touched_days = pd.Index(raw_delta["day"])
+        delta = to_mood_mart_df(raw_delta)
+
+        df = merge_snapshot(snapshot, delta, touched_days)
+
+    write_snapshot(df, snapshot_path)
+
+    max_day = df.index.max() if len(df) else None
+    with conn:
+        conn.execute(
+            WATERMARK_UPSERT_QUERY,
+            {
+                "snapshot_path": str(snapshot_path),
+                "snapshot_version": MOOD_MART_SNAPSHOT_VERSION,
+                "max_updated_at": stats["max_updated_at"],
+                "max_day": max_day.date().isoformat() if max_day is not None else None,
+                "mood_log_rows": stats["mood_log_rows"],
+                "common_mood_log_rows": stats["common_mood_log_rows"],
+            },
+        )
+
     return df.copy()
 
 
-async def _load_mood_mart_async():
+def load_mood_mart_sync(incremental: bool = False):
     settings = load_db_settings()
 
-    engine = await build_engine(database_url=settings.db_url, is_database_echo=settings.is_sql_echo)
-
-    return await _load_mood_mart_df(engine)
-
+    with analytics_connection(settings.db_url) as conn:
+        if incremental:
+            return _load_mood_mart_incremental_df(conn, get_snapshot_path(settings.db_url))
 
-async def load_mood_mart():
-    return await _load_mood_mart_async()
+        return _load_mood_mart_df(conn)
 
 
-def load_mood_mart_sync():
-    nest_asyncio.apply()
-    return asyncio.run(load_mood_mart())
+async def load_mood_mart(incremental: bool = False):
+    return await asyncio.to_thread(load_mood_mart_sync, incremental)
@@ -1,4 +1,4 @@
-MART_QUERY = """
+_MART_SELECT = """
 SELECT
     COALESCE(mood_log.day, cml.day) AS day,
     cml.mood AS common_mood_log,
@@ -7,5 +7,72 @@ SELECT
     sadness, irritation, fatigue, fear, 
     confidence, sleep
 FROM main.mood_log
-FULL OUTER JOIN main.common_mood_log cml ON main.mood_log.day = cml.day;
+FULL OUTER JOIN main.common_mood_log cml ON main.mood_log.day = cml.day"""
+
+MART_QUERY = f"{_MART_SELECT};"
+
+# Days written since the last snapshot build (inserts and upserts both bump updated_at).
+# >= re-reads the rows of the watermark second: CURRENT_TIMESTAMP has a 1s resolution
+MART_DELTA_QUERY = f"""{_MART_SELECT}
+WHERE mood_log.updated_at >= :since
+   OR cml.updated_at >= :since;
+"""
+
+# Trailing slice of the mart used as the recompute window of the feature store
+MART_RANGE_QUERY = f"""{_MART_SELECT}
+WHERE COALESCE(mood_log.day, cml.day) >= :from_day;
+"""
+
+SOURCE_STATS_QUERY = """
+SELECT
+    (SELECT COUNT(*) FROM main.mood_log) AS mood_log_rows,
+    (SELECT COUNT(*) FROM main.mood_log WHERE created_at > :since) AS mood_log_new_rows,
+    (SELECT COUNT(*) FROM main.common_mood_log) AS common_mood_log_rows,
+    (SELECT COUNT(*) FROM main.common_mood_log WHERE created_at > :since)
+        AS common_mood_log_new_rows,
+    (
+        SELECT MAX(updated_at) FROM (
+            SELECT MAX(updated_at) AS updated_at FROM main.mood_log
+            UNION ALL
+            SELECT MAX(updated_at) AS updated_at FROM main.common_mood_log
+        )
+    ) AS max_updated_at;
+"""
+
+WATERMARK_SELECT_QUERY = """
+SELECT snapshot_version, max_updated_at, max_day, mood_log_rows, common_mood_log_rows
+FROM main.mood_mart_watermark
+WHERE snapshot_path = :snapshot_path;
+"""
+
+WATERMARK_UPSERT_QUERY = """
+INSERT INTO main.mood_mart_watermark (
+    snapshot_path, snapshot_version, max_updated_at, max_day, mood_log_rows, common_mood_log_rows
+)
+VALUES (
+    :snapshot_path,
+    :snapshot_version,
+    :max_updated_at,
+    :max_day,
+    :mood_log_rows,
+    :common_mood_log_rows
+)
+ON CONFLICT (snapshot_path) DO UPDATE SET
+    snapshot_version = excluded.snapshot_version,
+    max_updated_at = excluded.max_updated_at,
+    max_day = excluded.max_day,
+    mood_log_rows = excluded.mood_log_rows,
+    common_mood_log_rows = excluded.common_mood_log_rows,
+    built_at = CURRENT_TIMESTAMP;
+"""
+
+FEATURE_STORE_INVALIDATION_SELECT_QUERY = """
+SELECT day, revision
+FROM main.feature_store_invalidation
+ORDER BY day;
+"""
+
+FEATURE_STORE_INVALIDATION_DELETE_QUERY = """
+DELETE FROM main.feature_store_invalidation
+WHERE day = :day AND revision = :revision;
 """
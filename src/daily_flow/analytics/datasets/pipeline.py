@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from scipy.stats import pearsonr
 
@@ -30,7 +31,7 @@ def prepare_temporal_data(
         c for c in bad_mood_columns if c not in exclude_cols and c not in factors_to_exclude
     ]
 
-    if df_to_process["target_modeled"].notna().any():
+    if "target_modeled" in df_to_process and df_to_process["target_modeled"].notna().any():
         df_to_process["target_final"] = (
             df_to_process["common_mood_log"].astype(float).fillna(df_to_process["target_modeled"])
         )
@@ -47,6 +48,67 @@ def prepare_temporal_data(
     return df_to_process
 
 
+def prepare_excluded_targets(
+    df_to_process: pd.DataFrame,
+    exclude_cols: list[str],
+    target_col: str = "target_final",
+    factors_to_exclude=None,
+    mood_columns=MOOD_COLUMNS,
+    bad_mood_columns=BAD_MOOD_COLUMNS,
+) -> pd.DataFrame:
+    """
+    target_col ("target_final" or "total_mood_synthetic") for every column of exclude_cols,
+    as prepare_temporal_data(exclude_cols=col) would build it, but in one pass:
+    the excluded column is subtracted from the row mean instead of re-preparing the frame.
+    """
+    if factors_to_exclude is None:
+        factors_to_exclude = FACTORS
+
+    common_mood_log = df_to_process["common_mood_log"].to_numpy(dtype=float, na_value=np.nan)
+
+    has_target_modeled = (
+        "target_modeled" in df_to_process and df_to_process["target_modeled"].notna().any()
+    )
+    if target_col == "target_final" and has_target_modeled:
+        target_modeled = df_to_process["target_modeled"].to_numpy(dtype=float, na_value=np.nan)
+        target = np.where(np.isnan(common_mood_log), target_modeled, common_mood_log)
+        return pd.DataFrame(
+            np.repeat(target[:, None], len(exclude_cols), axis=1),
+            index=df_to_process.index,
+            columns=exclude_cols,
+        )
+
+    mood_cols = [c for c in mood_columns if c not in factors_to_exclude]
+
+    # ті самі перетворення, що й у calculate_synthetic_mood
+    scaled = df_to_process[mood_cols].to_numpy(dtype=float, na_value=np.nan)
+    is_bad = np.isin(mood_cols, bad_mood_columns)
+    scaled[:, is_bad] = 5 - scaled[:, is_bad]
+    scaled = (scaled - 1) / 3
+
+    is_valid = ~np.isnan(scaled)
+    row_sums = np.where(is_valid, scaled, 0.0).sum(axis=1)
+    row_counts = is_valid.sum(axis=1)
+
+    excluded = np.zeros((len(df_to_process), len(exclude_cols)))
+    excluded_counts = np.zeros((len(df_to_process), len(exclude_cols)), dtype=int)
+    for i, col in enumerate(exclude_cols):
+        if col in mood_cols:
+            j = mood_cols.index(col)
+            excluded[:, i] = np.where(is_valid[:, j], scaled[:, j], 0.0)
+            excluded_counts[:, i] = is_valid[:, j]
+
+    counts = row_counts[:, None] - excluded_counts
+    with np.errstate(invalid="ignore", divide="ignore"):
+        synthetic = np.where(counts > 0, (row_sums[:, None] - excluded) / counts, np.nan) * 6 + 1
+
+    if target_col != "total_mood_synthetic":
+        is_missing = np.isnan(common_mood_log)[:, None]
+        synthetic = np.where(is_missing, synthetic, common_mood_log[:, None])
+
+    return pd.DataFrame(synthetic, index=df_to_process.index, columns=exclude_cols)
+
+
 def validate_synthetic_logic(dfs: dict, target_period) -> pd.DataFrame:
     results = []
     df_full = dfs[target_period].copy()
@@ -0,0 +1,76 @@
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+import pandas as pd
+from sqlalchemy.engine import make_url
+
+from daily_flow.analytics.datasets.schema import DTYPES
+from daily_flow.db.engine import apply_sqlite_pragmas, get_sqlite_profile
+
+logger = logging.getLogger(__name__)
+
+_connections: dict[str, sqlite3.Connection] = {}
+_connections_lock = threading.RLock()
+
+
+def get_sqlite_path(db_url: str) -> str:
+    url = make_url(db_url)
+
+    if not url.get_backend_name() == "sqlite":
+        raise ValueError(f"Analytics reader supports only SQLite databases, got {db_url}")
+
+    return url.database or ":memory:"
+
+
+def get_analytics_connection(db_url: str) -> sqlite3.Connection:
+    db_path = get_sqlite_path(db_url)
+
+    with _connections_lock:
+        conn = _connections.get(db_path)
+
+        if conn is None:
+            profile = get_sqlite_profile("analytics")
+            conn = sqlite3.connect(
+                db_path, check_same_thread=False, cached_statements=profile.cached_statements
+            )
+            apply_sqlite_pragmas(conn, profile)
+            _connections[db_path] = conn
+
+    return conn
+
+
+@contextmanager
+def analytics_connection(db_url: str) -> Iterator[sqlite3.Connection]:
+    # одне кешоване зʼєднання на файл, тому доступ до нього серіалізуємо
+    conn = get_analytics_connection(db_url)
+
+    with _connections_lock:
+        yield conn
+
+
+def close_analytics_connections() -> None:
+    with _connections_lock:
+        for conn in _connections.values():
+            # як і dispose_engine: збій optimize на виході не має лишати зʼєднання відкритим
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning("PRAGMA optimize failed on shutdown: %s", e)
+            conn.close()
+        _connections.clear()
+
+
+def read_mood_mart_frame(
+    conn: sqlite3.Connection, query: str, params: Mapping[str, Any] | None = None
+) -> pd.DataFrame:
+    return pd.read_sql_query(
+        query,
+        conn,
+        params=params,
+        dtype=DTYPES,
+        parse_dates={"day": {"errors": "coerce"}},
+    )
@@ -52,8 +52,8 @@ def slice_periods(df, periods):
     return {name: df.loc[start:end].copy() for name, (start, end) in periods.items()}
 
 
-def get_clean_segmented_data():
-    raw_df = load_mood_mart_sync()
+def get_clean_segmented_data(incremental: bool = False):
+    raw_df = load_mood_mart_sync(incremental=incremental)
     initial_df = prepare_public_mood_df(raw_df)
 
     df, _ = segment_df(initial_df)
@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy.engine import make_url
+
+from daily_flow.config.paths import DATA_DIR
+
+MOOD_MART_SNAPSHOT_VERSION = 1
+MOOD_MART_SNAPSHOT_SUFFIX = "_mood_mart.parquet"
+
+
+def get_snapshot_path(db_url: str, suffix: str = MOOD_MART_SNAPSHOT_SUFFIX) -> Path:
+    database = make_url(db_url).database
+
+    if not database or database == ":memory:":
+        return DATA_DIR / f"app{suffix}"
+
+    db_path = Path(database)
+    return db_path.with_name(f"{db_path.stem}{suffix}")
+
+
+def read_snapshot(path: Path) -> pd.DataFrame | None:
+    if not path.exists():
+        return None
+
+    return pd.read_parquet(path)
+
+
+def write_snapshot(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # пишемо в тимчасовий файл, щоб не залишити напівзаписаний snapshot
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def merge_snapshot(
+    snapshot: pd.DataFrame, delta: pd.DataFrame, touched_days: pd.Index
+) -> pd.DataFrame:
+    # дні з дельти повністю замінюють старі (включно з днями, які після чистки стали порожніми)
+    kept = snapshot[~snapshot.index.isin(touched_days)]
+
+    merged = pd.concat([kept, delta]) if len(delta) else kept
+    return merged.sort_index()
@@ -1,10 +1,10 @@
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import fft, stats
 from statsmodels.tsa.stattools import acf, ccf, pacf
 
-from daily_flow.analytics.datasets.pipeline import prepare_temporal_data
-from daily_flow.analytics.datasets.schema import MOOD_COLUMNS
+from daily_flow.analytics.datasets.pipeline import prepare_excluded_targets, prepare_temporal_data
+from daily_flow.analytics.features import ewm_mean, lag_array
 
 
 def get_temporal_stats(series, nlags=30):
@@ -47,33 +47,118 @@ def get_significant_ccf(
     return corr_values, pd.DataFrame(significant_data), conf_level
 
 
-def calculate_feature_lags_matrix(
-    dfs: dict, features: list, periods: list, max_lag: int = 15, target_col: str = "target_final"
-) -> (pd.DataFrame, float):
-    matrix_data = []
-    thresholds = []
+def batched_ccf(targets: np.ndarray, features: np.ndarray, nlags: int) -> (np.ndarray, np.ndarray):
+    """
+    Column-wise equivalent of get_significant_ccf: for every column j it correlates
+    targets[:, j] (NaN rows dropped) with features[:, j] (NaN filled with its median).
+    Returns (n_columns, nlags) correlations and the number of observations per column.
+    """
+    is_valid = ~np.isnan(targets)
+    n_obs = is_valid.sum(axis=0)
+
+    # стискаємо валідні рядки кожної колонки догори, решту заповнюємо нулями після центрування
+    order = np.argsort(~is_valid, axis=0, kind="stable")
+    in_range = np.arange(len(targets))[:, None] < n_obs
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        medians = np.nanmedian(features, axis=0)
+        filled = np.where(np.isnan(features), medians, features)
+
+        m = np.take_along_axis(targets, order, axis=0)
+        s = np.take_along_axis(filled, order, axis=0)
+
+        m = np.where(in_range, m - np.where(in_range, m, 0.0).sum(axis=0) / n_obs, 0.0)
+        s = np.where(in_range, s - np.where(in_range, s, 0.0).sum(axis=0) / n_obs, 0.0)
+
+        n_fft = fft.next_fast_len(2 * len(targets) - 1, real=True)
+        cross = fft.irfft(
+            fft.rfft(m, n_fft, axis=0) * np.conj(fft.rfft(s, n_fft, axis=0)), n_fft, axis=0
+        )[:nlags]
 
-    for feature in features:
-        df_clean = prepare_temporal_data(
-            dfs, periods, exclude_cols=feature if feature in MOOD_COLUMNS else None
-        )
+        std_m = np.sqrt((m**2).sum(axis=0) / n_obs)
+        std_s = np.sqrt((s**2).sum(axis=0) / n_obs)
+        corr = cross / n_obs / (std_m * std_s)
 
-        corr_values, _, conf_level = get_significant_ccf(
-            df_clean[target_col], df_clean[feature], nlags=max_lag + 1
-        )
+    return corr.T, n_obs
 
-        matrix_data.append(corr_values)
-        thresholds.append(conf_level)
+
+def calculate_feature_lags_matrix(
+    dfs: dict, features: list, periods: list, max_lag: int = 15, target_col: str = "target_final"
+) -> (pd.DataFrame, float):
+    df_clean = prepare_temporal_data(dfs, periods)
+
+    if target_col in ("target_final", "total_mood_synthetic"):
+        # для емоцій таргет рахується без них самих, як з exclude_cols=feature
+        targets = prepare_excluded_targets(df_clean, list(features), target_col=target_col)
+    else:
+        targets = pd.DataFrame({feature: df_clean[target_col] for feature in features})
+
+    corr_values, n_obs = batched_ccf(
+        targets[features].to_numpy(dtype=float, na_value=np.nan),
+        df_clean[features].to_numpy(dtype=float, na_value=np.nan),
+        nlags=max_lag + 1,
+    )
 
     ccf_df = pd.DataFrame(
-        matrix_data, index=features, columns=[f"Lag {i}" for i in range(max_lag + 1)]
+        corr_values, index=features, columns=[f"Lag {i}" for i in range(max_lag + 1)]
     )
 
-    avg_conf = np.mean(thresholds)
+    with np.errstate(divide="ignore"):
+        thresholds = np.where(n_obs > 0, 1.96 / np.sqrt(n_obs), np.nan)
+    avg_conf = np.nanmean(thresholds)
 
     return ccf_df, avg_conf
 
 
+def rolling_means(series: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    # усі вікна одразу: (n, len(windows)), як rolling(w).mean() для кожного w
+    is_nan = np.isnan(series)
+    sums = np.concatenate([[0.0], np.cumsum(np.where(is_nan, 0.0, series))])
+    nans = np.concatenate([[0], np.cumsum(is_nan)])
+
+    ends = np.arange(1, len(series) + 1)[:, None]
+    starts = ends - windows[None, :]
+    in_range = starts >= 0
+    starts = np.maximum(starts, 0)
+
+    window_sums = sums[ends] - sums[starts]
+    window_nans = nans[ends] - nans[starts]
+
+    return np.where(in_range & (window_nans == 0), window_sums / windows, np.nan)
+
+
+def correlate_with_target(
+    values: np.ndarray, target: np.ndarray, correlation_method: str = "pearson"
+) -> (np.ndarray, np.ndarray, np.ndarray):
+    """
+    Correlation of every column of values with target on pairwise non-NaN rows.
+    Spearman is Pearson over ranks taken within each column's own mask.
+    Returns (correlations, p_values, n_obs) per column.
+    """
+    mask = ~np.isnan(values) & ~np.isnan(target)[:, None]
+    n_obs = mask.sum(axis=0)
+
+    x = np.where(mask, values, np.nan)
+    y = np.where(mask, target[:, None], np.nan)
+
+    if correlation_method == "spearman":
+        x = stats.rankdata(x, axis=0, nan_policy="omit")
+        y = stats.rankdata(y, axis=0, nan_policy="omit")
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dx = np.where(mask, x - np.where(mask, x, 0.0).sum(axis=0) / n_obs, 0.0)
+        dy = np.where(mask, y - np.where(mask, y, 0.0).sum(axis=0) / n_obs, 0.0)
+
+        r = (dx * dy).sum(axis=0) / np.sqrt((dx**2).sum(axis=0) * (dy**2).sum(axis=0))
+        r = np.clip(r, -1.0, 1.0)
+
+        dof = n_obs - 2
+        t_stat = np.abs(r) * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+        p_values = 2 * stats.t.sf(t_stat, dof)
+
+    return r, p_values, n_obs
+
+
 def analyze_temporal_memory(
     df: pd.DataFrame,
     feature_name: str,
@@ -85,44 +170,37 @@ def analyze_temporal_memory(
     Analyzes how past feature values (lags and averages) correlate with the target.
     Helps determine the "depth of memory" of an emotional state.
     """
-    analysis_df = df.copy()
-    temporal_results = []
-
-    shifted_series = analysis_df[feature_name].shift(1)
+    shifted_series = lag_array(df[feature_name].to_numpy(dtype=float, na_value=np.nan), 1)
+    windows = np.arange(1, max_window + 1)
 
     # analysis_df[f'{feature_name}_lag_1'] = shifted_series
 
-    for w in range(1, max_window + 1):
-        analysis_df[f"{feature_name}_sma_{w}d"] = shifted_series.rolling(window=w).mean()
-        analysis_df[f"{feature_name}_ewm_{w}"] = shifted_series.ewm(span=w).mean()
+    sma = rolling_means(shifted_series, windows)
+    ewm = np.column_stack([ewm_mean(shifted_series, w) for w in windows])
 
-    temporal_cols = [
-        c for c in analysis_df.columns if any(x in c for x in ["_lag_", "_sma_", "_ewm_"])
+    existing_cols = [c for c in df.columns if any(x in c for x in ["_lag_", "_sma_", "_ewm_"])]
+    window_cols = [
+        col for w in windows for col in (f"{feature_name}_sma_{w}d", f"{feature_name}_ewm_{w}")
     ]
 
-    for col in temporal_cols:
-        mask = analysis_df[col].notna() & analysis_df[target_name].notna()
-
-        if mask.sum() > 5:
-            if correlation_method == "spearman":
-                r, p = stats.spearmanr(
-                    analysis_df.loc[mask, col], analysis_df.loc[mask, target_name]
-                )
-            else:
-                r, p = stats.pearsonr(
-                    analysis_df.loc[mask, col], analysis_df.loc[mask, target_name]
-                )
-
-            temporal_results.append(
-                {
-                    "feature": col,
-                    "correlation": r,
-                    "p_value": p,
-                    # 'n_obs': mask.sum()
-                }
-            )
-
-    results_df = pd.DataFrame(temporal_results).set_index("feature")
+    values = np.column_stack(
+        [
+            df[existing_cols].to_numpy(dtype=float, na_value=np.nan),
+            np.stack([sma, ewm], axis=-1).reshape(len(df), -1),
+        ]
+    )
+    target = df[target_name].to_numpy(dtype=float, na_value=np.nan)
+
+    r, p, n_obs = correlate_with_target(values, target, correlation_method=correlation_method)
+    has_enough = n_obs > 5
+
+    results_df = pd.DataFrame(
+        {
+            "feature": np.array([*existing_cols, *window_cols])[has_enough],
+            "correlation": r[has_enough],
+            "p_value": p[has_enough],
+        }
+    ).set_index("feature")
     results_df["is_significant"] = results_df["p_value"] < 0.05
 
     return results_df.sort_values(by="correlation", ascending=False)
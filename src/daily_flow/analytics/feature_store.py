@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateTable
+
+from daily_flow.analytics.datasets.loader import to_mood_mart_df
+from daily_flow.analytics.datasets.mood_mart_sql import (
+    FEATURE_STORE_INVALIDATION_DELETE_QUERY,
+    FEATURE_STORE_INVALIDATION_SELECT_QUERY,
+    MART_QUERY,
+    MART_RANGE_QUERY,
+)
+from daily_flow.analytics.datasets.pipeline import prepare_temporal_data
+from daily_flow.analytics.datasets.reader import analytics_connection, read_mood_mart_frame
+from daily_flow.analytics.datasets.snapshot import get_snapshot_path, read_snapshot, write_snapshot
+from daily_flow.analytics.features import TARGET_COL, FeatureSpec, build_feature_matrix
+from daily_flow.config.db import load_db_settings
+from daily_flow.db.schema import feature_store_invalidation
+
+logger = logging.getLogger(__name__)
+
+FEATURE_STORE_VERSION = 1
+FEATURE_STORE_SUFFIX = f"_feature_store_v{FEATURE_STORE_VERSION}.parquet"
+
+# EWM памʼятає всю історію, але через 128 рядків вага старших значень < 1e-13,
+# тому цього розігріву досить, щоб інкремент збігався з повним перерахунком у float32
+FEATURE_STORE_WARMUP_ROWS = 128
+
+# 1.0 для днів з марту, 0.0 для рядка "завтра" (ознаки без таргету, для прогнозу)
+OBSERVED_COL = "is_observed"
+
+_INVALIDATION_DDL = str(
+    CreateTable(feature_store_invalidation, if_not_exists=True).compile(dialect=sqlite.dialect())
+)
+
+
+@dataclass(frozen=True)
+class FeatureStoreRefresh:
+    rows_total: int
+    rows_recomputed: int
+    days_invalidated: int
+    is_full_rebuild: bool
+    seconds: float
+
+
+def get_feature_store_path(db_url: str) -> Path:
+    return get_snapshot_path(db_url, suffix=FEATURE_STORE_SUFFIX)
+
+
+def build_store_frame(mart: pd.DataFrame, spec: FeatureSpec | None = None) -> pd.DataFrame:
+    """
+    Feature rows for every mart day plus one row for the day after the last one:
+    its features use only the past, so it is the ready input for tomorrow's forecast.
+    """
+    df = prepare_temporal_data({"store": mart}, ["store"])
+
+    next_day = df.index.max() + pd.Timedelta(days=1)
+    df = df.reindex(df.index.append(pd.DatetimeIndex([next_day], name=df.index.name)))
+
+    store = build_feature_matrix(df, spec).to_frame()
+    store[TARGET_COL] = df[TARGET_COL].to_numpy(dtype=np.float32, na_value=np.nan)
+    store[OBSERVED_COL] = np.float32(1.0)
+    store.iloc[-1, store.columns.get_loc(OBSERVED_COL)] = 0.0
+
+    return store
+
+
+def _read_invalidations(conn: sqlite3.Connection) -> list[tuple[str, int]]:
+    with conn:
+        conn.execute(_INVALIDATION_DDL)
+
+    return conn.execute(FEATURE_STORE_INVALIDATION_SELECT_QUERY).fetchall()
+
+
+def _get_recompute_start(store: pd.DataFrame, min_day: pd.Timestamp) -> pd.Timestamp | None:
+    observed_days = store.index[store[OBSERVED_COL] == 1.0]
+
+    start_pos = observed_days.searchsorted(min_day) - FEATURE_STORE_WARMUP_ROWS
+    if start_pos <= 0:
+        return None
+
+    return observed_days[start_pos]
+
+
+def refresh_feature_store_sync(db_url: str | None = None) -> FeatureStoreRefresh:
+    """
+    Brings the feature store up to date. Days invalidated by mood_log/common_mood_log writes
+    are recomputed from the earliest of them onwards (features only look back), with
+    FEATURE_STORE_WARMUP_ROWS rows of history in front; everything older is reused.
+    """
+    started = time.perf_counter()
+    db_url = db_url or load_db_settings().db_url
+    store_path = get_feature_store_path(db_url)
+
+    with analytics_connection(db_url) as conn:
+        invalidations = _read_invalidations(conn)
+
+        if store_path.exists() and not invalidations:
+            return FeatureStoreRefresh(
+                rows_total=pq.read_metadata(store_path).num_rows,
+                rows_recomputed=0,
+                days_invalidated=0,
+                is_full_rebuild=False,
+                seconds=time.perf_counter() - started,
+            )
+
+        store = read_snapshot(store_path)
+        min_day = pd.Timestamp(invalidations[0][0]) if invalidations else None
+        start_day = None
+        if store is not None and min_day is not None:
+            start_day = _get_recompute_start(store, min_day)
+
+        if start_day is None:
+            mart = to_mood_mart_df(read_mood_mart_frame(conn, MART_QUERY))
+        else:
+            raw = read_mood_mart_frame(conn, MART_RANGE_QUERY, {"from_day": str(start_day.date())})
+            mart = to_mood_mart_df(raw)
+
+        if mart.empty:
+            # немає даних: лишаємо інвалідації, щоб зібрати сховище після першого запису
+            return FeatureStoreRefresh(
+                rows_total=0,
+                rows_recomputed=0,
+                days_invalidated=len(invalidations),
+                is_full_rebuild=True,
+                seconds=time.perf_counter() - started,
+            )
+
+        recomputed = build_store_frame(mart)
+        if start_day is not None:
+            recomputed = recomputed[recomputed.index >= min_day]
+            kept = store[(store.index < min_day) & (store[OBSERVED_COL] == 1.0)]
+            store = pd.concat([kept, recomputed])
+        else:
+            store = recomputed
+
+        write_snapshot(store, store_path)
+
+        # знімаємо лише ті ревізії, які бачили: паралельний запис дня залишить його брудним
+        with conn:
+            conn.executemany(
+                FEATURE_STORE_INVALIDATION_DELETE_QUERY,
+                [{"day": day, "revision": revision} for day, revision in invalidations],
+            )
+
+    result = FeatureStoreRefresh(
+        rows_total=len(store),
+        rows_recomputed=len(recomputed),
+        days_invalidated=len(invalidations),
+        is_full_rebuild=start_day is None,
+        seconds=time.perf_counter() - started,
+    )
+    logger.info("Feature store refreshed: %s", result)
+    return result
+
+
+def load_feature_store_sync(db_url: str | None = None, refresh: bool = True) -> pd.DataFrame:
+    db_url = db_url or load_db_settings().db_url
+
+    if refresh:
+        refresh_feature_store_sync(db_url)
+
+    store = read_snapshot(get_feature_store_path(db_url))
+    return store if store is not None else pd.DataFrame()
+
+
+async def refresh_feature_store(db_url: str | None = None) -> FeatureStoreRefresh:
+    return await asyncio.to_thread(refresh_feature_store_sync, db_url)
+
+
+async def load_feature_store(db_url: str | None = None, refresh: bool = True) -> pd.DataFrame:
+    return await asyncio.to_thread(load_feature_store_sync, db_url, refresh)
@@ -0,0 +1,237 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
+from daily_flow.analytics.datasets.schema import (
+    BAD_MOOD_COLUMNS,
+    GOOD_MOOD_COLUMNS,
+    MOOD_COLUMNS,
+)
+
+DEFAULT_WINDOWS = (2, 3, 4, 5, 6, 7, 8)
+TARGET_COL = "target_final"
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    lags: tuple[int, ...] = (1, 2, 3, 4, 5, 6, 7)
+    sma_windows: tuple[int, ...] = DEFAULT_WINDOWS
+    ewm_spans: tuple[int, ...] = DEFAULT_WINDOWS
+    std_max_window: int = 7
+    delta_max_days: int = 8
+    cross_max_days: int = 8
+    rolling_interaction_windows: tuple[int, ...] = DEFAULT_WINDOWS
+    calendar: bool = True
+    mood_columns: tuple[str, ...] = tuple(MOOD_COLUMNS)
+    good_mood_columns: tuple[str, ...] = tuple(GOOD_MOOD_COLUMNS)
+    bad_mood_columns: tuple[str, ...] = tuple(BAD_MOOD_COLUMNS)
+    target_col: str = TARGET_COL
+
+
+@dataclass(frozen=True)
+class FeatureMatrix:
+    values: np.ndarray
+    columns: list[str]
+    index: pd.Index = field(repr=False)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=self.index, columns=self.columns, copy=False)
+
+
+def lag_array(values: np.ndarray, periods: int) -> np.ndarray:
+    out = np.full(values.shape, np.nan)
+
+    if periods < len(values):
+        out[periods:] = values[: len(values) - periods]
+
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    # як pandas rolling(window).mean(): NaN, якщо у вікні є хоч один пропуск
+    out = np.full(values.shape, np.nan)
+    if window > len(values):
+        return out
+
+    is_nan = np.isnan(values)
+    zeros = np.zeros((1, *values.shape[1:]))
+
+    sums = np.concatenate([zeros, np.cumsum(np.where(is_nan, 0.0, values), axis=0)])
+    nans = np.concatenate([zeros, np.cumsum(is_nan, axis=0)])
+
+    window_sums = sums[window:] - sums[:-window]
+    window_nans = nans[window:] - nans[:-window]
+
+    out[window - 1 :] = np.where(window_nans == 0, window_sums / window, np.nan)
+    return out
+
+
+def rolling_std(values: np.ndarray, window: int, min_periods: int | None = None) -> np.ndarray:
+    # як pandas rolling(window, min_periods).std(): пропуски ігноруються, ddof=1
+    min_periods = window if min_periods is None else max(min_periods, 2)
+
+    padding = np.full((window - 1, *values.shape[1:]), np.nan)
+    windows = sliding_window_view(np.concatenate([padding, values]), window, axis=0)
+
+    is_valid = ~np.isnan(windows)
+    counts = is_valid.sum(axis=-1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(is_valid, windows, 0.0).sum(axis=-1) / counts
+        deviations = np.where(is_valid, windows - means[..., None], 0.0)
+        variances = (deviations**2).sum(axis=-1) / (counts - 1)
+
+    return np.where(counts >= min_periods, np.sqrt(variances), np.nan)
+
+
+def ewm_mean(values: np.ndarray, span: float) -> np.ndarray:
+    # як pandas ewm(span).mean() з adjust=True, ignore_na=False
+    decay = 1.0 - 2.0 / (span + 1.0)
+
+    is_valid = ~np.isnan(values)
+    weighted_sums = lfilter([1.0], [1.0, -decay], np.where(is_valid, values, 0.0), axis=0)
+    weights = lfilter([1.0], [1.0, -decay], is_valid.astype(float), axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = weighted_sums / weights
+
+    # на пропусках pandas тримає останнє значення (навіть коли вага вже згасла до нуля)
+    rows = np.arange(len(values)).reshape(-1, *([1] * (values.ndim - 1)))
+    last_valid = np.maximum.accumulate(np.where(is_valid, rows, -1), axis=0)
+
+    means = np.take_along_axis(means, np.maximum(last_valid, 0), axis=0)
+    return np.where(last_valid >= 0, means, np.nan)
+
+
+def _lag_block(values, columns, lags):
+    block = np.stack([lag_array(values, lag) for lag in lags], axis=-1)
+    names = [f"{col}_lag_{lag}" for col in columns for lag in lags]
+    return names, block
+
+
+def _sma_block(shifted, columns, windows):
+    block = np.stack([rolling_mean(shifted, w) for w in windows], axis=-1)
+    names = [f"{col}_sma_{w}d" for col in columns for w in windows]
+    return names, block
+
+
+def _ewm_block(shifted, columns, spans):
+    block = np.stack([ewm_mean(shifted, s) for s in spans], axis=1)
+    names = [f"{col}_ewm_{s}" for s in spans for col in columns]
+    return names, block
+
+
+def _std_block(shifted, columns, max_window):
+    windows = range(2, max_window + 1)
+    block = np.stack([rolling_std(shifted, w, min_periods=2) for w in windows], axis=-1)
+    names = [f"{col}_std_{w}d" for col in columns for w in windows]
+    return names, np.nan_to_num(block, nan=0.0)
+
+
+def _delta_block(values, columns, max_days):
+    days = range(1, max_days + 1)
+    base = lag_array(values, 1)
+    block = np.stack([base - lag_array(values, d + 1) for d in days], axis=-1)
+    names = [f"{col}_delta_{d}d" for col in columns for d in days]
+    return names, block
+
+
+def _rolling_interaction_block(shifted_good, shifted_bad, spec):
+    windows = spec.rolling_interaction_windows
+
+    blocks = [
+        rolling_mean(shifted_good, w)[:, :, None] * rolling_mean(shifted_bad, w)[:, None, :]
+        for w in windows
+    ]
+    names = [
+        f"{good}_x_{bad}_roll_{w}"
+        for w in windows
+        for good in spec.good_mood_columns
+        for bad in spec.bad_mood_columns
+    ]
+    return names, np.stack(blocks, axis=1)
+
+
+def _cross_interaction_block(good, bad, spec):
+    days = range(1, spec.cross_max_days + 1)
+
+    blocks = []
+    for d in days:
+        good_lag = lag_array(good, d)[:, :, None]
+        bad_lag = lag_array(bad, d)[:, None, :]
+        blocks.append(np.stack([good_lag * bad_lag, good_lag + bad_lag], axis=-1))
+
+    names = [
+        f"{good_col}_{op}_{bad_col}_lag_{d}"
+        for d in days
+        for good_col in spec.good_mood_columns
+        for bad_col in spec.bad_mood_columns
+        for op in ("x", "plus")
+    ]
+    return names, np.stack(blocks, axis=1)
+
+
+def _calendar_block(index, target):
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("Calendar features require a DatetimeIndex")
+
+    days_in_month = 30.5
+    columns = {
+        "is_weekend": index.dayofweek.isin([5, 6]).astype(float),
+        "week_of_year": index.isocalendar().week.to_numpy(dtype=float),
+        "month_day_sin": np.sin(2 * np.pi * index.day.to_numpy() / days_in_month),
+        "month_day_cos": np.cos(2 * np.pi * index.day.to_numpy() / days_in_month),
+    }
+
+    if target is not None:
+        shifted_target = lag_array(target, 1)
+        columns["mood_volatility_7d"] = rolling_std(shifted_target, 7)
+        columns["mood_weekly_context"] = rolling_mean(shifted_target, 7)
+
+    return list(columns), np.column_stack(list(columns.values()))
+
+
+def build_feature_matrix(df: pd.DataFrame, spec: FeatureSpec | None = None) -> FeatureMatrix:
+    spec = spec or FeatureSpec()
+
+    moods = list(dict.fromkeys(spec.mood_columns))
+    has_target = spec.target_col in df.columns
+    series_columns = [*moods, spec.target_col] if has_target else moods
+
+    values = df[series_columns].to_numpy(dtype=float, na_value=np.nan)
+    shifted = lag_array(values, 1)
+    mood_values = values[:, : len(moods)]
+    mood_shifted = shifted[:, : len(moods)]
+
+    good_idx = [moods.index(col) for col in spec.good_mood_columns]
+    bad_idx = [moods.index(col) for col in spec.bad_mood_columns]
+
+    blocks = [
+        _lag_block(values, series_columns, spec.lags),
+        _sma_block(shifted, series_columns, spec.sma_windows),
+        _ewm_block(mood_shifted, moods, spec.ewm_spans),
+        _std_block(shifted, series_columns, spec.std_max_window),
+        _delta_block(mood_values, moods, spec.delta_max_days),
+        _rolling_interaction_block(mood_shifted[:, good_idx], mood_shifted[:, bad_idx], spec),
+        _cross_interaction_block(mood_values[:, good_idx], mood_values[:, bad_idx], spec),
+    ]
+    if spec.calendar:
+        target = values[:, -1] if has_target else None
+        blocks.append(_calendar_block(df.index, target))
+
+    # один суцільний буфер замість покрокового додавання колонок у DataFrame
+    n_features = sum(len(names) for names, _ in blocks)
+    matrix = np.empty((len(df), n_features), dtype=np.float32)
+
+    columns: list[str] = []
+    start = 0
+    for names, block in blocks:
+        stop = start + len(names)
+        matrix[:, start:stop] = block.reshape(len(df), -1)
+        columns.extend(names)
+        start = stop
+
+    return FeatureMatrix(values=matrix, columns=columns, index=df.index)
@@ -0,0 +1,39 @@
+import pandas as pd
+
+from daily_flow.analytics.datasets.constants import BEST_FEATURES, DatasetPeriod
+from daily_flow.analytics.datasets.pipeline import prepare_temporal_data
+from daily_flow.analytics.datasets.segmentation import get_clean_segmented_data
+from daily_flow.analytics.feature_store import OBSERVED_COL, load_feature_store_sync
+from daily_flow.analytics.features import TARGET_COL, build_feature_matrix
+
+TRAINING_PERIODS = [DatasetPeriod.FULL, DatasetPeriod.MOODS_ONLY]
+
+
+def build_training_set(
+    dfs: dict | None = None,
+    periods: list[DatasetPeriod] | None = None,
+    features: list[str] | None = None,
+) -> (pd.DataFrame, pd.Series):
+    if dfs is None:
+        _, dfs = get_clean_segmented_data(incremental=True)
+
+    df = prepare_temporal_data(dfs, periods or TRAINING_PERIODS)
+    features = features or BEST_FEATURES
+
+    X = build_feature_matrix(df).to_frame()[features]
+    data = X.join(df[TARGET_COL]).dropna()
+
+    return data[features], data[TARGET_COL]
+
+
+def build_training_set_from_store(
+    features: list[str] | None = None,
+    start: str | None = None,
+    end: str | None = None,
+) -> (pd.DataFrame, pd.Series):
+    # готова матриця з feature store: без сегментації, лише дні з відомим таргетом
+    store = load_feature_store_sync()
+    features = features or BEST_FEATURES
+
+    data = store.loc[store[OBSERVED_COL] == 1.0, [*features, TARGET_COL]].loc[start:end].dropna()
+    return data[features], data[TARGET_COL]
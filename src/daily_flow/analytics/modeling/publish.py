@@ -0,0 +1,30 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+from catboost import CatBoostRegressor
+
+from daily_flow.analytics.datasets.constants import CATBOOST_FIXED_PARAMS
+from daily_flow.config.paths import DATA_DIR
+
+FORECAST_MODEL_DIR = DATA_DIR / "models"
+FORECAST_MODEL_PATH = FORECAST_MODEL_DIR / "catboost_forecast.cbm"
+
+
+def train_forecast_model(X: pd.DataFrame, y: pd.Series, params: dict) -> CatBoostRegressor:
+    # CBM зберігає лише саму модель; деревам масштаб ознак байдужий, тому без StandardScaler,
+    # а назви колонок X лишаються у feature_names_ і задають порядок ознак при прогнозі
+    model = CatBoostRegressor(**{**CATBOOST_FIXED_PARAMS, **params})
+    model.fit(X, y)
+    return model
+
+
+def publish_forecast_model(model: CatBoostRegressor, path: Path = FORECAST_MODEL_PATH) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # атомарна заміна: сервіс прогнозу підхоплює новий файл за mtime і не бачить напівзаписаного
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    model.save_model(str(tmp_path), format="cbm")
+    os.replace(tmp_path, path)
+
+    return path
@@ -0,0 +1,274 @@
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from catboost import CatBoostRegressor
+from sklearn.base import BaseEstimator, clone
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.model_selection import ParameterGrid, ParameterSampler, TimeSeriesSplit
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from threadpoolctl import threadpool_limits
+
+from daily_flow.analytics.datasets.constants import MODELS_CONFIG
+from daily_flow.config.paths import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+MODEL_SEARCH_CACHE_DIR = DATA_DIR / "model_search"
+MODEL_SEARCH_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SearchConfig:
+    model_name: str
+    params: dict[str, Any]
+    key: str
+
+
+# стан процесу-воркера: дані передаються один раз при старті, а не з кожною задачею
+_worker_state: dict[str, Any] = {}
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def get_feature_set_hash(X: pd.DataFrame, y: pd.Series) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps(list(map(str, X.columns))).encode())
+    hasher.update(pd.util.hash_pandas_object(X, index=True).to_numpy().tobytes())
+    hasher.update(pd.util.hash_pandas_object(y, index=True).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+def get_config_key(
+    model_name: str, params: dict[str, Any], feature_set_hash: str, cv: TimeSeriesSplit
+) -> str:
+    payload = {
+        "version": MODEL_SEARCH_CACHE_VERSION,
+        "model": model_name,
+        "params": params,
+        "features": feature_set_hash,
+        "cv": {"n_splits": cv.n_splits, "test_size": cv.test_size, "gap": cv.gap},
+    }
+    raw = json.dumps(payload, sort_keys=True, default=_to_json)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def iter_search_configs(
+    models_config: dict = MODELS_CONFIG,
+    param_grids: dict | None = None,
+    n_iter: int | None = None,
+    random_state: int = 42,
+):
+    for model_name, config in models_config.items():
+        grid = config["params"] if param_grids is None else param_grids.get(model_name)
+        if grid is None:
+            continue
+
+        total_combos = len(ParameterGrid(grid))
+        if n_iter is not None and total_combos > n_iter:
+            candidates = ParameterSampler(grid, n_iter=n_iter, random_state=random_state)
+        else:
+            candidates = ParameterGrid(grid)
+
+        for params in candidates:
+            yield model_name, params
+
+
+def split_cpu_budget(cpu_budget: int, n_configs: int, max_workers: int | None = None) -> (int, int):
+    n_workers = max(1, min(cpu_budget, n_configs, max_workers or cpu_budget))
+    threads_per_worker = max(1, cpu_budget // n_workers)
+    return n_workers, threads_per_worker
+
+
+def _limit_estimator_threads(pipe: Pipeline, n_threads: int) -> None:
+    all_params = pipe.get_params(deep=True)
+    updates = {}
+
+    for key, value in all_params.items():
+        if isinstance(value, CatBoostRegressor):
+            updates[f"{key}__thread_count"] = n_threads
+        elif key.endswith("n_jobs"):
+            owner = all_params.get(key.removesuffix("__n_jobs"))
+            # ансамблі (VotingRegressor) паралелять процесами, тому їм лише 1
+            is_meta = isinstance(owner, BaseEstimator) and "estimators" in owner.get_params(False)
+            updates[key] = 1 if is_meta else n_threads
+
+    pipe.set_params(**updates)
+
+
+def _init_worker(X: np.ndarray, y: np.ndarray, n_threads: int) -> None:
+    _worker_state["X"] = X
+    _worker_state["y"] = y
+    _worker_state["n_threads"] = n_threads
+    _worker_state["limits"] = threadpool_limits(limits=n_threads)
+
+
+def _evaluate_config(
+    estimator: BaseEstimator, params: dict[str, Any], splits: list[tuple[np.ndarray, np.ndarray]]
+) -> dict[str, Any]:
+    X, y, n_threads = _worker_state["X"], _worker_state["y"], _worker_state["n_threads"]
+    started = time.perf_counter()
+
+    pipe = Pipeline([("scaler", StandardScaler()), ("model", clone(estimator))])
+    pipe.set_params(**params)
+    _limit_estimator_threads(pipe, n_threads)
+
+    folds = []
+    for fold, (train_idx, test_idx) in enumerate(splits):
+        fold_started = time.perf_counter()
+
+        fold_pipe = clone(pipe).fit(X[train_idx], y[train_idx])
+        y_pred = fold_pipe.predict(X[test_idx])
+
+        folds.append(
+            {
+                "fold": fold,
+                "mae": float(mean_absolute_error(y[test_idx], y_pred)),
+                "r2": float(r2_score(y[test_idx], y_pred)),
+                "seconds": time.perf_counter() - fold_started,
+            }
+        )
+
+    return {"folds": folds, "wall_seconds": time.perf_counter() - started}
+
+
+def _read_cached(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_cached(path: Path, result: dict[str, Any]) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(result, default=_to_json), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _to_row(config: SearchConfig, result: dict[str, Any], is_cached: bool) -> dict[str, Any]:
+    maes = np.array([f["mae"] for f in result["folds"]])
+    r2s = np.array([f["r2"] for f in result["folds"]])
+
+    return {
+        "Model": config.model_name,
+        "Params": config.params,
+        "CV MAE": maes.mean(),
+        "CV MAE Std": maes.std(),
+        "CV R2": r2s.mean(),
+        "CV R2 Std": r2s.std(),
+        "Fit Seconds": sum(f["seconds"] for f in result["folds"]),
+        "Wall Seconds": result["wall_seconds"],
+        "Cached": is_cached,
+        "Key": config.key,
+    }
+
+
+def run_model_search(
+    X: pd.DataFrame,
+    y: pd.Series,
+    models_config: dict = MODELS_CONFIG,
+    param_grids: dict | None = None,
+    n_iter: int | None = None,
+    n_splits: int = 3,
+    test_size: int = 14,
+    cpu_budget: int | None = None,
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
+    resume: bool = True,
+) -> pd.DataFrame:
+    """
+    Evaluates every model/params combination (MODELS_CONFIG grids or param_grids,
+    e.g. FINETUNE_PARAMS) with TimeSeriesSplit in a process pool. Workers share a CPU
+    budget, so CatBoost thread_count / sklearn n_jobs stay within it. Results of every
+    config are cached on disk and reused when resume=True.
+    """
+    cv = TimeSeriesSplit(n_splits=n_splits, test_size=test_size)
+    splits = list(cv.split(X))
+
+    feature_set_hash = get_feature_set_hash(X, y)
+    cache_dir = (cache_dir or MODEL_SEARCH_CACHE_DIR) / feature_set_hash[:16]
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    configs = [
+        SearchConfig(
+            model_name=model_name,
+            params=params,
+            key=get_config_key(model_name, params, feature_set_hash, cv),
+        )
+        for model_name, params in iter_search_configs(models_config, param_grids, n_iter)
+    ]
+
+    rows = []
+    pending = []
+    for config in configs:
+        cached = _read_cached(cache_dir / f"{config.key}.json") if resume else None
+        if cached is not None:
+            rows.append(_to_row(config, cached, is_cached=True))
+        else:
+            pending.append(config)
+
+    logger.info(
+        "Model search: %d configs, %d cached, %d to run", len(configs), len(rows), len(pending)
+    )
+
+    if pending:
+        cpu_budget = cpu_budget or os.cpu_count() or 1
+        n_workers, n_threads = split_cpu_budget(cpu_budget, len(pending), max_workers)
+
+        X_values = X.to_numpy(dtype=float)
+        y_values = y.to_numpy(dtype=float)
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(X_values, y_values, n_threads),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _evaluate_config,
+                    models_config[config.model_name]["model"],
+                    config.params,
+                    splits,
+                ): config
+                for config in pending
+            }
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                config = futures[future]
+                result = {"model": config.model_name, "params": config.params, **future.result()}
+
+                _write_cached(cache_dir / f"{config.key}.json", result)
+                rows.append(_to_row(config, result, is_cached=False))
+
+                logger.info(
+                    "[%d/%d] %s %s: %.2fs",
+                    done,
+                    len(pending),
+                    config.model_name,
+                    config.params,
+                    result["wall_seconds"],
+                )
+
+    results_df = pd.DataFrame(rows)
+    if results_df.empty:
+        return results_df
+
+    results_df["Stability_Score"] = results_df["CV R2"] - results_df["CV R2 Std"] * 2
+    return results_df.sort_values(by=["CV R2", "CV MAE"], ascending=[False, True]).reset_index(
+        drop=True
+    )
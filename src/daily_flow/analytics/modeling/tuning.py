@@ -0,0 +1,211 @@
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import optuna
+import pandas as pd
+from catboost import CatBoostRegressor
+from optuna.pruners import BasePruner, HyperbandPruner, MedianPruner
+from optuna.samplers import TPESampler
+from optuna.storages import BaseStorage, JournalStorage
+from optuna.storages.journal import JournalFileBackend
+from optuna.study import MaxTrialsCallback
+from optuna.trial import TrialState
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from daily_flow.analytics.datasets.constants import CATBOOST_FIXED_PARAMS
+from daily_flow.config.paths import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+PrunerName = Literal["median", "hyperband", "none"]
+
+OPTUNA_DIR = DATA_DIR / "optuna"
+DEFAULT_STUDY_NAME = "catboost_best_features"
+DEFAULT_STORAGE_PATH = OPTUNA_DIR / f"{DEFAULT_STUDY_NAME}.journal"
+SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+
+def suggest_catboost_params(trial: optuna.Trial) -> dict:
+    return {
+        "iterations": trial.suggest_int("iterations", 100, 800),
+        "depth": trial.suggest_int("depth", 2, 5),
+        "learning_rate": trial.suggest_float("learning_rate", 0.005, 0.1, log=True),
+        "l2_leaf_reg": trial.suggest_float("l2_leaf_reg", 1.0, 50.0, log=True),
+        "min_data_in_leaf": trial.suggest_int("min_data_in_leaf", 2, 15),
+        "random_strength": trial.suggest_float("random_strength", 0.5, 10.0),
+        # Minimum 0.75 to avoid CatBoostError on small folds with Bernoulli sampling
+        "subsample": trial.suggest_float("subsample", 0.75, 1.0),
+        **CATBOOST_FIXED_PARAMS,
+    }
+
+
+def build_catboost_pipeline(params: dict, thread_count: int | None = None) -> Pipeline:
+    model_params = {**CATBOOST_FIXED_PARAMS, **params}
+    if thread_count is not None:
+        model_params["thread_count"] = thread_count
+
+    return Pipeline(
+        [
+            ("scaler", StandardScaler()),
+            ("model", CatBoostRegressor(**model_params)),
+        ]
+    )
+
+
+def catboost_objective(
+    trial: optuna.Trial,
+    X: np.ndarray,
+    y: np.ndarray,
+    cv: TimeSeriesSplit,
+    thread_count: int | None = None,
+) -> float:
+    pipe = build_catboost_pipeline(suggest_catboost_params(trial), thread_count=thread_count)
+
+    maes, r2s = [], []
+    for fold, (train_idx, test_idx) in enumerate(cv.split(X)):
+        pipe.fit(X[train_idx], y[train_idx])
+        y_pred = pipe.predict(X[test_idx])
+
+        maes.append(mean_absolute_error(y[test_idx], y_pred))
+        r2s.append(r2_score(y[test_idx], y_pred))
+
+        # проміжне значення на кожному фолді, щоб pruner міг зупинити слабкий trial раніше
+        trial.report(float(np.mean(maes)), step=fold)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+
+    trial.set_user_attr("cv_r2", float(np.mean(r2s)))
+    trial.set_user_attr("cv_r2_std", float(np.std(r2s)))
+
+    # Penalise instability: prefer models with consistently low errors
+    # over models that win one fold but fail others
+    return float(np.mean(maes) + np.std(maes))
+
+
+def get_study_storage(storage_path: Path) -> str | BaseStorage:
+    storage_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if storage_path.suffix in SQLITE_SUFFIXES:
+        return f"sqlite:///{storage_path}"
+
+    return JournalStorage(JournalFileBackend(str(storage_path)))
+
+
+def build_pruner(pruner: PrunerName, n_splits: int) -> BasePruner:
+    if pruner == "median":
+        return MedianPruner(n_startup_trials=5, n_warmup_steps=0)
+    if pruner == "hyperband":
+        return HyperbandPruner(min_resource=1, max_resource=n_splits)
+    return optuna.pruners.NopPruner()
+
+
+def _optimize_worker(
+    study_name: str,
+    storage_path: Path,
+    X: np.ndarray,
+    y: np.ndarray,
+    n_trials: int,
+    n_splits: int,
+    test_size: int,
+    pruner: PrunerName,
+    seed: int,
+    thread_count: int,
+) -> None:
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=get_study_storage(storage_path),
+        sampler=TPESampler(seed=seed),
+        pruner=build_pruner(pruner, n_splits),
+    )
+    cv = TimeSeriesSplit(n_splits=n_splits, test_size=test_size)
+
+    # спільний ліміт на всю study: воркери (і повторні запуски) добирають лише решту trials
+    finished_states = (TrialState.COMPLETE, TrialState.PRUNED)
+    remaining = n_trials - len(study.get_trials(deepcopy=False, states=finished_states))
+    if remaining <= 0:
+        return
+
+    study.optimize(
+        lambda trial: catboost_objective(trial, X, y, cv, thread_count=thread_count),
+        n_trials=remaining,
+        callbacks=[MaxTrialsCallback(n_trials, states=finished_states)],
+    )
+
+
+def tune_catboost(
+    X: pd.DataFrame,
+    y: pd.Series,
+    study_name: str = DEFAULT_STUDY_NAME,
+    storage_path: Path = DEFAULT_STORAGE_PATH,
+    n_trials: int = 100,
+    n_workers: int = 1,
+    pruner: PrunerName = "median",
+    n_splits: int = 3,
+    test_size: int = 14,
+    seed: int = 42,
+) -> optuna.Study:
+    """
+    Tunes the final CatBoost pipeline with Optuna TPE. The study lives in a journal
+    (or SQLite) file, so reruns continue it, and n_workers processes share it.
+    """
+    study = optuna.create_study(
+        study_name=study_name,
+        storage=get_study_storage(storage_path),
+        direction="minimize",
+        sampler=TPESampler(seed=seed),
+        pruner=build_pruner(pruner, n_splits),
+        load_if_exists=True,
+    )
+
+    X_values = X.to_numpy(dtype=float)
+    y_values = y.to_numpy(dtype=float)
+    thread_count = max(1, (os.cpu_count() or 1) // n_workers)
+
+    worker_args = [
+        (
+            study_name,
+            storage_path,
+            X_values,
+            y_values,
+            n_trials,
+            n_splits,
+            test_size,
+            pruner,
+            seed + worker,
+            thread_count,
+        )
+        for worker in range(n_workers)
+    ]
+
+    if n_workers == 1:
+        _optimize_worker(*worker_args[0])
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        processes = [ctx.Process(target=_optimize_worker, args=args) for args in worker_args]
+
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        failed = [p.exitcode for p in processes if p.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"{len(failed)} Optuna worker(s) failed, exit codes: {failed}")
+
+    logger.info(
+        "Study %s: %d trials, best value %.4f", study_name, len(study.trials), study.best_value
+    )
+    return study
+
+
+def get_best_catboost_params(study: optuna.Study) -> dict:
+    return {**study.best_params, **CATBOOST_FIXED_PARAMS}
@@ -7,16 +7,21 @@ from daily_flow.db.engine import build_engine
 from daily_flow.db.init import init_db
 from daily_flow.db.repositories.activity.activity_category_repo import ActivityCategoryRepo
 from daily_flow.db.repositories.activity.activity_repo import ActivityRepo
+from daily_flow.db.repositories.activity.activity_stats_repo import ActivityStatsRepo
 from daily_flow.db.repositories.activity.activity_usage_repo import ActivityUsageRepo
 from daily_flow.db.repositories.activity.category_repo import CategoryRepo
+from daily_flow.db.repositories.cache import RepoCache
 from daily_flow.db.repositories.common_mood_repo import CommonMoodLogRepo
+from daily_flow.db.repositories.feature_store_repo import FeatureStoreRepo
 from daily_flow.db.repositories.idea_repo import IdeaRepo
 from daily_flow.db.repositories.mood_log_repo import MoodLogRepo
 from daily_flow.services.activity.activity.service import ActivityService
 from daily_flow.services.activity.activity_category.service import ActivityCategoryService
+from daily_flow.services.activity.activity_stats.service import ActivityStatsService
 from daily_flow.services.activity.activity_usage.service import ActivityUsageService
 from daily_flow.services.activity.category.service import CategoryService
 from daily_flow.services.common_mood.service import CommonMoodLogService
+from daily_flow.services.forecast.service import ForecastService
 from daily_flow.services.idea.service import IdeaService
 from daily_flow.services.mood_log.service import MoodLogService
 
@@ -25,6 +30,7 @@ from daily_flow.services.mood_log.service import MoodLogService
 class Container:
     db_settings: DbSettings
     engine: AsyncEngine
+    repo_cache: RepoCache
 
     mood_log_repo: MoodLogRepo
     common_mood_log_repo: CommonMoodLogRepo
@@ -33,6 +39,8 @@ class Container:
     category_repo: CategoryRepo
     activity_category_repo: ActivityCategoryRepo
     activity_usage_repo: ActivityUsageRepo
+    activity_stats_repo: ActivityStatsRepo
+    feature_store_repo: FeatureStoreRepo
 
     mood_log_service: MoodLogService
     common_mood_log_service: CommonMoodLogService
@@ -41,23 +49,32 @@ class Container:
     category_service: CategoryService
     activity_category_service: ActivityCategoryService
     activity_usage_service: ActivityUsageService
+    activity_stats_service: ActivityStatsService
+    forecast_service: ForecastService
 
 
 async def build_container(db_settings: DbSettings) -> Container:
     engine = await build_engine(
-        database_url=db_settings.db_url, is_database_echo=db_settings.is_sql_echo
+        database_url=db_settings.db_url,
+        is_database_echo=db_settings.is_sql_echo,
+        profile=db_settings.profile,
     )
 
     if db_settings.auto_init_db:
         await init_db(engine)
 
+    # каталоги (активності, категорії, сфери, теги) читаються з памʼяті до першого запису
+    repo_cache = RepoCache()
+
     mood_log_repo = MoodLogRepo(engine)
-    common_mood_log_repo = CommonMoodLogRepo(engine)
-    idea_repo = IdeaRepo(engine)
-    activity_repo = ActivityRepo(engine)
-    category_repo = CategoryRepo(engine)
+    common_mood_log_repo = CommonMoodLogRepo(engine, cache=repo_cache)
+    idea_repo = IdeaRepo(engine, cache=repo_cache)
+    activity_repo = ActivityRepo(engine, cache=repo_cache)
+    category_repo = CategoryRepo(engine, cache=repo_cache)
     activity_category_repo = ActivityCategoryRepo(engine)
     activity_usage_repo = ActivityUsageRepo(engine)
+    activity_stats_repo = ActivityStatsRepo(engine)
+    feature_store_repo = FeatureStoreRepo(engine)
 
     mood_log_service = MoodLogService(repo=mood_log_repo)
     common_mood_log_service = CommonMoodLogService(repo=common_mood_log_repo)
@@ -66,10 +83,16 @@ async def build_container(db_settings: DbSettings) -> Container:
     category_service = CategoryService(repo=category_repo)
     activity_category_service = ActivityCategoryService(repo=activity_category_repo)
     activity_usage_service = ActivityUsageService(repo=activity_usage_repo)
+    activity_stats_service = ActivityStatsService(repo=activity_stats_repo)
+    forecast_service = ForecastService(repo=feature_store_repo, db_url=db_settings.db_url)
+
+    # модель і вектор ознак на завтра завантажуються один раз, до першого запиту
+    await forecast_service.warm_up()
 
     return Container(
         db_settings=db_settings,
         engine=engine,
+        repo_cache=repo_cache,
         mood_log_repo=mood_log_repo,
         common_mood_log_repo=common_mood_log_repo,
         idea_repo=idea_repo,
@@ -77,6 +100,8 @@ async def build_container(db_settings: DbSettings) -> Container:
         category_repo=category_repo,
         activity_category_repo=activity_category_repo,
         activity_usage_repo=activity_usage_repo,
+        activity_stats_repo=activity_stats_repo,
+        feature_store_repo=feature_store_repo,
         mood_log_service=mood_log_service,
         common_mood_log_service=common_mood_log_service,
         idea_service=idea_service,
@@ -84,4 +109,6 @@ async def build_container(db_settings: DbSettings) -> Container:
         category_service=category_service,
         activity_category_service=activity_category_service,
         activity_usage_service=activity_usage_service,
+        activity_stats_service=activity_stats_service,
+        forecast_service=forecast_service,
     )
@@ -10,10 +10,12 @@ from daily_flow.config.paths import DATA_DIR, ENV_PATH
 class DbSettings:
     db_url: str
     auto_init_db: bool = True
-    is_sql_echo: bool = True
+    is_sql_echo: bool = False
+    # набір SQLite-прагм з daily_flow.db.engine.SQLITE_PROFILES
+    profile: str = "bot"
 
 
-def load_db_settings() -> DbSettings:
+def load_db_settings(profile: str = "bot") -> DbSettings:
     load_dotenv(ENV_PATH)
 
     db_file = DATA_DIR / "app.db"
@@ -22,6 +24,8 @@ def load_db_settings() -> DbSettings:
     db_url = os.getenv("DATABASE_URL", default_db_url)
 
     auto_init = os.getenv("AUTO_INIT_DB", "1") == "1"
-    echo = os.getenv("SQL_ECHO", "1") == "1"
+    echo = os.getenv("SQL_ECHO", "0") == "1"
+    # DB_PROFILE перекриває профіль, який обрала точка входу
+    profile = os.getenv("DB_PROFILE", profile)
 
-    return DbSettings(db_url=db_url, auto_init_db=auto_init, is_sql_echo=echo)
+    return DbSettings(db_url=db_url, auto_init_db=auto_init, is_sql_echo=echo, profile=profile)
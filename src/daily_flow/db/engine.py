@@ -1,4 +1,5 @@
 import logging
+from dataclasses import dataclass
 
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
@@ -6,24 +7,95 @@ from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 logger = logging.getLogger(__name__)
 
 
-async def build_engine(database_url: str, is_database_echo: bool) -> AsyncEngine:
-    logger.info("DATABASE_URL=%s", database_url)
+@dataclass(frozen=True)
+class SqliteProfile:
+    """
+    Per-connection SQLite tuning. None keeps the SQLite default. cache_size follows the
+    pragma: negative values are KiB, positive values are pages.
+    """
+
+    synchronous: str | None = None
+    cache_size: int | None = None
+    mmap_size: int | None = None
+    temp_store: str | None = None
+    # розмір кешу підготовлених запитів sqlite3 (за замовчуванням 128)
+    cached_statements: int = 128
+
+
+SQLITE_PROFILES = {
+    # без тюнінгу: лише WAL, foreign_keys і busy_timeout
+    "default": SqliteProfile(),
+    # короткі точкові читання і поодинокі записи; у WAL NORMAL не ламає цілісність,
+    # лише останні коміти можуть загубитись при збої живлення
+    "bot": SqliteProfile(
+        synchronous="NORMAL",
+        cache_size=-16_000,
+        mmap_size=64 * 1024**2,
+        cached_statements=256,
+    ),
+    # великі executemany-upsert в одній транзакції
+    "ingest": SqliteProfile(
+        synchronous="NORMAL",
+        cache_size=-64_000,
+        mmap_size=256 * 1024**2,
+    ),
+    # повні скани mood mart, сортування й GROUP BY
+    "analytics": SqliteProfile(
+        synchronous="NORMAL",
+        cache_size=-128_000,
+        mmap_size=1024**3,
+        temp_store="MEMORY",
+    ),
+}
+
+
+def get_sqlite_profile(name: str) -> SqliteProfile:
+    try:
+        return SQLITE_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown DB profile '{name}'. Allowed: {list(SQLITE_PROFILES)}") from None
+
+
+def apply_sqlite_pragmas(dbapi_connection, profile: SqliteProfile) -> None:
+    """Works on both sqlite3 connections and the SQLAlchemy aiosqlite DBAPI adapter."""
+    pragmas = {
+        "foreign_keys": "ON",
+        "journal_mode": "WAL",
+        "busy_timeout": 5000,
+        "synchronous": profile.synchronous,
+        "cache_size": profile.cache_size,
+        "mmap_size": profile.mmap_size,
+        "temp_store": profile.temp_store,
+    }
+
+    cursor = dbapi_connection.cursor()
+    for name, value in pragmas.items():
+        if value is not None:
+            cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+async def build_engine(
+    database_url: str, is_database_echo: bool = False, profile: str = "bot"
+) -> AsyncEngine:
+    logger.info("DATABASE_URL=%s profile=%s", database_url, profile)
+
+    sqlite_profile = get_sqlite_profile(profile)
+    connect_args = {"check_same_thread": False}
+    if "sqlite" in database_url:
+        connect_args["cached_statements"] = sqlite_profile.cached_statements
 
     engine = create_async_engine(
         database_url,
-        connect_args={"check_same_thread": False},
-        echo=is_database_echo,  # виключити ближче ддо деплою
+        connect_args=connect_args,
+        echo=is_database_echo,
     )
 
     if "sqlite" in database_url:
 
         @event.listens_for(engine.sync_engine, "connect")
         def _set_sqlite_pragma(dbapi_connection, connection_record):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.execute("PRAGMA journal_mode=WAL")
-            cursor.execute("PRAGMA busy_timeout=5000")
-            cursor.close()
+            apply_sqlite_pragmas(dbapi_connection, sqlite_profile)
 
     try:
         async with engine.begin() as conn:
@@ -37,3 +109,15 @@ async def build_engine(database_url: str, is_database_echo: bool) -> AsyncEngine
         raise
 
     return engine
+
+
+async def dispose_engine(engine: AsyncEngine) -> None:
+    # PRAGMA optimize оновлює статистику планувальника лише там, де вона застаріла
+    if engine.dialect.name == "sqlite":
+        try:
+            async with engine.connect() as conn:
+                await conn.exec_driver_sql("PRAGMA optimize")
+        except Exception as e:
+            logger.warning("PRAGMA optimize failed on shutdown: %s", e)
+
+    await engine.dispose()
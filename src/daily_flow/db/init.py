@@ -1,33 +1,76 @@
 import logging
 
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
+from daily_flow.db.migrations import (
+    MIGRATIONS,
+    SchemaVersionError,
+    apply_migrations,
+    check_migrations,
+    get_schema_version,
+)
 from daily_flow.db.schema import metadata
+from daily_flow.db.schema.version import SCHEMA_VERSION
 
 logger = logging.getLogger(__name__)
 
 
 async def init_db(engine: AsyncEngine) -> None:
+    """
+    Brings the database to SCHEMA_VERSION. A current schema costs one query; an outdated one
+    gets its pending migrations; a new one is created from metadata; one that predates
+    versioning gets the missing tables and then every migration.
+    """
+    check_migrations(MIGRATIONS, SCHEMA_VERSION)
+
+    async with engine.connect() as conn:
+        version = await get_schema_version(conn)
+
+    if version == SCHEMA_VERSION:
+        logger.info("Database schema is up to date (version %d)", version)
+        return
+
+    if version is not None and version > SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Database schema version {version} is newer than the code ({SCHEMA_VERSION})"
+        )
+
     async with engine.begin() as conn:
-        await conn.run_sync(metadata.create_all)
-
-    if engine.name == "sqlite":
-        async with engine.begin() as conn:
-            sqlite_master_result = await conn.exec_driver_sql("""
-                SELECT name
-                FROM sqlite_master
-                WHERE type='table'
-                  AND name NOT LIKE 'sqlite_%';
-            """)
-            rows = sqlite_master_result.all()
-            db_tables = [row[0] for row in rows]
-
-            if not db_tables:
-                raise RuntimeError(
-                    "Database file exists but contains no tables or metadata is empty"
-                )
-
-            logger.info("Tables in database file: %s", db_tables)
+        is_new_database = False
+        if version is None:
+            is_new_database = not await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).get_table_names()
+            )
+            await conn.run_sync(metadata.create_all)
+            await _log_tables(conn, engine.name)
+
+        # нова БД уже має поточну схему: ALTER-міграції на ній впали б
+        applied = await apply_migrations(conn, MIGRATIONS, record_only=is_new_database)
+
+    logger.info(
+        "Database schema migrated from version %s to %d (%s)",
+        version,
+        SCHEMA_VERSION,
+        ", ".join(applied) or "nothing to apply",
+    )
+
+
+async def _log_tables(conn: AsyncConnection, dialect_name: str) -> None:
+    if dialect_name == "sqlite":
+        sqlite_master_result = await conn.exec_driver_sql("""
+            SELECT name
+            FROM sqlite_master
+            WHERE type='table'
+              AND name NOT LIKE 'sqlite_%';
+        """)
+        rows = sqlite_master_result.all()
+        db_tables = [row[0] for row in rows]
+
+        if not db_tables:
+            raise RuntimeError("Database file exists but contains no tables or metadata is empty")
+
+        logger.info("Tables in database file: %s", db_tables)
 
     if (tables_count := len(metadata.tables)) == 0:
         logger.warning("No tables registered in metadata")
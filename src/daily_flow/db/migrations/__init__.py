@@ -0,0 +1,30 @@
+from daily_flow.db.migrations.base import Migration
+from daily_flow.db.migrations.runner import (
+    SchemaVersionError,
+    apply_migrations,
+    check_migrations,
+    get_schema_version,
+)
+from daily_flow.db.migrations.v0001_initial_schema import MIGRATION as INITIAL_SCHEMA
+from daily_flow.db.migrations.v0002_activity_usage_indexes import (
+    MIGRATION as ACTIVITY_USAGE_INDEXES,
+)
+from daily_flow.db.migrations.v0003_activity_title_index import MIGRATION as ACTIVITY_TITLE_INDEX
+from daily_flow.db.migrations.v0004_mood_updated_at import MIGRATION as MOOD_UPDATED_AT
+
+# нова міграція = новий модуль vNNNN_*.py тут + SCHEMA_VERSION у db/schema/version.py
+MIGRATIONS: tuple[Migration, ...] = (
+    INITIAL_SCHEMA,
+    ACTIVITY_USAGE_INDEXES,
+    ACTIVITY_TITLE_INDEX,
+    MOOD_UPDATED_AT,
+)
+
+__all__ = [
+    "MIGRATIONS",
+    "Migration",
+    "SchemaVersionError",
+    "apply_migrations",
+    "check_migrations",
+    "get_schema_version",
+]
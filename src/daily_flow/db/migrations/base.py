@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    One schema step. statements are frozen SQL as of this version (not derived from the
+    current metadata), so replaying an old migration never picks up later schema edits.
+    They run against the schema of the previous version. A new database is created from the
+    current metadata and only records them; a database that predates versioning gets
+    metadata.create_all (missing tables) and then every migration, so objects that create_all
+    may already have made are created with IF NOT EXISTS.
+    """
+
+    version: int
+    name: str
+    statements: tuple[str, ...]
@@ -0,0 +1,69 @@
+import logging
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from daily_flow.db.migrations.base import Migration
+from daily_flow.db.schema import applied_migration
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaVersionError(RuntimeError):
+    """Database schema version does not match the migrations shipped with the code."""
+
+
+def check_migrations(migrations: tuple[Migration, ...], schema_version: int) -> None:
+    versions = [migration.version for migration in migrations]
+    if versions != list(range(1, schema_version + 1)):
+        raise SchemaVersionError(
+            f"Migrations must be numbered 1..{schema_version} in order, got {versions}"
+        )
+
+
+async def get_schema_version(conn: AsyncConnection) -> int | None:
+    """Latest recorded migration version; None for a new or never migrated database."""
+    try:
+        result = await conn.execute(select(func.max(applied_migration.c.version)))
+    except OperationalError:
+        # таблиці applied_migration ще немає — порожня БД
+        return None
+    return result.scalar()
+
+
+async def apply_migrations(
+    conn: AsyncConnection, migrations: tuple[Migration, ...], record_only: bool = False
+) -> list[str]:
+    """
+    Applies migrations not yet recorded in applied_migration, in version order, inside the
+    caller's transaction. Returns the names of the applied migrations. record_only marks them
+    as applied without running the SQL: for a database just created from the current metadata.
+    """
+    # перечитується вже в транзакції запису: другий процес, що стартував паралельно,
+    # не застосує ту саму міграцію вдруге
+    applied_versions = set((await conn.execute(select(applied_migration.c.version))).scalars())
+
+    applied = []
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version in applied_versions:
+            continue
+
+        if not record_only:
+            for statement in migration.statements:
+                await conn.exec_driver_sql(statement)
+        await conn.execute(
+            insert(applied_migration).values(
+                version=migration.version, migration_name=migration.name
+            )
+        )
+
+        logger.info(
+            "%s migration %d %s",
+            "Recorded" if record_only else "Applied",
+            migration.version,
+            migration.name,
+        )
+        applied.append(migration.name)
+
+    return applied
@@ -0,0 +1,4 @@
+from daily_flow.db.migrations.base import Migration
+
+# базова схема — це metadata.create_all, окремого DDL тут немає
+MIGRATION = Migration(version=1, name="initial_schema", statements=())
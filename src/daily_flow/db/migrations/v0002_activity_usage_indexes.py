@@ -0,0 +1,11 @@
+from daily_flow.db.migrations.base import Migration
+
+MIGRATION = Migration(
+    version=2,
+    name="activity_usage_indexes",
+    statements=(
+        "CREATE INDEX IF NOT EXISTS ix_activity_usage_used_at ON activity_usage (used_at)",
+        "CREATE INDEX IF NOT EXISTS ix_activity_usage_activity_id_used_at "
+        "ON activity_usage (activity_id, used_at DESC)",
+    ),
+)
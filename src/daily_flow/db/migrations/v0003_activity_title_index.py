@@ -0,0 +1,7 @@
+from daily_flow.db.migrations.base import Migration
+
+MIGRATION = Migration(
+    version=3,
+    name="activity_title_index",
+    statements=("CREATE INDEX IF NOT EXISTS ix_activity_title ON activity (title)",),
+)
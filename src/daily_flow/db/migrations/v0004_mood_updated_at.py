@@ -0,0 +1,41 @@
+from daily_flow.db.migrations.base import Migration
+
+
+def _touch_triggers(table_name: str) -> tuple[str, ...]:
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table_name}_touch_insert "
+        f"AFTER INSERT ON {table_name} FOR EACH ROW WHEN NEW.updated_at IS NULL "
+        f"BEGIN UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table_name}_touch_update "
+        f"AFTER UPDATE ON {table_name} FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at "
+        f"BEGIN UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END",
+    )
+
+
+# Watermark зберігав max_created_at і не бачив правок старих днів: таблицю перестворюємо,
+# тож перший інкрементальний запуск після міграції перебудовує snapshot повністю
+MIGRATION = Migration(
+    version=4,
+    name="mood_updated_at",
+    statements=(
+        "ALTER TABLE mood_log ADD COLUMN updated_at DATETIME",
+        "UPDATE mood_log SET updated_at = created_at",
+        "ALTER TABLE common_mood_log ADD COLUMN updated_at DATETIME",
+        "UPDATE common_mood_log SET updated_at = created_at",
+        *_touch_triggers("mood_log"),
+        *_touch_triggers("common_mood_log"),
+        "DROP TABLE IF EXISTS mood_mart_watermark",
+        """CREATE TABLE IF NOT EXISTS mood_mart_watermark (
+    id INTEGER NOT NULL,
+    snapshot_path TEXT NOT NULL,
+    snapshot_version INTEGER NOT NULL,
+    max_updated_at TEXT,
+    max_day DATE,
+    mood_log_rows INTEGER NOT NULL,
+    common_mood_log_rows INTEGER NOT NULL,
+    built_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT uq_mood_mart_watermark_snapshot_path UNIQUE (snapshot_path)
+)""",
+    ),
+)
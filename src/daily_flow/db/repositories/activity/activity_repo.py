@@ -9,6 +9,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from daily_flow.db.errors import MissingRequiredFieldError, UnknownFieldError, map_integrity_error
+from daily_flow.db.repositories.cache import CacheKey, RepoCache, get_cached, invalidate_cached
+from daily_flow.db.repositories.pagination import Page, PageCursor, fetch_page
 from daily_flow.db.schema import activity, category_activity
 
 logger = logging.getLogger(__name__)
@@ -64,8 +66,9 @@ class Activity:
 
 
 class ActivityRepo:
-    def __init__(self, engine: AsyncEngine) -> None:
+    def __init__(self, engine: AsyncEngine, cache: RepoCache | None = None) -> None:
         self._engine = engine
+        self._cache = cache
 
     @staticmethod
     def _to_activity(row_mapping: Mapping[str, Any]) -> Activity:
@@ -150,6 +153,8 @@ class ActivityRepo:
                 list(payload.keys()),
             )
             raise map_integrity_error(e, activity.name) from e
+        finally:
+            invalidate_cached(self._cache, CacheKey.ACTIVITIES)
 
     async def delete_activity_by_title(self, title: str) -> int:
         title = (title or "").strip()
@@ -160,7 +165,11 @@ class ActivityRepo:
 
         async with self._engine.begin() as conn:
             res: CursorResult = await conn.execute(stmt)
-            return int(res.rowcount or 0)
+            deleted = int(res.rowcount or 0)
+
+        if deleted:
+            invalidate_cached(self._cache, CacheKey.ACTIVITIES)
+        return deleted
 
     async def delete_activity_by_id(self, activity_id: int) -> int:
         if not activity_id:
@@ -170,7 +179,11 @@ class ActivityRepo:
 
         async with self._engine.begin() as conn:
             res: CursorResult = await conn.execute(stmt)
-            return int(res.rowcount or 0)
+            deleted = int(res.rowcount or 0)
+
+        if deleted:
+            invalidate_cached(self._cache, CacheKey.ACTIVITIES)
+        return deleted
 
     async def get_activity_by_id(self, activity_id: int) -> Activity | None:
         stmt = select(*activity.c).where(activity.c.id == activity_id).limit(1)
@@ -193,6 +206,9 @@ class ActivityRepo:
             return self._to_activity(row) if row else None
 
     async def get_all_activities(self) -> list[Activity]:
+        return list(await get_cached(self._cache, CacheKey.ACTIVITIES, self._load_all_activities))
+
+    async def _load_all_activities(self) -> list[Activity]:
         stmt = select(*activity.c).order_by(activity.c.title)
 
         async with self._engine.connect() as conn:
@@ -200,6 +216,18 @@ class ActivityRepo:
             rows = res.mappings().all()
             return [self._to_activity(row) for row in rows]
 
+    async def get_activities_page(
+        self, limit: int, cursor: PageCursor | None = None
+    ) -> Page[Activity]:
+        if not limit or limit <= 0:
+            raise MissingRequiredFieldError("limit must be > 0")
+
+        async with self._engine.connect() as conn:
+            page = await fetch_page(
+                conn, select(*activity.c), (activity.c.title, activity.c.id), limit, cursor
+            )
+            return page.map(self._to_activity)
+
     async def get_activities_by_category(self, category_id: int) -> list[Activity]:
         stmt = (
             select(*activity.c)
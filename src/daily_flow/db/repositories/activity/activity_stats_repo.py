@@ -0,0 +1,201 @@
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Column, Select, and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from daily_flow.db.errors import MissingRequiredFieldError
+from daily_flow.db.schema import activity, activity_usage, category, category_activity
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UsageStats:
+    usages_count: int
+    # середні зміни after − before; None, якщо жодної пари before/after за період
+    mood_delta: float | None
+    energy_delta: float | None
+    rating_delta: float | None
+    last_used_at: datetime
+    active_days: int
+    longest_streak: int
+    current_streak: int
+
+
+@dataclass(frozen=True)
+class ActivityStats:
+    activity_id: int
+    title: str
+    stats: UsageStats
+
+
+@dataclass(frozen=True)
+class CategoryStats:
+    category_id: int
+    name: str
+    activities_count: int
+    stats: UsageStats
+
+
+@dataclass(frozen=True)
+class ActivityStatsReport:
+    date_from: datetime
+    date_to: datetime
+    activities: list[ActivityStats]
+    categories: list[CategoryStats]
+
+
+class ActivityStatsRepo:
+    """
+    Activity effectiveness over a period, aggregated in SQL: one statement per level
+    (activity, category), both on one connection, instead of fetching usages per activity.
+    The period filter goes through ix_activity_usage_used_at.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    @staticmethod
+    def _to_usage_stats(row_mapping: Mapping[str, Any]) -> UsageStats:
+        return UsageStats(
+            usages_count=row_mapping["usages_count"],
+            mood_delta=row_mapping["mood_delta"],
+            energy_delta=row_mapping["energy_delta"],
+            rating_delta=row_mapping["rating_delta"],
+            last_used_at=row_mapping["last_used_at"],
+            active_days=row_mapping["active_days"],
+            longest_streak=row_mapping["longest_streak"],
+            current_streak=row_mapping["current_streak"],
+        )
+
+    @staticmethod
+    def _stats_stmt(
+        key: Column,
+        date_from: datetime,
+        date_to: datetime,
+        with_categories: bool = False,
+    ) -> Select:
+        """
+        Per-key aggregates of the usages in the period plus day streaks. A streak is a run of
+        consecutive days with at least one usage: julianday(day) - row_number() is constant
+        within a run. The current streak is the run ending on the last day of the period or
+        the day before it (today may simply not be logged yet).
+        """
+        usages = activity_usage
+        if with_categories:
+            usages = activity_usage.join(
+                category_activity, category_activity.c.activity_id == activity_usage.c.activity_id
+            )
+        in_period = and_(activity_usage.c.used_at >= date_from, activity_usage.c.used_at <= date_to)
+        day = func.date(activity_usage.c.used_at)
+
+        aggregates = (
+            select(
+                key.label("key"),
+                func.count().label("usages_count"),
+                func.avg(activity_usage.c.mood_after - activity_usage.c.mood_before).label(
+                    "mood_delta"
+                ),
+                func.avg(activity_usage.c.energy_after - activity_usage.c.energy_before).label(
+                    "energy_delta"
+                ),
+                func.avg(activity_usage.c.rating_after - activity_usage.c.rating_before).label(
+                    "rating_delta"
+                ),
+                func.max(activity_usage.c.used_at).label("last_used_at"),
+                func.count(func.distinct(day)).label("active_days"),
+                func.count(func.distinct(activity_usage.c.activity_id)).label("activities_count"),
+            )
+            .select_from(usages)
+            .where(in_period)
+            .group_by(key)
+            .subquery("aggregates")
+        )
+
+        days = select(key.label("key"), day.label("day")).select_from(usages).where(in_period)
+        days = days.distinct().subquery("days")
+
+        runs = select(
+            days.c.key,
+            days.c.day,
+            (
+                func.julianday(days.c.day)
+                - func.row_number().over(partition_by=days.c.key, order_by=days.c.day)
+            ).label("run"),
+        ).subquery("runs")
+
+        streaks = (
+            select(
+                runs.c.key,
+                func.count().label("length"),
+                func.max(runs.c.day).label("last_day"),
+            )
+            .group_by(runs.c.key, runs.c.run)
+            .subquery("streaks")
+        )
+
+        current_since = (date_to.date() - timedelta(days=1)).isoformat()
+        streak_summary = (
+            select(
+                streaks.c.key,
+                func.max(streaks.c.length).label("longest_streak"),
+                func.max(
+                    case((streaks.c.last_day >= current_since, streaks.c.length), else_=0)
+                ).label("current_streak"),
+            )
+            .group_by(streaks.c.key)
+            .subquery("streak_summary")
+        )
+
+        return select(
+            aggregates, streak_summary.c.longest_streak, streak_summary.c.current_streak
+        ).join(streak_summary, streak_summary.c.key == aggregates.c.key)
+
+    async def get_stats(self, date_from: datetime, date_to: datetime) -> ActivityStatsReport:
+        if not date_from or not date_to:
+            raise MissingRequiredFieldError("date_from and date_to are required")
+
+        activity_stats = self._stats_stmt(activity_usage.c.activity_id, date_from, date_to)
+        activity_stats = activity_stats.subquery("activity_stats")
+        activities_stmt = (
+            select(activity.c.id, activity.c.title, activity_stats)
+            .join(activity_stats, activity_stats.c.key == activity.c.id)
+            .order_by(activity_stats.c.usages_count.desc(), activity.c.title)
+        )
+
+        category_stats = self._stats_stmt(
+            category_activity.c.category_id, date_from, date_to, with_categories=True
+        ).subquery("category_stats")
+        categories_stmt = (
+            select(category.c.id, category.c.name, category_stats)
+            .join(category_stats, category_stats.c.key == category.c.id)
+            .order_by(category_stats.c.usages_count.desc(), category.c.name)
+        )
+
+        async with self._engine.connect() as conn:
+            activity_rows = (await conn.execute(activities_stmt)).mappings().all()
+            category_rows = (await conn.execute(categories_stmt)).mappings().all()
+
+        return ActivityStatsReport(
+            date_from=date_from,
+            date_to=date_to,
+            activities=[
+                ActivityStats(
+                    activity_id=row["id"], title=row["title"], stats=self._to_usage_stats(row)
+                )
+                for row in activity_rows
+            ],
+            categories=[
+                CategoryStats(
+                    category_id=row["id"],
+                    name=row["name"],
+                    activities_count=row["activities_count"],
+                    stats=self._to_usage_stats(row),
+                )
+                for row in category_rows
+            ],
+        )
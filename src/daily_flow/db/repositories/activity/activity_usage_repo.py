@@ -16,6 +16,7 @@ from daily_flow.db.errors import (
     UnknownFieldError,
     map_integrity_error,
 )
+from daily_flow.db.repositories.pagination import Page, PageCursor, fetch_page
 from daily_flow.db.schema import activity, activity_usage
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,9 @@ ALLOWED_ACTIVITY_USAGE_FIELDS = {
     "notes",
 }
 
+# сторінки історії — від нових до старих; id розрізняє виконання з однаковим used_at
+USAGE_SORT_COLUMNS = (activity_usage.c.used_at, activity_usage.c.id)
+
 
 @dataclass(frozen=True)
 class ActivityUsage:
@@ -238,6 +242,41 @@ class ActivityUsageRepo:
             rows = res.mappings().all()
             return [self._to_activity_usage(row) for row in rows]
 
+    async def get_activity_usages_page_by_activity(
+        self, activity_id: int, limit: int, cursor: PageCursor | None = None
+    ) -> Page[ActivityUsage]:
+        if not limit or limit <= 0:
+            raise MissingRequiredFieldError("limit must be > 0")
+
+        stmt = select(*activity_usage.c).where(activity_usage.c.activity_id == activity_id)
+
+        async with self._engine.connect() as conn:
+            page = await fetch_page(conn, stmt, USAGE_SORT_COLUMNS, limit, cursor, descending=True)
+            return page.map(self._to_activity_usage)
+
+    async def get_activity_usages_page_by_period(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        limit: int,
+        cursor: PageCursor | None = None,
+    ) -> Page[ActivityUsage]:
+        if not date_from or not date_to:
+            raise MissingRequiredFieldError("date_from and date_to are required")
+        if not limit or limit <= 0:
+            raise MissingRequiredFieldError("limit must be > 0")
+
+        stmt = select(*activity_usage.c).where(
+            and_(
+                activity_usage.c.used_at >= date_from,
+                activity_usage.c.used_at <= date_to,
+            )
+        )
+
+        async with self._engine.connect() as conn:
+            page = await fetch_page(conn, stmt, USAGE_SORT_COLUMNS, limit, cursor, descending=True)
+            return page.map(self._to_activity_usage)
+
     async def get_last_activity_usages(self, limit: int) -> list[ActivityUsage]:
         if not limit or limit <= 0:
             raise MissingRequiredFieldError("limit must be > 0")
@@ -9,6 +9,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from daily_flow.db.errors import MissingRequiredFieldError, map_integrity_error
+from daily_flow.db.repositories.cache import CacheKey, RepoCache, get_cached, invalidate_cached
 from daily_flow.db.schema import category
 
 logger = logging.getLogger(__name__)
@@ -22,8 +23,9 @@ class Category:
 
 
 class CategoryRepo:
-    def __init__(self, engine: AsyncEngine) -> None:
+    def __init__(self, engine: AsyncEngine, cache: RepoCache | None = None) -> None:
         self._engine = engine
+        self._cache = cache
 
     @staticmethod
     def _to_category(row_mapping: Mapping[str, Any]) -> Category:
@@ -65,6 +67,8 @@ class CategoryRepo:
                 description,
             )
             raise map_integrity_error(e, category.name) from e
+        finally:
+            invalidate_cached(self._cache, CacheKey.CATEGORIES)
 
     async def delete_category_by_name(self, name: str) -> int:
         name = (name or "").strip()
@@ -75,7 +79,11 @@ class CategoryRepo:
 
         async with self._engine.begin() as conn:
             res: CursorResult = await conn.execute(stmt)
-            return int(res.rowcount or 0)
+            deleted = int(res.rowcount or 0)
+
+        if deleted:
+            invalidate_cached(self._cache, CacheKey.CATEGORIES)
+        return deleted
 
     async def delete_category_by_id(self, category_id: int) -> int:
         if not category_id:
@@ -85,7 +93,11 @@ class CategoryRepo:
 
         async with self._engine.begin() as conn:
             res: CursorResult = await conn.execute(stmt)
-            return int(res.rowcount or 0)
+            deleted = int(res.rowcount or 0)
+
+        if deleted:
+            invalidate_cached(self._cache, CacheKey.CATEGORIES)
+        return deleted
 
     async def get_category_by_id(self, category_id: int) -> Category | None:
         stmt = select(*category.c).where(category.c.id == category_id).limit(1)
@@ -108,6 +120,9 @@ class CategoryRepo:
             return self._to_category(row) if row else None
 
     async def get_all_categories(self) -> list[Category]:
+        return list(await get_cached(self._cache, CacheKey.CATEGORIES, self._load_all_categories))
+
+    async def _load_all_categories(self) -> list[Category]:
         stmt = select(*category.c).order_by(category.c.name)
 
         async with self._engine.connect() as conn:
@@ -0,0 +1,22 @@
+from collections.abc import Iterator
+from typing import Any
+
+# SQLITE_MAX_VARIABLE_NUMBER за замовчуванням для SQLite >= 3.32: межа для IN (...) списків
+SQLITE_MAX_VARIABLES = 32_766
+
+# executemany біндить параметри кожного рядка окремо, тож ліміт змінних його не стосується;
+# чанк лише обмежує один виклик драйвера і дає поміряти час кроку (40k днів: 1k ≈ 1.4 s)
+BATCH_UPSERT_CHUNK_ROWS = 1_000
+
+
+def align_row_keys(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # executemany компілює один statement за ключами першого рядка, тому ключі мають збігатися
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    return [{key: row.get(key) for key in keys} for row in rows]
+
+
+def chunk_rows(
+    rows: list[dict[str, Any]], chunk_size: int = BATCH_UPSERT_CHUNK_ROWS
+) -> Iterator[list[dict[str, Any]]]:
+    for start in range(0, len(rows), chunk_size):
+        yield rows[start : start + chunk_size]
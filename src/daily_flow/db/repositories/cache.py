@@ -0,0 +1,113 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+REPO_CACHE_TTL_SECONDS = 300.0
+REPO_CACHE_MAX_ENTRIES = 128
+
+
+class CacheKey(StrEnum):
+    ACTIVITIES = "activities"
+    CATEGORIES = "categories"
+    SPHERES = "spheres"
+    MOOD_TAGS = "mood_tags"
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    expires_at: float
+
+
+class RepoCache:
+    """
+    In-process read-through cache for catalog reads of the repositories, with TTL and LRU
+    eviction. Repositories drop their keys after a committed write, so the TTL only bounds
+    staleness from writes made outside this process (another bot instance, manual SQL).
+    Meant for one event loop: no locking.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = REPO_CACHE_TTL_SECONDS,
+        max_entries: int = REPO_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        # покоління ключа: завантаження, яке перетнулося з інвалідацією, не кешується
+        self._generations: dict[CacheKey, int] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    async def get_or_load(self, key: CacheKey, loader: Callable[[], Awaitable[T]]) -> T:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+        self._misses += 1
+        generation = self._generations.get(key, 0)
+        value = await loader()
+
+        if self._generations.get(key, 0) == generation:
+            self._set(key, value)
+        return value
+
+    def _set(self, key: CacheKey, value: Any) -> None:
+        self._entries[key] = _Entry(value=value, expires_at=time.monotonic() + self._ttl_seconds)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, *keys: CacheKey) -> None:
+        for key in keys:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidate(*self._entries)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            entries=len(self._entries),
+        )
+
+
+async def get_cached(
+    cache: RepoCache | None, key: CacheKey, loader: Callable[[], Awaitable[T]]
+) -> T:
+    # репозиторій без кешу (інжест, скрипти) просто читає з БД
+    if cache is None:
+        return await loader()
+    return await cache.get_or_load(key, loader)
+
+
+def invalidate_cached(cache: RepoCache | None, *keys: CacheKey) -> None:
+    if cache is not None:
+        cache.invalidate(*keys)
@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Mapping
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, TypedDict
@@ -17,11 +18,16 @@ from daily_flow.db.errors import (
     UnknownFieldError,
     map_integrity_error,
 )
+from daily_flow.db.repositories.batching import SQLITE_MAX_VARIABLES, align_row_keys, chunk_rows
+from daily_flow.db.repositories.cache import CacheKey, RepoCache, get_cached, invalidate_cached
+from daily_flow.db.repositories.feature_store_repo import invalidate_feature_store_days
+from daily_flow.db.repositories.ingest_fingerprint_repo import forget_day_fingerprints
 from daily_flow.db.repositories.mood_log_repo import NON_UPDATABLE
 from daily_flow.db.schema import common_mood_log, mood_tag_impact
 
 ALLOWED_COMMON_MOOD_FIELDS = {"mood", "note"}
-COMMON_MOOD_NON_UPDATABLE = {"day", "id", "created_at"}
+# updated_at ставлять тригери (db/schema/mood.py)
+COMMON_MOOD_NON_UPDATABLE = {"day", "id", "created_at", "updated_at"}
 ALLOWED_MOOD_TAG_FIELDS = {"tag", "impact"}
 
 logger = logging.getLogger(__name__)
@@ -60,11 +66,13 @@ class BatchCommonMoodLogUpsertResult:
     rows_written: int
     min_day: date | None
     max_day: date | None
+    chunk_seconds: tuple[float, ...] = ()
 
 
 class CommonMoodLogRepo:
-    def __init__(self, engine: AsyncEngine) -> None:
+    def __init__(self, engine: AsyncEngine, cache: RepoCache | None = None) -> None:
         self._engine = engine
+        self._cache = cache
 
     @staticmethod
     def _to_common_mood_log(row_mapping: Mapping[str, Any]) -> CommonMoodLog:
@@ -126,6 +134,8 @@ class CommonMoodLogRepo:
 
                 res = await conn.execute(stmt)
                 row = res.mappings().one()
+                await invalidate_feature_store_days(conn, [day])
+                await forget_day_fingerprints(conn, common_mood_log.name, [day])
                 return self._to_common_mood_log(row)
         except IntegrityError as e:
             logger.exception(
@@ -143,18 +153,20 @@ class CommonMoodLogRepo:
                 rows_in=0, rows_written=0, min_day=None, max_day=None
             )
 
-        flattened_data = []
-        for p in payload:
-            if not p.get("day"):
-                raise EmptyUpsertPayloadError("There is no day value to upsert common mood log")
-            self._common_mood_log_payload_validator(payload=p.get("values"))
-            flattened_data.append({"day": p["day"], **p["values"]})
+        async def single_chunk() -> AsyncIterator[list[DayPayload]]:
+            yield payload
 
-        rows_in = len(payload)
-        min_day = min(p["day"] for p in payload)
-        max_day = max(p["day"] for p in payload)
+        return await self.batch_upsert_common_mood_log_chunks(single_chunk())
 
-        stmt = sqlite_insert(common_mood_log).values(flattened_data)
+    async def batch_upsert_common_mood_log_chunks(
+        self, payload_chunks: AsyncIterable[list[DayPayload]]
+    ) -> BatchCommonMoodLogUpsertResult:
+        """
+        Upserts payload chunks as they arrive, all in one transaction (see
+        MoodLogRepo.batch_upsert_mood_log_chunks): a streamed CSV is loaded whole or not at
+        all, so a failed run leaves no partial load behind.
+        """
+        stmt = sqlite_insert(common_mood_log)
 
         upsert_stmt = stmt.on_conflict_do_update(
             index_elements=[common_mood_log.c.day],
@@ -167,19 +179,42 @@ class CommonMoodLogRepo:
             },
         )
 
+        days: list[date] = []
+        chunk_seconds = []
+        rows_written = 0
         try:
             async with self._engine.begin() as conn:
-                res: CursorResult = await conn.execute(upsert_stmt)
-                rows_written = int(res.rowcount or 0)
+                async for payload in payload_chunks:
+                    flattened_data = []
+                    for p in payload:
+                        if not p.get("day"):
+                            raise EmptyUpsertPayloadError(
+                                "There is no day value to upsert common mood log"
+                            )
+                        self._common_mood_log_payload_validator(payload=p.get("values"))
+                        flattened_data.append({"day": p["day"], **p["values"]})
+                    days.extend(p["day"] for p in payload)
+
+                    for chunk in chunk_rows(align_row_keys(flattened_data)):
+                        chunk_started = time.perf_counter()
+                        res: CursorResult = await conn.execute(upsert_stmt, chunk)
+                        rows_written += int(res.rowcount or 0)
+                        chunk_seconds.append(time.perf_counter() - chunk_started)
+
+                await invalidate_feature_store_days(conn, days)
 
                 return BatchCommonMoodLogUpsertResult(
-                    rows_in=rows_in, rows_written=rows_written, min_day=min_day, max_day=max_day
+                    rows_in=len(days),
+                    rows_written=rows_written,
+                    min_day=min(days, default=None),
+                    max_day=max(days, default=None),
+                    chunk_seconds=tuple(chunk_seconds),
                 )
         except IntegrityError as e:
             logger.exception(
                 "CommonMoodLogRepo.batch_upsert_common_mood_logs failed (min_day=%s, max_day=%s)",
-                str(min_day),
-                str(max_day),
+                str(min(days, default=None)),
+                str(max(days, default=None)),
             )
             raise map_integrity_error(e, common_mood_log.name) from e
 
@@ -191,6 +226,21 @@ class CommonMoodLogRepo:
             row = res.mappings().one_or_none()
             return self._to_common_mood_log(row) if row else None
 
+    async def get_updated_at_by_day(self, days: list[date]) -> dict[date, datetime]:
+        unique_days = sorted(set(days))
+        updated_at: dict[date, datetime] = {}
+
+        async with self._engine.connect() as conn:
+            for start in range(0, len(unique_days), SQLITE_MAX_VARIABLES):
+                days_chunk = unique_days[start : start + SQLITE_MAX_VARIABLES]
+                stmt = select(common_mood_log.c.day, common_mood_log.c.updated_at).where(
+                    common_mood_log.c.day.in_(days_chunk)
+                )
+                res = await conn.execute(stmt)
+                updated_at.update({row.day: row.updated_at for row in res})
+
+        return updated_at
+
     async def upsert_tag_by_day(self, day: date, payload: dict[str, Any]) -> MoodTagImpact:
         if not payload or all(p is None for p in payload.values()):
             raise EmptyUpsertPayloadError("No fields to upsert")
@@ -252,6 +302,8 @@ class CommonMoodLogRepo:
                 list(payload.keys()),
             )
             raise map_integrity_error(e, mood_tag_impact.name) from e
+        finally:
+            invalidate_cached(self._cache, CacheKey.MOOD_TAGS)
 
     async def get_tags_by_day(self, day: date) -> list[MoodTagImpact]:
         async with self._engine.connect() as conn:
@@ -293,9 +345,16 @@ class CommonMoodLogRepo:
             )
 
             res: CursorResult = await conn.execute(stmt)
-            return int(res.rowcount or 0)
+            deleted = int(res.rowcount or 0)
+
+        if deleted:
+            invalidate_cached(self._cache, CacheKey.MOOD_TAGS)
+        return deleted
 
     async def get_all_unique_tags(self) -> list[str]:
+        return list(await get_cached(self._cache, CacheKey.MOOD_TAGS, self._load_all_unique_tags))
+
+    async def _load_all_unique_tags(self) -> list[str]:
         async with self._engine.connect() as conn:
             stmt = select(mood_tag_impact.c.tag).distinct().order_by(mood_tag_impact.c.tag)
 
@@ -0,0 +1,41 @@
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from daily_flow.db.schema import feature_store_invalidation
+
+
+async def invalidate_feature_store_days(conn: AsyncConnection, days: Iterable[date]) -> None:
+    """
+    Marks days as stale for the feature store refresh job. Call it inside the transaction
+    that writes the mood data, so the invalidation commits (or rolls back) together with it.
+    """
+    unique_days = sorted(set(days))
+    if not unique_days:
+        return
+
+    stmt = sqlite_insert(feature_store_invalidation).on_conflict_do_update(
+        index_elements=[feature_store_invalidation.c.day],
+        set_={
+            "revision": feature_store_invalidation.c.revision + 1,
+            "invalidated_at": func.current_timestamp(),
+        },
+    )
+
+    # executemany: кількість днів не впирається в ліміт bound-параметрів SQLite
+    await conn.execute(stmt, [{"day": d} for d in unique_days])
+
+
+class FeatureStoreRepo:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    async def count_invalidated_days(self) -> int:
+        stmt = select(func.count()).select_from(feature_store_invalidation)
+
+        async with self._engine.connect() as conn:
+            res = await conn.execute(stmt)
+            return int(res.scalar_one())
@@ -16,6 +16,8 @@ from daily_flow.db.errors import (
     UnknownFieldError,
     map_integrity_error,
 )
+from daily_flow.db.repositories.cache import CacheKey, RepoCache, get_cached, invalidate_cached
+from daily_flow.db.repositories.pagination import Page, PageCursor, fetch_page
 from daily_flow.db.schema import idea, idea_sphere, sphere
 
 logger = logging.getLogger(__name__)
@@ -49,8 +51,9 @@ class Sphere:
 
 
 class IdeaRepo:
-    def __init__(self, engine: AsyncEngine) -> None:
+    def __init__(self, engine: AsyncEngine, cache: RepoCache | None = None) -> None:
         self._engine = engine
+        self._cache = cache
 
     @staticmethod
     def _to_idea(row_mapping: Mapping[str, Any]) -> Idea:
@@ -108,6 +111,8 @@ class IdeaRepo:
                 description,
             )
             raise map_integrity_error(e, sphere.name) from e
+        finally:
+            invalidate_cached(self._cache, CacheKey.SPHERES)
 
     async def upsert_idea(self, title: str, payload: dict[str, Any]) -> Idea:
         title = (title or "").strip()
@@ -196,7 +201,11 @@ class IdeaRepo:
 
         async with self._engine.begin() as conn:
             res: CursorResult = await conn.execute(stmt)
-            return int(res.rowcount or 0)
+            deleted = int(res.rowcount or 0)
+
+        if deleted:
+            invalidate_cached(self._cache, CacheKey.SPHERES)
+        return deleted
 
     async def get_ideas_by_sphere(self, sphere_id: int) -> list[Idea]:
         stmt = (
@@ -217,7 +226,18 @@ class IdeaRepo:
             rows = res.mappings().all()
             return [self._to_idea(row) for row in rows]
 
+    async def get_ideas_page(self, limit: int, cursor: PageCursor | None = None) -> Page[Idea]:
+        if not limit or limit <= 0:
+            raise MissingRequiredFieldError("limit must be > 0")
+
+        async with self._engine.connect() as conn:
+            page = await fetch_page(conn, select(*idea.c), (idea.c.title, idea.c.id), limit, cursor)
+            return page.map(self._to_idea)
+
     async def get_all_spheres(self) -> list[Sphere]:
+        return list(await get_cached(self._cache, CacheKey.SPHERES, self._load_all_spheres))
+
+    async def _load_all_spheres(self) -> list[Sphere]:
         async with self._engine.connect() as conn:
             res = await conn.execute(select(*sphere.c))
             rows = res.mappings().all()
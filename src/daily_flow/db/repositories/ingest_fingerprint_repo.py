@@ -0,0 +1,64 @@
+from collections.abc import Iterable, Mapping
+from datetime import date
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from daily_flow.db.schema import ingest_day_fingerprint
+
+
+async def forget_day_fingerprints(
+    conn: AsyncConnection, dataset: str, days: Iterable[date]
+) -> None:
+    """
+    Drops fingerprints of days written outside of file ingest (e.g. from the bot), so the
+    next ingest of an unchanged export loads these days again instead of skipping them.
+    """
+    unique_days = sorted(set(days))
+    if not unique_days:
+        return
+
+    stmt = delete(ingest_day_fingerprint).where(
+        ingest_day_fingerprint.c.dataset == dataset,
+        ingest_day_fingerprint.c.day.in_(unique_days),
+    )
+    await conn.execute(stmt)
+
+
+class IngestFingerprintRepo:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    async def get_day_fingerprints(self, dataset: str) -> dict[date, int]:
+        stmt = select(ingest_day_fingerprint.c.day, ingest_day_fingerprint.c.fingerprint).where(
+            ingest_day_fingerprint.c.dataset == dataset
+        )
+
+        async with self._engine.connect() as conn:
+            res = await conn.execute(stmt)
+            return {row.day: row.fingerprint for row in res}
+
+    async def upsert_day_fingerprints(self, dataset: str, fingerprints: Mapping[date, int]) -> int:
+        if not fingerprints:
+            return 0
+
+        stmt = sqlite_insert(ingest_day_fingerprint)
+        upsert_stmt = stmt.on_conflict_do_update(
+            index_elements=[ingest_day_fingerprint.c.dataset, ingest_day_fingerprint.c.day],
+            set_={
+                "fingerprint": stmt.excluded.fingerprint,
+                "updated_at": func.current_timestamp(),
+            },
+        )
+
+        rows = [{"dataset": dataset, "day": d, "fingerprint": fp} for d, fp in fingerprints.items()]
+        async with self._engine.begin() as conn:
+            # executemany: кількість днів не впирається в ліміт bound-параметрів SQLite
+            await conn.execute(upsert_stmt, rows)
+
+        return len(rows)
+
+    async def forget_day_fingerprints(self, dataset: str, days: Iterable[date]) -> None:
+        async with self._engine.begin() as conn:
+            await forget_day_fingerprints(conn, dataset, days)
@@ -0,0 +1,131 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, TypedDict
+
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from daily_flow.db.repositories.batching import SQLITE_MAX_VARIABLES
+from daily_flow.db.schema import ingest_quarantine
+
+
+class QuarantinePayload(TypedDict):
+    row_index: int
+    issue_codes: list[str]
+    payload: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class QuarantinedRow:
+    id: int
+    ingest_run_id: int
+    dataset: str
+    row_index: int
+    issue_codes: list[str]
+    payload: dict[str, Any]
+    created_at: datetime
+
+
+class IngestQuarantineRepo:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    @staticmethod
+    def _to_quarantined_row(row_mapping: Mapping[str, Any]) -> QuarantinedRow:
+        return QuarantinedRow(
+            id=row_mapping["id"],
+            ingest_run_id=row_mapping["ingest_run_id"],
+            dataset=row_mapping["dataset"],
+            row_index=row_mapping["row_index"],
+            issue_codes=row_mapping["issue_codes"],
+            payload=row_mapping["payload"],
+            created_at=row_mapping["created_at"],
+        )
+
+    async def add_quarantined_rows(
+        self, ingest_run_id: int, dataset: str, rows: list[QuarantinePayload]
+    ) -> int:
+        """
+        Quarantined days get no fingerprint, so every re-ingest of the file rejects them again.
+        The new rows replace the dataset's earlier rows of the same days (rows without a day
+        replace identical payloads): quarantine keeps only the latest version of a day, and
+        revalidation does not see stale copies as duplicate days.
+        """
+        if not rows:
+            return 0
+
+        values = [{"ingest_run_id": ingest_run_id, "dataset": dataset, **row} for row in rows]
+
+        payload_day = func.json_extract(ingest_quarantine.c.payload, "$.day")
+        days = sorted({row["payload"]["day"] for row in rows if row["payload"].get("day")})
+        dayless_payloads = [row["payload"] for row in rows if not row["payload"].get("day")]
+
+        async with self._engine.begin() as conn:
+            for start in range(0, len(days), SQLITE_MAX_VARIABLES):
+                days_chunk = days[start : start + SQLITE_MAX_VARIABLES]
+                await conn.execute(
+                    delete(ingest_quarantine).where(
+                        ingest_quarantine.c.dataset == dataset, payload_day.in_(days_chunk)
+                    )
+                )
+
+            if dayless_payloads:
+                res = await conn.execute(
+                    select(ingest_quarantine.c.id, ingest_quarantine.c.payload).where(
+                        ingest_quarantine.c.dataset == dataset, payload_day.is_(None)
+                    )
+                )
+                stale_ids = [row.id for row in res if row.payload in dayless_payloads]
+                for start in range(0, len(stale_ids), SQLITE_MAX_VARIABLES):
+                    ids_chunk = stale_ids[start : start + SQLITE_MAX_VARIABLES]
+                    await conn.execute(
+                        delete(ingest_quarantine).where(ingest_quarantine.c.id.in_(ids_chunk))
+                    )
+
+            # один executemany-insert на весь карантин запуску
+            await conn.execute(ingest_quarantine.insert(), values)
+
+        return len(values)
+
+    async def get_quarantined_rows(self, dataset: str) -> list[QuarantinedRow]:
+        stmt = (
+            select(*ingest_quarantine.c)
+            .where(ingest_quarantine.c.dataset == dataset)
+            .order_by(ingest_quarantine.c.ingest_run_id.asc(), ingest_quarantine.c.row_index.asc())
+        )
+
+        async with self._engine.connect() as conn:
+            res = await conn.execute(stmt)
+            return [self._to_quarantined_row(row) for row in res.mappings().all()]
+
+    async def resolve_quarantined_rows(self, row_ids: list[int]) -> int:
+        if not row_ids:
+            return 0
+
+        deleted = 0
+        async with self._engine.begin() as conn:
+            for start in range(0, len(row_ids), SQLITE_MAX_VARIABLES):
+                ids_chunk = row_ids[start : start + SQLITE_MAX_VARIABLES]
+                stmt = delete(ingest_quarantine).where(ingest_quarantine.c.id.in_(ids_chunk))
+                res = await conn.execute(stmt)
+                deleted += int(res.rowcount or 0)
+
+        return deleted
+
+    async def update_issue_codes(self, issue_codes: Mapping[int, list[str]]) -> int:
+        if not issue_codes:
+            return 0
+
+        stmt = (
+            update(ingest_quarantine)
+            .where(ingest_quarantine.c.id == bindparam("row_id"))
+            .values(issue_codes=bindparam("codes"))
+        )
+
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                stmt, [{"row_id": row_id, "codes": codes} for row_id, codes in issue_codes.items()]
+            )
+
+        return len(issue_codes)
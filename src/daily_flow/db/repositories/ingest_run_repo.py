@@ -4,7 +4,7 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import exists, insert, select
+from sqlalchemy import exists, insert, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
@@ -105,12 +105,36 @@ class IngestRunRepo:
     async def is_already_processed(self, file_hash: str) -> bool:
         try:
             async with self._engine.connect() as conn:
-                return bool(
-                    await conn.scalar(select(exists().where(ingest_run.c.file_hash == file_hash)))
+                # FAILED-запуск нічого не залишає в БД, тож такий файл можна інжестити знову
+                stmt = select(
+                    exists().where(
+                        ingest_run.c.file_hash == file_hash,
+                        ingest_run.c.status != IngestStatusType.FAILED,
+                    )
                 )
+                return bool(await conn.scalar(stmt))
         except IntegrityError as e:
             logger.exception(
                 "IngestRunRepo.is_already_processed failed (file_hash=%s)",
                 file_hash,
             )
             raise map_integrity_error(e, ingest_run.name) from e
+
+    async def get_processed_hashes(self, file_hashes: list[str]) -> set[str]:
+        if not file_hashes:
+            return set()
+
+        stmt = select(ingest_run.c.file_hash).where(
+            ingest_run.c.file_hash.in_(file_hashes),
+            ingest_run.c.status != IngestStatusType.FAILED,
+        )
+
+        async with self._engine.connect() as conn:
+            res = await conn.execute(stmt)
+            return set(res.scalars().all())
+
+    async def update_metrics(self, run_id: int, metrics: dict[str, Any]) -> None:
+        stmt = update(ingest_run).where(ingest_run.c.id == run_id).values(metrics=metrics)
+
+        async with self._engine.begin() as conn:
+            await conn.execute(stmt)
@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Mapping
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, TypedDict
@@ -10,6 +11,9 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from daily_flow.db.errors import EmptyUpsertPayloadError, UnknownFieldError, map_integrity_error
+from daily_flow.db.repositories.batching import SQLITE_MAX_VARIABLES, align_row_keys, chunk_rows
+from daily_flow.db.repositories.feature_store_repo import invalidate_feature_store_days
+from daily_flow.db.repositories.ingest_fingerprint_repo import forget_day_fingerprints
 from daily_flow.db.schema import mood_log
 
 ALLOWED_SCORE_FIELDS = {
@@ -26,7 +30,8 @@ ALLOWED_SCORE_FIELDS = {
     "sleep",
 }
 
-NON_UPDATABLE = {"day", "id", "created_at"}
+# updated_at ставлять тригери (db/schema/mood.py)
+NON_UPDATABLE = {"day", "id", "created_at", "updated_at"}
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +79,7 @@ class BatchMoodLogUpsertResult:
     rows_written: int
     min_day: date | None
     max_day: date | None
+    chunk_seconds: tuple[float, ...] = ()
 
 
 class MoodLogRepo:
@@ -130,6 +136,8 @@ class MoodLogRepo:
             async with self._engine.begin() as conn:
                 res = await conn.execute(stmt)
                 row = res.mappings().one()
+                await invalidate_feature_store_days(conn, [day])
+                await forget_day_fingerprints(conn, mood_log.name, [day])
                 return self._to_mood_log(row)
         except IntegrityError as e:
             logger.exception(
@@ -139,10 +147,7 @@ class MoodLogRepo:
             )
             raise map_integrity_error(e, mood_log.name) from e
 
-    async def batch_upsert_mood_logs(self, payload: list[DayPayload]) -> BatchMoodLogUpsertResult:
-        if not payload:
-            return BatchMoodLogUpsertResult(rows_in=0, rows_written=0, min_day=None, max_day=None)
-
+    def _flatten_payload(self, payload: list[DayPayload]) -> list[dict[str, Any]]:
         flattened_data = []
         for p in payload:
             if not p.get("day"):
@@ -150,11 +155,26 @@ class MoodLogRepo:
             self._mood_values_validator(values=p["values"])
             flattened_data.append({"day": p["day"], **p["values"]})
 
-        rows_in = len(payload)
-        min_day = min(p["day"] for p in payload)
-        max_day = max(p["day"] for p in payload)
+        return flattened_data
+
+    async def batch_upsert_mood_logs(self, payload: list[DayPayload]) -> BatchMoodLogUpsertResult:
+        if not payload:
+            return BatchMoodLogUpsertResult(rows_in=0, rows_written=0, min_day=None, max_day=None)
+
+        async def single_chunk() -> AsyncIterator[list[DayPayload]]:
+            yield payload
 
-        stmt = sqlite_insert(mood_log).values(flattened_data)
+        return await self.batch_upsert_mood_log_chunks(single_chunk())
+
+    async def batch_upsert_mood_log_chunks(
+        self, payload_chunks: AsyncIterable[list[DayPayload]]
+    ) -> BatchMoodLogUpsertResult:
+        """
+        Upserts payload chunks as they arrive, all in one transaction: the producer can build
+        the next chunk while the current one is written, and a failure still rolls back the
+        whole batch.
+        """
+        stmt = sqlite_insert(mood_log)
 
         upsert_stmt = stmt.on_conflict_do_update(
             index_elements=[mood_log.c.day],
@@ -167,19 +187,37 @@ class MoodLogRepo:
             },
         )
 
+        days: list[date] = []
+        chunk_seconds = []
+        rows_written = 0
         try:
+            # один підготовлений upsert і executemany по чанках рядків в одній транзакції:
+            # без гігантського VALUES і довгої компіляції
             async with self._engine.begin() as conn:
-                res: CursorResult = await conn.execute(upsert_stmt)
-                rows_written = int(res.rowcount or 0)
+                async for payload in payload_chunks:
+                    flattened_data = self._flatten_payload(payload)
+                    days.extend(p["day"] for p in payload)
+
+                    for chunk in chunk_rows(align_row_keys(flattened_data)):
+                        chunk_started = time.perf_counter()
+                        res: CursorResult = await conn.execute(upsert_stmt, chunk)
+                        rows_written += int(res.rowcount or 0)
+                        chunk_seconds.append(time.perf_counter() - chunk_started)
+
+                await invalidate_feature_store_days(conn, days)
 
                 return BatchMoodLogUpsertResult(
-                    rows_in=rows_in, rows_written=rows_written, min_day=min_day, max_day=max_day
+                    rows_in=len(days),
+                    rows_written=rows_written,
+                    min_day=min(days, default=None),
+                    max_day=max(days, default=None),
+                    chunk_seconds=tuple(chunk_seconds),
                 )
         except IntegrityError as e:
             logger.exception(
                 "MoodLogRepo.batch_upsert_mood_logs failed (min_day=%s, max_day=%s)",
-                str(min_day),
-                str(max_day),
+                str(min(days, default=None)),
+                str(max(days, default=None)),
             )
             raise map_integrity_error(e, mood_log.name) from e
 
@@ -191,6 +229,21 @@ class MoodLogRepo:
             row = res.mappings().one_or_none()
             return self._to_mood_log(row) if row else None
 
+    async def get_updated_at_by_day(self, days: list[date]) -> dict[date, datetime]:
+        unique_days = sorted(set(days))
+        updated_at: dict[date, datetime] = {}
+
+        async with self._engine.connect() as conn:
+            for start in range(0, len(unique_days), SQLITE_MAX_VARIABLES):
+                days_chunk = unique_days[start : start + SQLITE_MAX_VARIABLES]
+                stmt = select(mood_log.c.day, mood_log.c.updated_at).where(
+                    mood_log.c.day.in_(days_chunk)
+                )
+                res = await conn.execute(stmt)
+                updated_at.update({row.day: row.updated_at for row in res})
+
+        return updated_at
+
     async def list_by_date_range(self, start: date, end: date) -> list[MoodLog]:
         stmt = (
             select(*mood_log.c)
@@ -208,4 +261,8 @@ class MoodLogRepo:
 
         async with self._engine.begin() as conn:
             res: CursorResult = await conn.execute(stmt)
-            return int(res.rowcount or 0)
+            deleted = int(res.rowcount or 0)
+            if deleted:
+                await invalidate_feature_store_days(conn, [day])
+                await forget_day_fingerprints(conn, mood_log.name, [day])
+            return deleted
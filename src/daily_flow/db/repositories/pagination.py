@@ -0,0 +1,93 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Generic, TypeVar
+
+from sqlalchemy import Column, RowMapping, Select, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+class PageDirection(StrEnum):
+    NEXT = "next"
+    PREV = "prev"
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Keyset cursor: the id of the boundary row (last row of the current page for NEXT, first
+    for PREV). The sort key of that row is read back from the table, so the cursor stays small
+    enough for Telegram callback data (64 bytes) even for long titles.
+    """
+
+    row_id: int
+    direction: PageDirection
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: list[T]
+    has_next: bool
+    has_prev: bool
+
+    def map(self, func: Callable[[T], U]) -> "Page[U]":
+        return Page(
+            items=[func(item) for item in self.items],
+            has_next=self.has_next,
+            has_prev=self.has_prev,
+        )
+
+
+async def fetch_page(
+    conn: AsyncConnection,
+    stmt: Select,
+    sort_columns: Sequence[Column],
+    limit: int,
+    cursor: PageCursor | None = None,
+    descending: bool = False,
+) -> Page[RowMapping]:
+    """
+    One keyset page of stmt ordered by sort_columns, the last of which must be the unique id.
+    Reads limit + 1 rows: the extra row only tells whether there is one more page.
+    """
+    id_column = sort_columns[-1]
+
+    boundary = None
+    if cursor is not None:
+        res = await conn.execute(select(*sort_columns).where(id_column == cursor.row_id))
+        boundary = res.one_or_none()
+        # межовий рядок уже видалили — показуємо першу сторінку
+        if boundary is None:
+            cursor = None
+
+    direction = cursor.direction if cursor is not None else PageDirection.NEXT
+    # попередня сторінка читається у зворотному порядку і розвертається нижче
+    ascending = (direction is PageDirection.NEXT) != descending
+
+    if boundary is not None:
+        key = tuple_(*sort_columns)
+        bound = tuple_(
+            *(
+                literal(value, column.type)
+                for column, value in zip(sort_columns, boundary, strict=True)
+            )
+        )
+        stmt = stmt.where(key > bound if ascending else key < bound)
+
+    order_by = [column.asc() if ascending else column.desc() for column in sort_columns]
+    res = await conn.execute(stmt.order_by(*order_by).limit(limit + 1))
+    rows = list(res.mappings().all())
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if cursor is None:
+        return Page(items=rows, has_next=has_more, has_prev=False)
+    if direction is PageDirection.NEXT:
+        return Page(items=rows, has_next=has_more, has_prev=True)
+
+    rows.reverse()
+    return Page(items=rows, has_next=True, has_prev=has_more)
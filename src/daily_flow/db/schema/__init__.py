@@ -1,6 +1,7 @@
 from .activity import activity, activity_usage, category, category_activity
+from .analytics import feature_store_invalidation, mood_mart_watermark
 from .applied_migration import applied_migration
-from .audit import ingest_run
+from .audit import ingest_day_fingerprint, ingest_quarantine, ingest_run
 from .base import metadata
 from .idea import idea, idea_sphere, sphere
 from .mood import common_mood_log, mood_log, mood_tag_impact
@@ -10,8 +11,12 @@ __all__ = [
     "activity_usage",
     "category",
     "category_activity",
+    "mood_mart_watermark",
+    "feature_store_invalidation",
     "applied_migration",
     "ingest_run",
+    "ingest_day_fingerprint",
+    "ingest_quarantine",
     "metadata",
     "idea",
     "idea_sphere",
@@ -292,6 +292,17 @@ activity_usage = Table(
     comment="Activity usage log: when it happened, how long it took, and how state/ratings change",
 )
 
+# Історія за період і "останні N" читаються за used_at, історія активності — за activity_id
+# з сортуванням від нових; той самий індекс обслуговує FK-каскад при видаленні активності
+Index("ix_activity_usage_used_at", activity_usage.c.used_at)
+Index(
+    "ix_activity_usage_activity_id_used_at",
+    activity_usage.c.activity_id,
+    activity_usage.c.used_at.desc(),
+)
+# список активностей гортається сторінками за (title, id): id — це rowid у кінці індексу
+Index("ix_activity_title", activity.c.title)
+
 category = Table(
     "category",
     metadata,
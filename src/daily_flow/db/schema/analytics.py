@@ -0,0 +1,70 @@
+from sqlalchemy import Column, Date, DateTime, Integer, Table, Text, UniqueConstraint, text
+
+from .base import metadata
+
+mood_mart_watermark = Table(
+    "mood_mart_watermark",
+    metadata,
+    Column("id", Integer, primary_key=True, comment="Unique watermark identifier."),
+    Column(
+        "snapshot_path",
+        Text,
+        nullable=False,
+        comment="Path to the persisted mood mart snapshot this watermark describes.",
+    ),
+    Column(
+        "snapshot_version",
+        Integer,
+        nullable=False,
+        comment="Snapshot layout version; a mismatch forces a full rebuild.",
+    ),
+    Column(
+        "max_updated_at",
+        Text,
+        nullable=True,
+        comment="Latest updated_at seen in mood_log/common_mood_log when the snapshot was built.",
+    ),
+    Column("max_day", Date, nullable=True, comment="Latest day stored in the snapshot."),
+    Column(
+        "mood_log_rows",
+        Integer,
+        nullable=False,
+        comment="Number of mood_log rows when the snapshot was built.",
+    ),
+    Column(
+        "common_mood_log_rows",
+        Integer,
+        nullable=False,
+        comment="Number of common_mood_log rows when the snapshot was built.",
+    ),
+    Column(
+        "built_at",
+        DateTime,
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+        comment="When the snapshot was (re)built.",
+    ),
+    UniqueConstraint("snapshot_path", name="uq_mood_mart_watermark_snapshot_path"),
+    comment="Build state of the persisted mood mart snapshot used for incremental refreshes.",
+)
+
+feature_store_invalidation = Table(
+    "feature_store_invalidation",
+    metadata,
+    Column("day", Date, primary_key=True, comment="Day whose mood data changed."),
+    Column(
+        "revision",
+        Integer,
+        nullable=False,
+        server_default=text("1"),
+        comment="Bumped on every write of the day; the refresh job clears only revisions it saw.",
+    ),
+    Column(
+        "invalidated_at",
+        DateTime,
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+        comment="When the day was last invalidated.",
+    ),
+    comment="Days written since the last feature store refresh.",
+)
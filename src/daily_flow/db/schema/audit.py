@@ -1,6 +1,17 @@
 from enum import StrEnum
 
-from sqlalchemy import JSON, Column, DateTime, Enum, Integer, Table, Text
+from sqlalchemy import (
+    JSON,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    Table,
+    Text,
+    text,
+)
 
 from .base import metadata
 
@@ -72,3 +83,71 @@ ingest_run = Table(
         comment="Detailed error description or traceback if the status is FAILED",
     ),
 )
+
+ingest_day_fingerprint = Table(
+    "ingest_day_fingerprint",
+    metadata,
+    Column("dataset", Text, primary_key=True, comment="Dataset the day was ingested into"),
+    Column("day", Date, primary_key=True, comment="Day whose source row was loaded"),
+    Column(
+        "fingerprint",
+        Integer,
+        nullable=False,
+        comment="64-bit hash of the normalized source row loaded for the day (signed view)",
+    ),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+        comment="When the fingerprint was written by a successful ingest",
+    ),
+    comment="Per-day content fingerprints from the last successful ingest, to load only deltas",
+)
+
+ingest_quarantine = Table(
+    "ingest_quarantine",
+    metadata,
+    Column("id", Integer, primary_key=True, comment="Unique quarantined row identifier"),
+    Column(
+        "ingest_run_id",
+        Integer,
+        ForeignKey("ingest_run.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="FK to ingest_run.id. The run that rejected the row",
+    ),
+    Column(
+        "dataset",
+        Text,
+        nullable=False,
+        index=True,
+        comment="Dataset the row was meant for; re-validation picks rows by it",
+    ),
+    Column(
+        "row_index",
+        Integer,
+        nullable=False,
+        comment="Index of the row in the normalized source frame",
+    ),
+    Column(
+        "issue_codes",
+        JSON,
+        nullable=False,
+        comment="Validation error/warning codes that hit the row",
+    ),
+    Column(
+        "payload",
+        JSON,
+        nullable=False,
+        comment="Normalized row values, enough to re-validate without the source file",
+    ),
+    Column(
+        "created_at",
+        DateTime,
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+        comment="When the row was quarantined",
+    ),
+    comment="Rows rejected by ingest validation, kept for re-validation after rule fixes",
+)
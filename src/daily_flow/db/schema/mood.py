@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    DDL,
     CheckConstraint,
     Column,
     Date,
@@ -8,6 +9,7 @@ from sqlalchemy import (
     Table,
     Text,
     UniqueConstraint,
+    event,
     text,
 )
 
@@ -31,6 +33,12 @@ common_mood_log = Table(
         nullable=False,
         comment="When the entry was created (UTC, CURRENT_TIMESTAMP).",
     ),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=True,
+        comment="When the entry was last written (set by the touch triggers below).",
+    ),
     UniqueConstraint("day", name="uq_common_mood_log_day"),
     CheckConstraint("mood BETWEEN 1 AND 7", name="ck_common_mood_log_mood_1_7"),
     comment="One overall daily mood score + an optional note.",
@@ -90,6 +98,12 @@ mood_log = Table(
         nullable=False,
         comment="When the entry was created (UTC, CURRENT_TIMESTAMP).",
     ),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=True,
+        comment="When the entry was last written (set by the touch triggers below).",
+    ),
     UniqueConstraint("day", name="uq_mood_log_day"),
     # CHECK 1..4 (allow NULL)
     CheckConstraint("joy IS NULL OR (joy BETWEEN 1 AND 4)", name="ck_mood_joy_1_4"),
@@ -109,3 +123,27 @@ mood_log = Table(
     CheckConstraint("sleep IS NULL OR (sleep BETWEEN 1 AND 4)", name="ck_mood_sleep_1_4"),
     comment="Daily mood/state ratings (scale 1..4, NULL = not filled).",
 )
+
+
+def touch_updated_at_triggers(table_name: str) -> tuple[str, str]:
+    """
+    updated_at is kept by triggers, so every write path (repository upserts, ingest, manual SQL)
+    bumps it; the incremental mood mart refresh reads the days changed since its watermark.
+    """
+    return (
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{table_name}_touch_insert
+AFTER INSERT ON {table_name} FOR EACH ROW WHEN NEW.updated_at IS NULL
+BEGIN
+    UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{table_name}_touch_update
+AFTER UPDATE ON {table_name} FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END""",
+    )
+
+
+for _table in (mood_log, common_mood_log):
+    for _trigger in touch_updated_at_triggers(_table.name):
+        event.listen(_table, "after_create", DDL(_trigger).execute_if(dialect="sqlite"))
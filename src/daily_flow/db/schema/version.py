@@ -1 +1 @@
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 4
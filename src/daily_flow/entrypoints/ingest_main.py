@@ -1,14 +1,49 @@
 import argparse
 import asyncio
+import cProfile
 
+from daily_flow.analytics.datasets.reader import close_analytics_connections
 from daily_flow.config.db import load_db_settings
 from daily_flow.config.paths import INGEST_DATA_DIR
-from daily_flow.ingest.cli import build_ingest_cli
+from daily_flow.db.engine import dispose_engine
+from daily_flow.db.schema.audit import IngestStatusType
+from daily_flow.ingest.cli import (
+    build_ingest_cli,
+    run_ingest_dir,
+    run_ingest_dry_run,
+    run_revalidate_quarantine,
+)
+from daily_flow.ingest.runner.batch import IngestBatchSummary
 from daily_flow.ingest.schemas.common_mood_log import COMMON_MOOD_LOG_INGEST_CONTRACT
 from daily_flow.ingest.schemas.mood_log import MOOD_LOG_INGEST_CONTRACT
+from daily_flow.ingest.validators.metrics import format_metrics_summary
+from daily_flow.utils.profiling import StageProfiler
 
 # common_mood_logs_29_01_2026.csv
 # ingest --file mood_logs_05_02_2026.xlsx --dataset mood_log
+# ingest --dir . --pattern "*_2026.*" --workers 4
+# ingest --revalidate --dataset mood_log
+# ingest --file mood_logs_05_02_2026.xlsx --dataset mood_log --dry-run --profile
+
+CONTRACTS = [MOOD_LOG_INGEST_CONTRACT, COMMON_MOOD_LOG_INGEST_CONTRACT]
+
+
+def print_summary(summary: IngestBatchSummary) -> None:
+    for result in summary.results:
+        line = f"{result.status:<8} {result.dataset:<16} {result.path.name}"
+        if result.status == IngestStatusType.SUCCESS:
+            line += f" ({result.rows_written} rows, {result.seconds:.2f}s)"
+        elif result.error_message:
+            line += f" ({result.error_message})"
+        print(line)
+
+    print(
+        f"Файлів: {len(summary.results)}, "
+        f"успішно: {summary.count(IngestStatusType.SUCCESS)}, "
+        f"пропущено: {summary.count(IngestStatusType.SKIPPED)}, "
+        f"з помилкою: {summary.count(IngestStatusType.FAILED)}, "
+        f"рядків записано: {summary.rows_written}, час: {summary.seconds:.2f}s"
+    )
 
 
 async def main_async() -> None:
@@ -16,32 +51,117 @@ async def main_async() -> None:
     try:
         parser = argparse.ArgumentParser(description="Ingest process")
 
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument("--file", type=str, help="The name of the file you want to ingest")
+        source.add_argument(
+            "--dir", type=str, help="Directory (relative to the ingest data dir) to ingest"
+        )
+        source.add_argument(
+            "--revalidate",
+            action="store_true",
+            help="Re-validate quarantined rows with the current rules instead of reading files",
+        )
+        parser.add_argument(
+            "--dataset",
+            type=str,
+            help="Name of the dataset to load data contract (required with --file)",
+        )
+        parser.add_argument("--pattern", type=str, default="*", help="Glob for files in --dir")
+        parser.add_argument("--workers", type=int, default=None, help="Parsing processes")
         parser.add_argument(
-            "--file", type=str, required=True, help="The name of the file you want to ingest"
+            "--profile",
+            action="store_true",
+            help="Time every stage and sample peak RSS; stored in ingest_run.metrics",
         )
         parser.add_argument(
-            "--dataset", type=str, required=True, help="Name of the dataset to load data contract"
+            "--profile-output",
+            type=str,
+            default=None,
+            help="Also dump a cProfile file (main thread only) to this path; implies --profile",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Parse, validate and clean without any DB writes",
         )
 
         args = parser.parse_args()
-        settings = load_db_settings()
+        settings = load_db_settings(profile="ingest")
+
+        contracts = CONTRACTS
+        if args.dataset is not None:
+            contracts = [c for c in CONTRACTS if c.dataset == args.dataset]
+            if not contracts:
+                raise ValueError(
+                    f"Unknown dataset '{args.dataset}'. Allowed: {[c.dataset for c in CONTRACTS]}"
+                )
+
+        is_profiled = args.profile or args.profile_output is not None
+        if (is_profiled or args.dry_run) and args.file is None:
+            parser.error("--profile/--profile-output/--dry-run work only with --file")
 
-        contracts = [MOOD_LOG_INGEST_CONTRACT, COMMON_MOOD_LOG_INGEST_CONTRACT]
-        contract = next((c for c in contracts if c.dataset == args.dataset), None)
-        if contract is None:
-            raise ValueError(
-                f"Unknown dataset '{args.dataset}'. Allowed: {[c.dataset for c in contracts]}"
+        if args.revalidate:
+            for result in await run_revalidate_quarantine(contracts, settings):
+                print(
+                    f"{result.dataset}: перевірено {result.rows_checked}, "
+                    f"знято з карантину {result.rows_resolved}, "
+                    f"вже є в таблиці {result.rows_superseded}, "
+                    f"лишилось {result.rows_still_quarantined}, "
+                    f"рядків записано {result.rows_written}"
+                )
+            return
+
+        if args.dir is not None:
+            summary = await run_ingest_dir(
+                directory=INGEST_DATA_DIR / args.dir,
+                pattern=args.pattern,
+                contracts=contracts,
+                db_settings=settings,
+                max_workers=args.workers,
             )
+            print_summary(summary)
+            return
+
+        if args.dataset is None:
+            parser.error("--dataset is required with --file")
 
         path = INGEST_DATA_DIR / args.file
 
-        cli = await build_ingest_cli(file_path=path, contract=contract, db_settings=settings)
-        ok = True
+        profiler = StageProfiler(enabled=is_profiled)
+        c_profiler = cProfile.Profile() if args.profile_output else None
+
+        if c_profiler is not None:
+            c_profiler.enable()
+        dry_run_metrics = None
+        try:
+            if args.dry_run:
+                dry_run_metrics = await run_ingest_dry_run(
+                    file_path=path, contract=contracts[0], profiler=profiler
+                )
+            else:
+                cli = await build_ingest_cli(
+                    file_path=path,
+                    contract=contracts[0],
+                    db_settings=settings,
+                    profiler=profiler,
+                )
+        finally:
+            if c_profiler is not None:
+                c_profiler.disable()
+                c_profiler.dump_stats(args.profile_output)
+
+        if is_profiled:
+            print(profiler.format())
+        if dry_run_metrics is not None:
+            print(f"Dry run: {format_metrics_summary(dry_run_metrics)}")
+            print("Dry run: дані перевірено, у БД нічого не записано")
+        ok = not args.dry_run
     finally:
         if cli is not None:
-            await cli.engine.dispose()
+            await dispose_engine(cli.engine)
             if ok:
                 print("Інжект успішний або вже був здійснений раніше")
+        close_analytics_connections()
 
 
 def main() -> None:
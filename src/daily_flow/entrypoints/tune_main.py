@@ -0,0 +1,79 @@
+import argparse
+from pathlib import Path
+
+from daily_flow.analytics.datasets.reader import close_analytics_connections
+from daily_flow.analytics.modeling.dataset import (
+    build_training_set,
+    build_training_set_from_store,
+)
+from daily_flow.analytics.modeling.publish import (
+    FORECAST_MODEL_PATH,
+    publish_forecast_model,
+    train_forecast_model,
+)
+from daily_flow.analytics.modeling.tuning import (
+    DEFAULT_STORAGE_PATH,
+    DEFAULT_STUDY_NAME,
+    get_best_catboost_params,
+    tune_catboost,
+)
+
+# tune_catboost --trials 100 --workers 4 --pruner median [--publish]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Optuna tuning of the final CatBoost model")
+
+    parser.add_argument("--study", type=str, default=DEFAULT_STUDY_NAME, help="Study name")
+    parser.add_argument(
+        "--storage",
+        type=Path,
+        default=DEFAULT_STORAGE_PATH,
+        help="Study storage file: *.journal (journal file) or *.db (SQLite)",
+    )
+    parser.add_argument("--trials", type=int, default=100, help="Total trials of the study")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel worker processes")
+    parser.add_argument(
+        "--pruner", choices=["median", "hyperband", "none"], default="median", help="Pruner"
+    )
+    parser.add_argument("--holdout", type=int, default=14, help="Last days left out of tuning")
+    parser.add_argument(
+        "--publish",
+        action="store_true",
+        help="Fit the best params on the whole feature store and publish the CBM model",
+    )
+    parser.add_argument(
+        "--model-path", type=Path, default=FORECAST_MODEL_PATH, help="Published CBM model file"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        X, y = build_training_set()
+        if args.holdout:
+            X, y = X.iloc[: -args.holdout], y.iloc[: -args.holdout]
+
+        study = tune_catboost(
+            X,
+            y,
+            study_name=args.study,
+            storage_path=args.storage,
+            n_trials=args.trials,
+            n_workers=args.workers,
+            pruner=args.pruner,
+        )
+
+        print(f"Best params: {get_best_catboost_params(study)}")
+        print(f"Objective value (CV MAE + std): {study.best_value:.4f}")
+
+        if args.publish:
+            # ознаки для прогнозу беруться з feature store, тому й фінальна модель вчиться на ньому
+            X_store, y_store = build_training_set_from_store(features=list(X.columns))
+            model = train_forecast_model(X_store, y_store, get_best_catboost_params(study))
+            print(f"Model published: {publish_forecast_model(model, args.model_path)}")
+    finally:
+        close_analytics_connections()
+
+
+if __name__ == "__main__":
+    main()
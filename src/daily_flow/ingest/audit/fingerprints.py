@@ -0,0 +1,62 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class DayDelta:
+    df: pd.DataFrame
+    # int64-відбитки рядків df з єдиним рядком на день (за індексом df)
+    fingerprints: pd.Series
+    days_skipped: int
+
+
+def fingerprint_rows(df: pd.DataFrame, columns: tuple[str, ...]) -> np.ndarray:
+    # хеш нормалізованих значень: 3 і 3.0 з різних клітинок Excel дають однаковий відбиток;
+    # знакове int64-представлення, щоб влізти в INTEGER SQLite
+    hashes = pd.util.hash_pandas_object(df[list(columns)], index=False)
+    return hashes.to_numpy().view(np.int64)
+
+
+def select_changed_days(
+    df: pd.DataFrame, columns: tuple[str, ...], known: Mapping[date, int]
+) -> DayDelta:
+    """
+    Keeps only rows whose day is new or whose content differs from the fingerprint stored by
+    the last successful ingest. Rows without a day and days present more than once are always
+    kept, so validation still reports them.
+    """
+    row_fingerprints = fingerprint_rows(df, columns)
+
+    day = df["day"]
+    is_single_day = day.notna() & ~day.duplicated(keep=False)
+
+    unchanged = np.zeros(len(df), dtype=bool)
+    if known:
+        known_days = pd.DatetimeIndex(list(known))
+        known_fingerprints = np.fromiter(known.values(), dtype=np.int64, count=len(known))
+
+        positions = known_days.get_indexer(day)
+        is_known = positions >= 0
+        unchanged[is_known] = known_fingerprints[positions[is_known]] == row_fingerprints[is_known]
+        unchanged &= is_single_day.to_numpy()
+
+    changed = ~unchanged
+    fingerprints = pd.Series(row_fingerprints, index=df.index)[changed & is_single_day]
+
+    return DayDelta(
+        df=df.loc[changed],
+        fingerprints=fingerprints,
+        days_skipped=int(unchanged.sum()),
+    )
+
+
+def get_loaded_fingerprints(delta: DayDelta, df_loaded: pd.DataFrame) -> dict[date, int]:
+    # відбитки зберігаються лише для днів, які справді записані (без карантину)
+    fingerprints = delta.fingerprints[delta.fingerprints.index.isin(df_loaded.index)]
+    days = delta.df.loc[fingerprints.index, "day"].dt.date
+
+    return dict(zip(days, fingerprints.tolist(), strict=True))
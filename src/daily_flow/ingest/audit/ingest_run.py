@@ -6,6 +6,7 @@ from typing import Any
 from daily_flow.db.repositories.ingest_run_repo import IngestRun, IngestRunRepo
 from daily_flow.db.schema.audit import IngestSourceType, IngestStatusType
 from daily_flow.utils.hash import calculate_file_hash
+from daily_flow.utils.profiling import StageProfiler
 
 # def ingest_skip_check():І
 
@@ -65,3 +66,14 @@ async def ingest_run(
         )
 
     return await ingest_run_repo.add_ingest(ingest_run_result)
+
+
+async def save_profile(
+    ingest_run_repo: IngestRunRepo, run: IngestRun, profiler: StageProfiler
+) -> None:
+    # окремий UPDATE після запису запуску, щоб у профіль потрапив і час самого аудиту
+    if not profiler.enabled:
+        return
+
+    metrics = {**(run.metrics or {}), "profile": profiler.to_metrics()}
+    await ingest_run_repo.update_metrics(run.id, metrics)
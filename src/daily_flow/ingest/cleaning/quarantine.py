@@ -0,0 +1,43 @@
+import json
+
+import pandas as pd
+
+from daily_flow.db.repositories.ingest_quarantine_repo import QuarantinePayload
+from daily_flow.ingest.cleaning.common import CleanResult
+from daily_flow.ingest.validators.common import ValidationResult
+
+
+def get_row_issue_codes(validation_result: ValidationResult, index: pd.Index) -> list[list[str]]:
+    if not validation_result.issue_masks:
+        # без масок по кодах (напр. бракує обовʼязкових колонок) — коди всіх issues
+        return [[str(issue.code) for issue in validation_result.issues] for _ in index]
+
+    codes = list(validation_result.issue_masks)
+    masks = pd.DataFrame(
+        {
+            str(code): mask.reindex(index, fill_value=False)
+            for code, mask in validation_result.issue_masks.items()
+        },
+        index=index,
+    ).to_numpy(dtype=bool)
+
+    return [[str(code) for code, hit in zip(codes, row, strict=True) if hit] for row in masks]
+
+
+def build_quarantine_rows(
+    validation_result: ValidationResult, clean_result: CleanResult
+) -> list[QuarantinePayload]:
+    df_quarantine = clean_result.df_quarantine
+    if df_quarantine is None or df_quarantine.empty:
+        return []
+
+    # to_json дає JSON-безпечні значення: NaN/NA -> null, дати -> ISO-рядки
+    payloads = json.loads(df_quarantine.to_json(orient="records", date_format="iso"))
+    issue_codes = get_row_issue_codes(validation_result, df_quarantine.index)
+
+    return [
+        {"row_index": int(row_index), "issue_codes": codes, "payload": payload}
+        for row_index, codes, payload in zip(
+            df_quarantine.index, issue_codes, payloads, strict=True
+        )
+    ]
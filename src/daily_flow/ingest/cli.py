@@ -1,19 +1,32 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from daily_flow.config.db import DbSettings
-from daily_flow.db.engine import build_engine
+from daily_flow.db.engine import build_engine, dispose_engine
 from daily_flow.db.init import init_db
 from daily_flow.db.repositories.common_mood_repo import CommonMoodLogRepo
+from daily_flow.db.repositories.ingest_fingerprint_repo import IngestFingerprintRepo
+from daily_flow.db.repositories.ingest_quarantine_repo import IngestQuarantineRepo
 from daily_flow.db.repositories.ingest_run_repo import IngestRunRepo
 from daily_flow.db.repositories.mood_log_repo import MoodLogRepo
-from daily_flow.ingest.runner.common_mood_log import common_mood_log_runner
-from daily_flow.ingest.runner.mood_log import mood_log_runner
+from daily_flow.ingest.runner.batch import (
+    IngestBatchSummary,
+    discover_ingest_files,
+    run_ingest_batch,
+)
+from daily_flow.ingest.runner.common_mood_log import (
+    common_mood_log_runner,
+    dry_run_common_mood_log,
+)
+from daily_flow.ingest.runner.mood_log import dry_run_mood_log, mood_log_runner
+from daily_flow.ingest.runner.quarantine import QuarantineRevalidation, revalidate_quarantine
 from daily_flow.ingest.schemas.base import BaseIngestContract
 from daily_flow.ingest.schemas.common_mood_log import CommonMoodLogIngestContract
 from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
+from daily_flow.utils.profiling import StageProfiler
 
 
 @dataclass(frozen=True)
@@ -25,10 +38,15 @@ class IngestCLI:
 
 
 async def build_ingest_cli(
-    file_path: str | Path, contract: BaseIngestContract, db_settings: DbSettings
+    file_path: str | Path,
+    contract: BaseIngestContract,
+    db_settings: DbSettings,
+    profiler: StageProfiler | None = None,
 ) -> IngestCLI:
     engine = await build_engine(
-        database_url=db_settings.db_url, is_database_echo=db_settings.is_sql_echo
+        database_url=db_settings.db_url,
+        is_database_echo=db_settings.is_sql_echo,
+        profile=db_settings.profile,
     )
 
     if db_settings.auto_init_db:
@@ -44,6 +62,9 @@ async def build_ingest_cli(
             contract=contract,
             ingest_run_repo=ingest_run_repo,
             mood_log_repo=mood_log_repo,
+            ingest_fingerprint_repo=IngestFingerprintRepo(engine),
+            ingest_quarantine_repo=IngestQuarantineRepo(engine),
+            profiler=profiler,
         )
 
     if isinstance(contract, CommonMoodLogIngestContract):
@@ -54,6 +75,9 @@ async def build_ingest_cli(
             contract=contract,
             ingest_run_repo=ingest_run_repo,
             common_mood_log_repo=common_mood_log_repo,
+            ingest_fingerprint_repo=IngestFingerprintRepo(engine),
+            ingest_quarantine_repo=IngestQuarantineRepo(engine),
+            profiler=profiler,
         )
 
     return IngestCLI(
@@ -61,3 +85,78 @@ async def build_ingest_cli(
         engine=engine,
         ingest_run_repo=ingest_run_repo,
     )
+
+
+async def run_ingest_dry_run(
+    file_path: str | Path,
+    contract: BaseIngestContract,
+    profiler: StageProfiler | None = None,
+) -> dict[str, Any]:
+    # без engine і init_db: dry run не відкриває БД взагалі
+    if isinstance(contract, MoodLogIngestContract):
+        return await dry_run_mood_log(file_path, contract, profiler)
+
+    return await dry_run_common_mood_log(file_path, contract, profiler)
+
+
+async def run_ingest_dir(
+    directory: Path,
+    pattern: str,
+    contracts: list[BaseIngestContract],
+    db_settings: DbSettings,
+    max_workers: int | None = None,
+) -> IngestBatchSummary:
+    # один engine і один init_db на весь запуск, а не на кожен файл
+    engine = await build_engine(
+        database_url=db_settings.db_url,
+        is_database_echo=db_settings.is_sql_echo,
+        profile=db_settings.profile,
+    )
+
+    try:
+        if db_settings.auto_init_db:
+            await init_db(engine)
+
+        return await run_ingest_batch(
+            files=discover_ingest_files(directory, pattern, contracts),
+            ingest_run_repo=IngestRunRepo(engine),
+            mood_log_repo=MoodLogRepo(engine),
+            common_mood_log_repo=CommonMoodLogRepo(engine),
+            ingest_fingerprint_repo=IngestFingerprintRepo(engine),
+            ingest_quarantine_repo=IngestQuarantineRepo(engine),
+            max_workers=max_workers,
+        )
+    finally:
+        await dispose_engine(engine)
+
+
+async def run_revalidate_quarantine(
+    contracts: list[BaseIngestContract], db_settings: DbSettings
+) -> list[QuarantineRevalidation]:
+    engine = await build_engine(
+        database_url=db_settings.db_url,
+        is_database_echo=db_settings.is_sql_echo,
+        profile=db_settings.profile,
+    )
+
+    try:
+        if db_settings.auto_init_db:
+            await init_db(engine)
+
+        ingest_quarantine_repo = IngestQuarantineRepo(engine)
+        mood_log_repo = MoodLogRepo(engine)
+        common_mood_log_repo = CommonMoodLogRepo(engine)
+        ingest_fingerprint_repo = IngestFingerprintRepo(engine)
+
+        return [
+            await revalidate_quarantine(
+                contract=contract,
+                ingest_quarantine_repo=ingest_quarantine_repo,
+                mood_log_repo=mood_log_repo,
+                common_mood_log_repo=common_mood_log_repo,
+                ingest_fingerprint_repo=ingest_fingerprint_repo,
+            )
+            for contract in contracts
+        ]
+    finally:
+        await dispose_engine(engine)
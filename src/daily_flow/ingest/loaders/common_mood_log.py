@@ -7,9 +7,7 @@ from daily_flow.db.repositories.common_mood_repo import (
 )
 
 
-async def load_common_mood_log(
-    df: pd.DataFrame, common_mood_log_repo: CommonMoodLogRepo
-) -> BatchCommonMoodLogUpsertResult:
+def to_common_mood_log_payload(df: pd.DataFrame) -> list[DayPayload]:
     df_db = df.copy()
 
     df_db["day"] = pd.to_datetime(df_db["day"]).dt.date
@@ -20,10 +18,12 @@ async def load_common_mood_log(
 
     common_mood_logs_records = df_payload.to_dict(orient="records")
 
-    common_mood_logs_batch_payload: list[DayPayload] = [
-        {"day": record.pop("day"), "values": record} for record in common_mood_logs_records
-    ]
+    return [{"day": record.pop("day"), "values": record} for record in common_mood_logs_records]
+
 
+async def load_common_mood_log(
+    df: pd.DataFrame, common_mood_log_repo: CommonMoodLogRepo
+) -> BatchCommonMoodLogUpsertResult:
     return await common_mood_log_repo.batch_upsert_common_mood_logs(
-        payload=common_mood_logs_batch_payload
+        payload=to_common_mood_log_payload(df)
     )
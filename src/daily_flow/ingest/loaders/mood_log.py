@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from contextlib import aclosing
+
 import pandas as pd
 
 from daily_flow.db.repositories.mood_log_repo import (
@@ -6,27 +9,37 @@ from daily_flow.db.repositories.mood_log_repo import (
     MoodLogRepo,
 )
 from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
+from daily_flow.utils.pipeline import iter_in_thread
 
+MOOD_LOG_LOAD_CHUNK_SIZE = 10_000
 
-async def load_mood_log(
+
+def iter_mood_log_payload(
     df: pd.DataFrame,
     contract: MoodLogIngestContract,
-    mood_log_repo: MoodLogRepo,
-) -> BatchMoodLogUpsertResult:
-    df_db = df.copy()
+    chunk_size: int = MOOD_LOG_LOAD_CHUNK_SIZE,
+) -> Iterator[list[DayPayload]]:
+    for start in range(0, len(df), chunk_size):
+        df_db = df.iloc[start : start + chunk_size].copy()
+
+        df_db = df_db.astype({mood_column: "Int8" for mood_column in contract.mood_columns})
 
-    df_db = df_db.astype({mood_column: "Int8" for mood_column in contract.mood_columns})
+        df_db["day"] = pd.to_datetime(df_db["day"]).dt.date
 
-    df_db["day"] = pd.to_datetime(df_db["day"]).dt.date
+        df_payload = df_db.astype(object).where(pd.notnull(df_db), None)
 
-    df_payload = df_db.astype(object).where(pd.notnull(df_db), None)
+        mood_logs_records = df_payload.to_dict(orient="records")
 
-    mood_logs_records = df_payload.to_dict(orient="records")
+        yield [{"day": record.pop("day"), "values": record} for record in mood_logs_records]
 
-    print(f"{mood_logs_records=}")
 
-    mood_logs_batch_payload: list[DayPayload] = [
-        {"day": record.pop("day"), "values": record} for record in mood_logs_records
-    ]
+async def load_mood_log(
+    df: pd.DataFrame,
+    contract: MoodLogIngestContract,
+    mood_log_repo: MoodLogRepo,
+) -> BatchMoodLogUpsertResult:
+    # payload наступного чанка будується в потоці, поки поточний пишеться в БД
+    payload_chunks = iter_in_thread(iter_mood_log_payload(df, contract))
 
-    return await mood_log_repo.batch_upsert_mood_logs(payload=mood_logs_batch_payload)
+    async with aclosing(payload_chunks):
+        return await mood_log_repo.batch_upsert_mood_log_chunks(payload_chunks)
@@ -0,0 +1,291 @@
+import asyncio
+import logging
+import multiprocessing
+import re
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from daily_flow.db.repositories.common_mood_repo import CommonMoodLogRepo
+from daily_flow.db.repositories.ingest_fingerprint_repo import IngestFingerprintRepo
+from daily_flow.db.repositories.ingest_quarantine_repo import (
+    IngestQuarantineRepo,
+    QuarantinePayload,
+)
+from daily_flow.db.repositories.ingest_run_repo import IngestRun, IngestRunRepo
+from daily_flow.db.repositories.mood_log_repo import MoodLogRepo
+from daily_flow.db.schema.audit import IngestSourceType, IngestStatusType
+from daily_flow.ingest.cleaning.quarantine import build_quarantine_rows
+from daily_flow.ingest.loaders.common_mood_log import load_common_mood_log
+from daily_flow.ingest.loaders.mood_log import load_mood_log
+from daily_flow.ingest.runner.common_mood_log import prepare_common_mood_log
+from daily_flow.ingest.runner.mood_log import prepare_mood_log
+from daily_flow.ingest.schemas.base import BaseIngestContract
+from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
+from daily_flow.utils.hash import calculate_file_hash
+
+logger = logging.getLogger(__name__)
+
+SOURCE_TYPE_SUFFIXES = {
+    IngestSourceType.EXCEL: (".xlsx",),
+    IngestSourceType.CSV: (".csv",),
+}
+
+# дата експорту в імені файлу: mood_logs_05_02_2026.xlsx, common_mood_logs_29_01_2026.csv
+EXPORT_DATE_PATTERN = re.compile(r"(\d{2})_(\d{2})_(\d{4})")
+
+
+@dataclass(frozen=True)
+class IngestFile:
+    path: Path
+    contract: BaseIngestContract
+    file_hash: str = ""
+
+
+@dataclass(frozen=True)
+class IngestFileResult:
+    path: Path
+    dataset: str
+    status: IngestStatusType
+    rows_written: int = 0
+    seconds: float = 0.0
+    error_message: str | None = None
+
+
+@dataclass
+class IngestBatchSummary:
+    results: list[IngestFileResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def count(self, status: IngestStatusType) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def rows_written(self) -> int:
+        return sum(r.rows_written for r in self.results)
+
+
+def get_export_time(path: Path) -> datetime:
+    """Export date from a dd_mm_yyyy file name; files without one fall back to their mtime."""
+    match = EXPORT_DATE_PATTERN.search(path.stem)
+    if match is not None:
+        day, month, year = (int(part) for part in match.groups())
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            logger.info("File %s: %s is not a date, using mtime", path, match.group())
+
+    return datetime.fromtimestamp(path.stat().st_mtime)
+
+
+def discover_ingest_files(
+    directory: Path, pattern: str, contracts: list[BaseIngestContract]
+) -> list[IngestFile]:
+    """
+    Files ordered from the oldest export to the newest (see get_export_time), so written
+    in this order a newer export overwrites the days of an older one.
+    """
+    # датасет файлу визначається за розширенням і source_type контракту
+    files = []
+    paths = (p for p in directory.glob(pattern) if p.is_file())
+    for path in sorted(paths, key=lambda p: (get_export_time(p), p.name)):
+        contract = next(
+            (c for c in contracts if path.suffix.lower() in SOURCE_TYPE_SUFFIXES[c.source_type]),
+            None,
+        )
+        if contract is None:
+            logger.info("File %s skipped: no ingest contract for %s", path, path.suffix)
+            continue
+        files.append(IngestFile(path=path, contract=contract))
+
+    return files
+
+
+def hash_ingest_files(files: list[IngestFile], max_workers: int | None = None) -> list[IngestFile]:
+    # hashlib відпускає GIL на великих блоках, тож потоки хешують файли паралельно
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        hashes = list(executor.map(calculate_file_hash, [f.path for f in files]))
+
+    return [
+        IngestFile(path=f.path, contract=f.contract, file_hash=h)
+        for f, h in zip(files, hashes, strict=True)
+    ]
+
+
+def _prepare_file(
+    path: Path, contract: BaseIngestContract
+) -> tuple[pd.DataFrame, dict[str, Any], dict[date, int], list[QuarantinePayload]]:
+    # виконується в окремому процесі: повертає чистий df, метрики, відбитки і карантин, без масок.
+    # Файл готується цілком: незмінні дні відсіюються вже при записі, за свіжими відбитками
+    if isinstance(contract, MoodLogIngestContract):
+        validation_result, clean_result, fingerprints = prepare_mood_log(path, contract)
+    else:
+        validation_result, clean_result, fingerprints = prepare_common_mood_log(path, contract)
+
+    quarantine_rows = build_quarantine_rows(validation_result, clean_result)
+    return clean_result.df_clean, validation_result.metrics, fingerprints, quarantine_rows
+
+
+def select_unwritten_days(
+    df_clean: pd.DataFrame, fingerprints: Mapping[date, int], known: Mapping[date, int]
+) -> tuple[pd.DataFrame, dict[date, int]]:
+    # дні з тим самим відбитком уже записані (цим або попереднім файлом) — їх пропускаємо
+    unchanged = {day for day, fp in fingerprints.items() if known.get(day) == fp}
+    changed = {day: fp for day, fp in fingerprints.items() if day not in unchanged}
+
+    return df_clean.loc[~df_clean["day"].dt.date.isin(unchanged)], changed
+
+
+async def _write_file(
+    file: IngestFile,
+    df_clean: pd.DataFrame,
+    fingerprints: dict[date, int],
+    metrics: dict[str, Any],
+    mood_log_repo: MoodLogRepo,
+    common_mood_log_repo: CommonMoodLogRepo,
+    ingest_fingerprint_repo: IngestFingerprintRepo,
+) -> int:
+    # відбитки читаються перед кожним записом, тож бачать дні попередніх файлів запуску
+    known = await ingest_fingerprint_repo.get_day_fingerprints(file.contract.dataset)
+    df_write, fingerprints = select_unwritten_days(df_clean, fingerprints, known)
+    metrics["days_skipped_unchanged"] = len(df_clean) - len(df_write)
+
+    if isinstance(file.contract, MoodLogIngestContract):
+        result = await load_mood_log(
+            df=df_write, contract=file.contract, mood_log_repo=mood_log_repo
+        )
+    else:
+        result = await load_common_mood_log(df=df_write, common_mood_log_repo=common_mood_log_repo)
+    await ingest_fingerprint_repo.upsert_day_fingerprints(file.contract.dataset, fingerprints)
+
+    return result.rows_written
+
+
+async def run_ingest_batch(
+    files: list[IngestFile],
+    ingest_run_repo: IngestRunRepo,
+    mood_log_repo: MoodLogRepo,
+    common_mood_log_repo: CommonMoodLogRepo,
+    ingest_fingerprint_repo: IngestFingerprintRepo,
+    ingest_quarantine_repo: IngestQuarantineRepo,
+    max_workers: int | None = None,
+) -> IngestBatchSummary:
+    """
+    Ingests many files in one run: files are hashed in a thread pool, already processed
+    hashes are skipped after a single ingest_run query, parsing and validation run in a
+    process pool, and every upsert goes through this coroutine, the only DB writer.
+    Files are written in the order of files (discover_ingest_files: by export date),
+    whatever order they finish parsing in. Day fingerprints are re-read before each write.
+    """
+    started = time.perf_counter()
+    summary = IngestBatchSummary()
+
+    files = await asyncio.to_thread(hash_ingest_files, files, max_workers)
+    processed = await ingest_run_repo.get_processed_hashes([f.file_hash for f in files])
+
+    pending: list[IngestFile] = []
+    for file in files:
+        if file.file_hash in processed:
+            now = datetime.now()
+            await ingest_run_repo.add_ingest(
+                IngestRun(
+                    dataset=file.contract.dataset,
+                    source_type=file.contract.source_type,
+                    source_path=str(file.path),
+                    file_hash=file.file_hash,
+                    started_at=now,
+                    finished_at=now,
+                    status=IngestStatusType.SKIPPED,
+                )
+            )
+            summary.results.append(
+                IngestFileResult(file.path, file.contract.dataset, IngestStatusType.SKIPPED)
+            )
+            continue
+        # однакові копії файлу в одному запуску інжестимо один раз
+        processed.add(file.file_hash)
+        pending.append(file)
+
+    if not pending:
+        summary.seconds = time.perf_counter() - started
+        return summary
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+
+        async def prepare(file: IngestFile):
+            file_started = datetime.now()
+            try:
+                prepared = await loop.run_in_executor(
+                    executor, _prepare_file, file.path, file.contract
+                )
+                return file, file_started, prepared, None
+            except Exception as e:
+                return file, file_started, None, e
+
+        # усі файли парсяться паралельно, але пишуться по черзі в порядку files (дата експорту)
+        prepared_files = [asyncio.ensure_future(prepare(f)) for f in pending]
+        for next_prepared in prepared_files:
+            file, file_started, prepared, error = await next_prepared
+            run_params = {
+                "dataset": file.contract.dataset,
+                "source_type": file.contract.source_type,
+                "source_path": str(file.path),
+                "file_hash": file.file_hash,
+                "started_at": file_started,
+            }
+
+            rows_written, metrics, quarantine_rows = 0, None, []
+            if error is None:
+                df_clean, metrics, fingerprints, quarantine_rows = prepared
+                try:
+                    rows_written = await _write_file(
+                        file,
+                        df_clean,
+                        fingerprints,
+                        metrics,
+                        mood_log_repo,
+                        common_mood_log_repo,
+                        ingest_fingerprint_repo,
+                    )
+                except Exception as e:
+                    error = e
+
+            status = IngestStatusType.SUCCESS if error is None else IngestStatusType.FAILED
+            error_message = str(getattr(error, "orig", error)).lower() if error else None
+
+            added_run = await ingest_run_repo.add_ingest(
+                IngestRun(
+                    **run_params,
+                    status=status,
+                    metrics=metrics,
+                    error_message=error_message,
+                    finished_at=datetime.now(),
+                )
+            )
+            if status == IngestStatusType.SUCCESS:
+                await ingest_quarantine_repo.add_quarantined_rows(
+                    added_run.id, file.contract.dataset, quarantine_rows
+                )
+            summary.results.append(
+                IngestFileResult(
+                    path=file.path,
+                    dataset=file.contract.dataset,
+                    status=status,
+                    rows_written=rows_written,
+                    seconds=(datetime.now() - file_started).total_seconds(),
+                    error_message=error_message,
+                )
+            )
+            logger.info("Ingest %s: %s (%d rows)", file.path.name, status, rows_written)
+
+    summary.seconds = time.perf_counter() - started
+    return summary
@@ -1,16 +1,133 @@
-from datetime import datetime
+import asyncio
+import logging
+from collections.abc import Mapping
+from contextlib import aclosing
+from datetime import date, datetime
 from pathlib import Path
+from typing import Any
+
+import pandas as pd
 
 from daily_flow.db.repositories.common_mood_repo import CommonMoodLogRepo
+from daily_flow.db.repositories.ingest_fingerprint_repo import IngestFingerprintRepo
+from daily_flow.db.repositories.ingest_quarantine_repo import IngestQuarantineRepo
 from daily_flow.db.repositories.ingest_run_repo import IngestRunRepo
 from daily_flow.db.schema.audit import IngestStatusType
-from daily_flow.ingest.audit.ingest_run import ingest_run
+from daily_flow.ingest.audit.fingerprints import get_loaded_fingerprints, select_changed_days
+from daily_flow.ingest.audit.ingest_run import ingest_run, save_profile
+from daily_flow.ingest.cleaning.common import CleanResult
 from daily_flow.ingest.cleaning.policies import apply_validation_policy
-from daily_flow.ingest.loaders.common_mood_log import load_common_mood_log
+from daily_flow.ingest.cleaning.quarantine import build_quarantine_rows
+from daily_flow.ingest.loaders.common_mood_log import to_common_mood_log_payload
 from daily_flow.ingest.schemas.common_mood_log import CommonMoodLogIngestContract
-from daily_flow.ingest.sources.common_mood_log_csv import read_common_mood_log_csv
+from daily_flow.ingest.sources.common_mood_log_csv import (
+    iter_common_mood_log_csv,
+    read_common_mood_log_csv,
+    read_common_mood_log_days,
+)
 from daily_flow.ingest.transforms.common_mood_log import transform_common_mood_log
+from daily_flow.ingest.validators.common import ValidationResult
 from daily_flow.ingest.validators.common_mood_log.validator import validate_common_mood_log
+from daily_flow.ingest.validators.metrics import format_metrics_summary, merge_chunk_metrics
+from daily_flow.utils.hash import calculate_file_hash
+from daily_flow.utils.pipeline import iter_in_thread
+from daily_flow.utils.profiling import StageProfiler
+
+logger = logging.getLogger(__name__)
+
+
+def scan_common_mood_log_days(file_path: str | Path) -> tuple[set[pd.Timestamp], int]:
+    """
+    Days that occur more than once anywhere in the file, plus the number of distinct days.
+    Chunks are validated against the whole set, so every row of a duplicated day goes to
+    quarantine wherever the chunk boundaries fall.
+    """
+    days = pd.to_datetime(read_common_mood_log_days(file_path), errors="coerce")
+    days = days.dt.normalize().dropna()
+
+    return set(days[days.duplicated()]), days.nunique()
+
+
+def prepare_common_mood_log_chunk(
+    read_result: pd.DataFrame,
+    contract: CommonMoodLogIngestContract,
+    duplicate_days: set | None = None,
+    known_fingerprints: Mapping[date, int] | None = None,
+    profiler: StageProfiler | None = None,
+) -> tuple[ValidationResult, CleanResult, dict[date, int]]:
+    """
+    Like prepare_normalized_mood_log: one row per day, so days whose content matches the
+    fingerprint of the last ingest are dropped before validation and load.
+    """
+    profiler = profiler or StageProfiler(enabled=False)
+
+    with profiler.stage("normalize"):
+        transformed_result = transform_common_mood_log(read_result, contract)
+
+    with profiler.stage("delta"):
+        delta = select_changed_days(
+            transformed_result,
+            contract.required_columns + contract.optional_columns,
+            known_fingerprints or {},
+        )
+
+    with profiler.stage("validate"):
+        validation_result = validate_common_mood_log(delta.df, contract, seen_days=duplicate_days)
+    validation_result.metrics["days_skipped_unchanged"] = delta.days_skipped
+
+    with profiler.stage("clean"):
+        clean_result = apply_validation_policy(
+            df=delta.df,
+            validation_report=validation_result,
+            mode="train",
+            bad_action="quarantine",
+        )
+    return validation_result, clean_result, get_loaded_fingerprints(delta, clean_result.df_clean)
+
+
+def prepare_common_mood_log(
+    file_path: str | Path,
+    contract: CommonMoodLogIngestContract,
+    known_fingerprints: Mapping[date, int] | None = None,
+) -> tuple[ValidationResult, CleanResult, dict[date, int]]:
+    return prepare_common_mood_log_chunk(
+        read_common_mood_log_csv(file_path), contract, known_fingerprints=known_fingerprints
+    )
+
+
+async def dry_run_common_mood_log(
+    file_path: str | Path,
+    contract: CommonMoodLogIngestContract,
+    profiler: StageProfiler | None = None,
+) -> dict[str, Any]:
+    """
+    Parses, validates and cleans the whole file without a DB: no skip check, no load and
+    no ingest_run record. Returns the merged validation metrics.
+    """
+    profiler = profiler or StageProfiler(enabled=False)
+
+    with profiler.stage("hash"):
+        await asyncio.to_thread(calculate_file_hash, file_path)
+
+    with profiler.stage("read"):
+        duplicate_days, unique_days = await asyncio.to_thread(scan_common_mood_log_days, file_path)
+    prepared_chunks = iter_in_thread(
+        prepare_common_mood_log_chunk(read_result, contract, duplicate_days, profiler=profiler)
+        for read_result in profiler.iter_stage("read", iter_common_mood_log_csv(file_path))
+    )
+
+    chunk_metrics, chunk_issues = [], []
+    async with aclosing(prepared_chunks):
+        async for validation_result, _, _ in prepared_chunks:
+            chunk_metrics.append(validation_result.metrics)
+            chunk_issues.extend(validation_result.issues)
+
+    result_metrics = merge_chunk_metrics(chunk_metrics, chunk_issues)
+    result_metrics["unique_days"] = unique_days
+    result_metrics["chunks"] = len(chunk_metrics)
+
+    logger.info("Dry run %s: %s", contract.dataset, format_metrics_summary(result_metrics))
+    return result_metrics
 
 
 async def common_mood_log_runner(
@@ -18,7 +135,11 @@ async def common_mood_log_runner(
     contract: CommonMoodLogIngestContract,
     ingest_run_repo: IngestRunRepo,
     common_mood_log_repo: CommonMoodLogRepo,
+    ingest_fingerprint_repo: IngestFingerprintRepo,
+    ingest_quarantine_repo: IngestQuarantineRepo,
+    profiler: StageProfiler | None = None,
 ):
+    profiler = profiler or StageProfiler(enabled=False)
     base_ingest_params = {
         "dataset": contract.dataset,
         "source_type": contract.source_type,
@@ -30,32 +151,71 @@ async def common_mood_log_runner(
     result_metrics = None
 
     try:
-        ingest_result = await ingest_run(**base_ingest_params)
+        with profiler.stage("hash"):
+            ingest_result = await ingest_run(**base_ingest_params)
         if ingest_result and ingest_result.status == IngestStatusType.SKIPPED:
             return IngestStatusType.SKIPPED
 
-        read_result = read_common_mood_log_csv(file_path)
-        transformed_result = transform_common_mood_log(read_result, contract)
-
-        validation_result = validate_common_mood_log(transformed_result, contract)
-        result_metrics = validation_result.metrics
+        with profiler.stage("read"):
+            duplicate_days, unique_days = await asyncio.to_thread(
+                scan_common_mood_log_days, file_path
+            )
+        # дублікати мають потрапити на валідацію, навіть якщо один із рядків не змінився
+        known_fingerprints = {
+            day: fingerprint
+            for day, fingerprint in (
+                await ingest_fingerprint_repo.get_day_fingerprints(contract.dataset)
+            ).items()
+            if pd.Timestamp(day) not in duplicate_days
+        }
 
-        clean_result = apply_validation_policy(
-            df=transformed_result,
-            validation_report=validation_result,
-            mode="train",
-            bad_action="quarantine",
+        # наступні чанки парсяться і валідуються в потоці, поки попередній пишеться в БД
+        prepared_chunks = iter_in_thread(
+            prepare_common_mood_log_chunk(
+                read_result, contract, duplicate_days, known_fingerprints, profiler
+            )
+            for read_result in profiler.iter_stage("read", iter_common_mood_log_csv(file_path))
         )
 
-        batch_upsert_result = await load_common_mood_log(
-            df=clean_result.df_clean, common_mood_log_repo=common_mood_log_repo
-        )
+        chunk_metrics, chunk_issues = [], []
+        quarantine_rows, fingerprints = [], {}
+
+        async def iter_payload_chunks():
+            async with aclosing(prepared_chunks):
+                async for validation_result, clean_result, chunk_fingerprints in prepared_chunks:
+                    chunk_metrics.append(validation_result.metrics)
+                    chunk_issues.extend(validation_result.issues)
+                    quarantine_rows.extend(build_quarantine_rows(validation_result, clean_result))
+                    fingerprints.update(chunk_fingerprints)
+                    yield to_common_mood_log_payload(clean_result.df_clean)
 
-        if batch_upsert_result:
+        # усі чанки пишуться в одній транзакції: упалий запуск не лишає часткового завантаження,
+        # а його FAILED-запис з хешем файлу не робить це завантаження остаточним
+        with profiler.stage("load"):
+            async with aclosing(iter_payload_chunks()) as payload_chunks:
+                batch_upsert_result = (
+                    await common_mood_log_repo.batch_upsert_common_mood_log_chunks(payload_chunks)
+                )
+            rows_written = batch_upsert_result.rows_written
+
+            # якщо запис відбитків впаде, наступний інжест просто ще раз завантажить ці дні
+            await ingest_fingerprint_repo.upsert_day_fingerprints(contract.dataset, fingerprints)
+
+        result_metrics = merge_chunk_metrics(chunk_metrics, chunk_issues)
+        result_metrics["unique_days"] = unique_days
+        result_metrics["chunks"] = len(chunk_metrics)
+        result_metrics["rows_written"] = rows_written
+        logger.info("Validated %s: %s", file_path, format_metrics_summary(result_metrics))
+
+        with profiler.stage("audit"):
             ingest_run_result = await ingest_run(
                 **base_ingest_params, end_time=datetime.now(), metrics=result_metrics
             )
-            return ingest_run_result.status
+            await ingest_quarantine_repo.add_quarantined_rows(
+                ingest_run_id=ingest_run_result.id, dataset=contract.dataset, rows=quarantine_rows
+            )
+        await save_profile(ingest_run_repo, ingest_run_result, profiler)
+        return ingest_run_result.status
     except Exception as e:
         end_time = datetime.now()
         msg = str(getattr(e, "orig", e)).lower()
@@ -63,4 +223,5 @@ async def common_mood_log_runner(
         ingest_run_result = await ingest_run(
             **base_ingest_params, end_time=end_time, error_message=msg, metrics=result_metrics
         )
+        await save_profile(ingest_run_repo, ingest_run_result, profiler)
         return ingest_run_result.status
@@ -1,16 +1,135 @@
-from datetime import datetime
+import asyncio
+import logging
+from collections.abc import Mapping
+from contextlib import aclosing
+from datetime import date, datetime
 from pathlib import Path
+from typing import Any
 
+import pandas as pd
+
+from daily_flow.db.repositories.ingest_fingerprint_repo import IngestFingerprintRepo
+from daily_flow.db.repositories.ingest_quarantine_repo import IngestQuarantineRepo
 from daily_flow.db.repositories.ingest_run_repo import IngestRunRepo
 from daily_flow.db.repositories.mood_log_repo import MoodLogRepo
 from daily_flow.db.schema.audit import IngestStatusType
-from daily_flow.ingest.audit.ingest_run import ingest_run
+from daily_flow.ingest.audit.fingerprints import get_loaded_fingerprints, select_changed_days
+from daily_flow.ingest.audit.ingest_run import ingest_run, save_profile
+from daily_flow.ingest.cleaning.common import CleanResult
 from daily_flow.ingest.cleaning.policies import apply_validation_policy
+from daily_flow.ingest.cleaning.quarantine import build_quarantine_rows
 from daily_flow.ingest.loaders.mood_log import load_mood_log
 from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
-from daily_flow.ingest.sources.mood_log_excel import read_mood_log_excel
-from daily_flow.ingest.transforms.mood_log import normalize_mood_log
+from daily_flow.ingest.sources.mood_log_excel import iter_mood_log_excel
+from daily_flow.ingest.transforms.mood_log import (
+    concat_mood_log_sheets,
+    normalize_mood_log,
+    transform_mood_log_sheet,
+)
+from daily_flow.ingest.validators.common import ValidationResult
+from daily_flow.ingest.validators.metrics import format_metrics_summary
 from daily_flow.ingest.validators.mood_log.validator import validate_mood_log
+from daily_flow.utils.hash import calculate_file_hash
+from daily_flow.utils.pipeline import iter_in_thread
+from daily_flow.utils.profiling import StageProfiler
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_mood_log(
+    file_path: str | Path,
+    contract: MoodLogIngestContract,
+    known_fingerprints: Mapping[date, int] | None = None,
+) -> tuple[ValidationResult, CleanResult, dict[date, int]]:
+    """
+    Returns validation and cleaning results for the days that are new or changed since
+    known_fingerprints, plus fingerprints of the clean days to store once they are loaded.
+    """
+    read_batches = iter_mood_log_excel(file_path, contract)
+    normalized_result = normalize_mood_log(read_batches, contract)
+
+    return prepare_normalized_mood_log(normalized_result, contract, known_fingerprints)
+
+
+def prepare_normalized_mood_log(
+    normalized_result: pd.DataFrame,
+    contract: MoodLogIngestContract,
+    known_fingerprints: Mapping[date, int] | None = None,
+    profiler: StageProfiler | None = None,
+) -> tuple[ValidationResult, CleanResult, dict[date, int]]:
+    profiler = profiler or StageProfiler(enabled=False)
+
+    with profiler.stage("delta"):
+        delta = select_changed_days(
+            normalized_result, contract.required_columns, known_fingerprints or {}
+        )
+
+    with profiler.stage("validate"):
+        validation_result = validate_mood_log(delta.df, contract)
+    validation_result.metrics["days_skipped_unchanged"] = delta.days_skipped
+
+    with profiler.stage("clean"):
+        clean_result = apply_validation_policy(
+            df=delta.df,
+            validation_report=validation_result,
+            mode="train",
+            bad_action="quarantine",
+        )
+    return validation_result, clean_result, get_loaded_fingerprints(delta, clean_result.df_clean)
+
+
+async def read_mood_log(
+    file_path: str | Path,
+    contract: MoodLogIngestContract,
+    profiler: StageProfiler | None = None,
+) -> pd.DataFrame:
+    """
+    Reads and normalizes the workbook with overlapping stages: openpyxl streams the next
+    batch in one worker thread while the previous batch is typed in another.
+    """
+    profiler = profiler or StageProfiler(enabled=False)
+    sheets = []
+
+    read_batches = profiler.iter_stage("read", iter_mood_log_excel(file_path, contract))
+    async with aclosing(iter_in_thread(read_batches)) as batches:
+        async for batch in batches:
+            sheets.append(
+                await asyncio.to_thread(_transform_sheet, batch["sheet"], contract, profiler)
+            )
+
+    with profiler.stage("normalize"):
+        return concat_mood_log_sheets(sheets)
+
+
+def _transform_sheet(
+    df_raw: pd.DataFrame, contract: MoodLogIngestContract, profiler: StageProfiler
+) -> pd.DataFrame:
+    with profiler.stage("normalize"):
+        return transform_mood_log_sheet(df_raw, contract)
+
+
+async def dry_run_mood_log(
+    file_path: str | Path,
+    contract: MoodLogIngestContract,
+    profiler: StageProfiler | None = None,
+) -> dict[str, Any]:
+    """
+    Parses, validates and cleans the whole file without a DB: no skip check, no
+    fingerprints, no load and no ingest_run record. Returns the validation metrics.
+    """
+    profiler = profiler or StageProfiler(enabled=False)
+
+    with profiler.stage("hash"):
+        await asyncio.to_thread(calculate_file_hash, file_path)
+    normalized_result = await read_mood_log(file_path, contract, profiler)
+    validation_result, _, _ = await asyncio.to_thread(
+        prepare_normalized_mood_log, normalized_result, contract, None, profiler
+    )
+
+    logger.info(
+        "Dry run %s: %s", contract.dataset, format_metrics_summary(validation_result.metrics)
+    )
+    return validation_result.metrics
 
 
 async def mood_log_runner(
@@ -18,7 +137,14 @@ async def mood_log_runner(
     contract: MoodLogIngestContract,
     ingest_run_repo: IngestRunRepo,
     mood_log_repo: MoodLogRepo,
+    ingest_fingerprint_repo: IngestFingerprintRepo,
+    ingest_quarantine_repo: IngestQuarantineRepo,
+    profiler: StageProfiler | None = None,
 ) -> IngestStatusType:
+    """
+    With an enabled profiler, stage timings go to ingest_run.metrics["profile"].
+    """
+    profiler = profiler or StageProfiler(enabled=False)
     base_ingest_params = {
         "dataset": contract.dataset,
         "source_type": contract.source_type,
@@ -30,32 +156,39 @@ async def mood_log_runner(
     result_metrics = None
 
     try:
-        ingest_result = await ingest_run(**base_ingest_params)
+        with profiler.stage("hash"):
+            ingest_result = await ingest_run(**base_ingest_params)
         if ingest_result and ingest_result.status == IngestStatusType.SKIPPED:
             return IngestStatusType.SKIPPED
 
-        read_result = read_mood_log_excel(file_path, contract)
-        normalized_result = normalize_mood_log(read_result, contract)
-
-        validation_result = validate_mood_log(normalized_result, contract)
-        print(f"{validation_result=}")
-        result_metrics = validation_result.metrics
-
-        clean_result = apply_validation_policy(
-            df=normalized_result,
-            validation_report=validation_result,
-            mode="train",
-            bad_action="quarantine",
+        # CPU-етапи йдуть у потоках, event loop не блокується; валідація бачить
+        # весь файл одразу (дублікати між аркушами, відбитки днів)
+        known_fingerprints = await ingest_fingerprint_repo.get_day_fingerprints(contract.dataset)
+        normalized_result = await read_mood_log(file_path, contract, profiler)
+        validation_result, clean_result, fingerprints = await asyncio.to_thread(
+            prepare_normalized_mood_log, normalized_result, contract, known_fingerprints, profiler
         )
+        result_metrics = validation_result.metrics
+        logger.info("Validated %s: %s", file_path, format_metrics_summary(result_metrics))
 
-        batch_upsert_result = await load_mood_log(
-            df=clean_result.df_clean, contract=contract, mood_log_repo=mood_log_repo
-        )
+        with profiler.stage("load"):
+            batch_upsert_result = await load_mood_log(
+                df=clean_result.df_clean, contract=contract, mood_log_repo=mood_log_repo
+            )
+            # якщо запис відбитків впаде, наступний інжест просто ще раз завантажить ці дні
+            await ingest_fingerprint_repo.upsert_day_fingerprints(contract.dataset, fingerprints)
 
         if batch_upsert_result:
-            ingest_run_result = await ingest_run(
-                **base_ingest_params, end_time=datetime.now(), metrics=result_metrics
-            )
+            with profiler.stage("audit"):
+                ingest_run_result = await ingest_run(
+                    **base_ingest_params, end_time=datetime.now(), metrics=result_metrics
+                )
+                await ingest_quarantine_repo.add_quarantined_rows(
+                    ingest_run_id=ingest_run_result.id,
+                    dataset=contract.dataset,
+                    rows=build_quarantine_rows(validation_result, clean_result),
+                )
+            await save_profile(ingest_run_repo, ingest_run_result, profiler)
             return ingest_run_result.status
     except Exception as e:
         end_time = datetime.now()
@@ -64,4 +197,5 @@ async def mood_log_runner(
         ingest_run_result = await ingest_run(
             **base_ingest_params, end_time=end_time, error_message=msg, metrics=result_metrics
         )
+        await save_profile(ingest_run_repo, ingest_run_result, profiler)
         return ingest_run_result.status
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+
+import pandas as pd
+
+from daily_flow.db.repositories.common_mood_repo import CommonMoodLogRepo
+from daily_flow.db.repositories.ingest_fingerprint_repo import IngestFingerprintRepo
+from daily_flow.db.repositories.ingest_quarantine_repo import IngestQuarantineRepo, QuarantinedRow
+from daily_flow.db.repositories.mood_log_repo import MoodLogRepo
+from daily_flow.ingest.cleaning.common import CleanResult
+from daily_flow.ingest.cleaning.policies import apply_validation_policy
+from daily_flow.ingest.cleaning.quarantine import get_row_issue_codes
+from daily_flow.ingest.loaders.common_mood_log import load_common_mood_log
+from daily_flow.ingest.loaders.mood_log import load_mood_log
+from daily_flow.ingest.schemas.base import BaseIngestContract
+from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
+from daily_flow.ingest.transforms.mood_log import transform_mood_log_sheet
+from daily_flow.ingest.validators.common import ValidationResult
+from daily_flow.ingest.validators.common_mood_log.validator import validate_common_mood_log
+from daily_flow.ingest.validators.mood_log.validator import validate_mood_log
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class QuarantineRevalidation:
+    dataset: str
+    rows_checked: int
+    rows_resolved: int
+    rows_superseded: int
+    rows_still_quarantined: int
+    rows_written: int
+
+
+def restore_quarantined_frame(
+    rows: list[QuarantinedRow], contract: BaseIngestContract
+) -> pd.DataFrame:
+    # індекс = id рядка карантину, щоб після валідації знати, які рядки зняти
+    df = pd.DataFrame([row.payload for row in rows], index=pd.Index([row.id for row in rows]))
+
+    if isinstance(contract, MoodLogIngestContract):
+        return transform_mood_log_sheet(df, contract)
+
+    # payload вже нормалізований: настрій числом, тому мітки COMMON_MOODS не потрібні
+    df["day"] = pd.to_datetime(df["day"], errors="coerce").dt.normalize()
+    df["mood"] = df["mood"].astype("int8")
+    df["note"] = df["note"].astype("string")
+    return df
+
+
+def revalidate_quarantined_frame(
+    df: pd.DataFrame, contract: BaseIngestContract
+) -> tuple[ValidationResult, CleanResult]:
+    if isinstance(contract, MoodLogIngestContract):
+        validation_result = validate_mood_log(df, contract)
+    else:
+        validation_result = validate_common_mood_log(df, contract)
+
+    clean_result = apply_validation_policy(
+        df=df,
+        validation_report=validation_result,
+        mode="train",
+        bad_action="quarantine",
+    )
+    return validation_result, clean_result
+
+
+async def revalidate_quarantine(
+    contract: BaseIngestContract,
+    ingest_quarantine_repo: IngestQuarantineRepo,
+    mood_log_repo: MoodLogRepo,
+    common_mood_log_repo: CommonMoodLogRepo,
+    ingest_fingerprint_repo: IngestFingerprintRepo,
+) -> QuarantineRevalidation:
+    """
+    Re-runs the current validation rules over quarantined rows of the dataset without
+    re-reading source files: rows that pass are loaded and removed from quarantine, the
+    rest stay there with refreshed issue codes. A row is superseded, and removed without
+    writing, only when its day was written to the table after the row was quarantined
+    (updated_at > created_at: a later ingest or the bot). Rows newer than the stored day
+    (e.g. a later export changed an already loaded day) are revalidated and may overwrite
+    it. Fingerprints of the written and superseded days are forgotten, so the next ingest
+    of the source compares them again instead of skipping.
+    """
+    rows = await ingest_quarantine_repo.get_quarantined_rows(contract.dataset)
+    if not rows:
+        return QuarantineRevalidation(contract.dataset, 0, 0, 0, 0, 0)
+
+    df = restore_quarantined_frame(rows, contract)
+
+    days = df["day"].dropna().dt.date.tolist()
+    if isinstance(contract, MoodLogIngestContract):
+        updated_at = await mood_log_repo.get_updated_at_by_day(days)
+    else:
+        updated_at = await common_mood_log_repo.get_updated_at_by_day(days)
+
+    # обидва часи — CURRENT_TIMESTAMP SQLite (UTC), тож порівнюються напряму
+    quarantined_at = {row.id: row.created_at for row in rows}
+    is_superseded = pd.Series(
+        [
+            day in updated_at and updated_at[day] > quarantined_at[row_id]
+            for row_id, day in zip(df.index, df["day"].dt.date, strict=True)
+        ],
+        index=df.index,
+        dtype=bool,
+    )
+    superseded = df.index[is_superseded]
+    superseded_days = df.loc[is_superseded, "day"].dt.date.tolist()
+    df = df.loc[~is_superseded]
+
+    validation_result, clean_result = await asyncio.to_thread(
+        revalidate_quarantined_frame, df, contract
+    )
+
+    df_clean = clean_result.df_clean
+    if isinstance(contract, MoodLogIngestContract):
+        load_result = await load_mood_log(
+            df=df_clean, contract=contract, mood_log_repo=mood_log_repo
+        )
+    else:
+        load_result = await load_common_mood_log(
+            df=df_clean, common_mood_log_repo=common_mood_log_repo
+        )
+
+    remaining = df.index.difference(df_clean.index)
+    issue_codes = get_row_issue_codes(validation_result, remaining)
+
+    await ingest_fingerprint_repo.forget_day_fingerprints(
+        contract.dataset, [*superseded_days, *df_clean["day"].dt.date]
+    )
+    await ingest_quarantine_repo.resolve_quarantined_rows(
+        [*df_clean.index.tolist(), *superseded.tolist()]
+    )
+    await ingest_quarantine_repo.update_issue_codes(
+        dict(zip(remaining.tolist(), issue_codes, strict=True))
+    )
+
+    result = QuarantineRevalidation(
+        dataset=contract.dataset,
+        rows_checked=len(rows),
+        rows_resolved=len(df_clean),
+        rows_superseded=len(superseded),
+        rows_still_quarantined=len(remaining),
+        rows_written=load_result.rows_written,
+    )
+    logger.info("Quarantine revalidated: %s", result)
+    return result
@@ -1,16 +1,52 @@
+from collections.abc import Iterator
 from pathlib import Path
 
 import pandas as pd
 
 column_mapping = {"Time": "day", "Mood": "mood", "Note": "note"}
 
+COMMON_MOOD_LOG_CSV_CHUNK_SIZE = 50_000
 
-def read_common_mood_log_csv(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(
+# настрій у файлі — текстова мітка ("Good"), у число її переводить transform
+column_dtypes = {"Mood": "string", "Note": "string"}
+
+
+def iter_common_mood_log_csv(
+    path: Path, chunk_size: int = COMMON_MOOD_LOG_CSV_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads the export in chunks of chunk_size rows with explicit dtypes: only the mapped
+    columns are parsed, and Time is parsed as a date while reading.
+    """
+    with pd.read_csv(
         path,
         encoding="utf-8",
         sep=",",
-    )
-    df = df.rename(columns=column_mapping)
+        usecols=lambda column: column in column_mapping,
+        dtype=column_dtypes,
+        parse_dates=["Time"],
+        chunksize=chunk_size,
+    ) as reader:
+        for chunk in reader:
+            yield chunk.rename(columns=column_mapping)
 
-    return df
+
+def read_common_mood_log_days(
+    path: Path, chunk_size: int = COMMON_MOOD_LOG_CSV_CHUNK_SIZE
+) -> pd.Series:
+    """Only the Time column of the whole export (raw values), read before the chunked pass."""
+    with pd.read_csv(
+        path,
+        encoding="utf-8",
+        sep=",",
+        usecols=lambda column: column == "Time",
+        dtype="string",
+        chunksize=chunk_size,
+    ) as reader:
+        days = [chunk["Time"] for chunk in reader if "Time" in chunk]
+
+    return pd.concat(days, ignore_index=True) if days else pd.Series(dtype="string")
+
+
+def read_common_mood_log_csv(path: Path) -> pd.DataFrame:
+    return pd.concat(iter_common_mood_log_csv(path), ignore_index=True)
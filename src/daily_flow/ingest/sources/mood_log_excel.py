@@ -1,12 +1,16 @@
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 
 import pandas as pd
+from openpyxl import load_workbook
 
 from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
 
 logger = logging.getLogger(__name__)
 
+MOOD_LOG_EXCEL_BATCH_SIZE = 5_000
+
 column_mapping = {
     "дата": "day",
     "Радість": "joy",
@@ -23,25 +27,63 @@ column_mapping = {
 }
 
 
+def _select_columns(header: tuple, required: set[str]) -> dict[int, str] | None:
+    names = [str(cell).strip() if cell is not None else None for cell in header]
+    if required - set(names):
+        return None
+
+    # перше входження назви, як у pandas (дублікати отримали б суфікс ".1")
+    positions: dict[int, str] = {}
+    for idx, name in enumerate(names):
+        if name in column_mapping and column_mapping[name] not in positions.values():
+            positions[idx] = column_mapping[name]
+    return positions
+
+
+def iter_mood_log_excel(
+    path: Path, contract: MoodLogIngestContract, batch_size: int = MOOD_LOG_EXCEL_BATCH_SIZE
+) -> Iterator[dict[str, pd.DataFrame | str]]:
+    """
+    Streams the workbook with openpyxl read_only mode: only header rows are inspected to
+    select sheets, and only the mapped columns of each row are kept. Yields
+    {"sheet_name", "sheet"} batches of at most batch_size rows, so memory stays bounded.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+
+    try:
+        sheet_names = list(contract.sheets) if contract.sheets else workbook.sheetnames
+        required = set(column_mapping) if not contract.sheets else set()
+        yielded_sheets = 0
+
+        for sheet_name in sheet_names:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+
+            header = next(rows, None)
+            positions = _select_columns(header, required) if header else None
+            if not positions:
+                logger.info("Sheet %s skipped: no mood_log header", sheet_name)
+                continue
+
+            yielded_sheets += 1
+            columns = list(positions.values())
+            batch = []
+            for row in rows:
+                batch.append([row[idx] if idx < len(row) else None for idx in positions])
+
+                if len(batch) >= batch_size:
+                    yield {"sheet_name": sheet_name, "sheet": pd.DataFrame(batch, columns=columns)}
+                    batch = []
+
+            if batch:
+                yield {"sheet_name": sheet_name, "sheet": pd.DataFrame(batch, columns=columns)}
+
+        if not yielded_sheets:
+            raise ValueError("Incorrect sheets count or excel file")
+    finally:
+        workbook.close()
+
+
 def read_mood_log_excel(
     path: Path, contract: MoodLogIngestContract
 ) -> list[dict[str, pd.DataFrame | str]]:
-    all_sheets = pd.read_excel(
-        path, sheet_name=contract.sheets or None, engine="openpyxl", header=[0]
-    )
-
-    if not contract.sheets and isinstance(all_sheets, dict):
-        all_sheets = {
-            name: df
-            for name, df in all_sheets.items()
-            if len(set(column_mapping.keys()) - set(df.columns.tolist())) == 0
-        }
-
-    if not all_sheets:
-        raise ValueError("Incorrect sheets count or excel file")
-
-    dfs_sheets = []
-    for sheet_name, df in all_sheets.items():
-        df = df.rename(columns=column_mapping)
-        dfs_sheets.append({"sheet_name": sheet_name, "sheet": df})
-    return dfs_sheets
+    return list(iter_mood_log_excel(path, contract))
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 import pandas as pd
 
 from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
@@ -18,14 +20,19 @@ def transform_mood_log_sheet(df_raw: pd.DataFrame, contract: MoodLogIngestContra
 
 
 def normalize_mood_log(
-    df_raws: list[dict[str, pd.DataFrame | str]], contract: MoodLogIngestContract
+    df_raws: Iterable[dict[str, pd.DataFrame | str]], contract: MoodLogIngestContract
 ) -> pd.DataFrame:
+    # df_raws може бути генератором батчів: кожен сирий батч типізується і одразу звільняється
     sheets = []
 
     for df_raw in df_raws:
         sheet = transform_mood_log_sheet(df_raw=df_raw["sheet"], contract=contract)
         sheets.append(sheet)
 
+    return concat_mood_log_sheets(sheets)
+
+
+def concat_mood_log_sheets(sheets: list[pd.DataFrame]) -> pd.DataFrame:
     df = pd.concat(sheets)
     df = df.reset_index(drop=True)
     return df
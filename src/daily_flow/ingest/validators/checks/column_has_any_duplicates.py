@@ -5,11 +5,19 @@ from daily_flow.ingest.validators.common import ERR, ValidationIssue
 
 
 def check_column_has_any_duplicates(
-    df: pd.DataFrame, column: str, error_code: ERR, message: str | None = None
+    df: pd.DataFrame,
+    column: str,
+    error_code: ERR,
+    message: str | None = None,
+    seen_values: set | None = None,
 ) -> CheckResult | None:
     not_na_columns = df[column].notna()
     all_duplicates = df.duplicated(subset=[column], keep=False)
 
+    # при потоковій обробці дублікатом є і значення, яке вже було в попередніх чанках
+    if seen_values:
+        all_duplicates |= df[column].isin(seen_values)
+
     duplicates_mask = not_na_columns & all_duplicates
 
     if duplicates_mask.any():
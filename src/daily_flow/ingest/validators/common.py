@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Generic, Literal, TypeVar
 
 import pandas as pd
@@ -35,3 +35,5 @@ class ValidationResult(Generic[ERR, WARN]):
     metrics: dict[str, Any]  # counts/ratios/min/max etc.
     bad_row_mask: pd.Series | None  # bool mask (len == len(df)), якщо хочеш quarantine/skip
     warnings_row_mask: pd.Series | None
+    # маска рядків для кожного коду помилки/попередження (для quarantine з кодами по рядку)
+    issue_masks: dict[ERR | WARN, pd.Series] = field(default_factory=dict)
@@ -22,12 +22,16 @@ from daily_flow.ingest.validators.engine import _base_validator
 
 
 def validate_common_mood_log(
-    df: pd.DataFrame, contract: CommonMoodLogIngestContract
+    df: pd.DataFrame, contract: CommonMoodLogIngestContract, seen_days: set | None = None
 ) -> ValidationResult[CommonMoodLogValidationErrors, CommonMoodLogValidationWarnings]:
     common_checks = [
         partial(check_column_has_any_na, df, "day", CommonMoodLogValidationErrors.MISSING_DAY),
         partial(
-            check_column_has_any_duplicates, df, "day", CommonMoodLogValidationErrors.DAY_DUPLICATE
+            check_column_has_any_duplicates,
+            df,
+            "day",
+            CommonMoodLogValidationErrors.DAY_DUPLICATE,
+            seen_values=seen_days,
         ),
         partial(
             check_column_out_of_range,
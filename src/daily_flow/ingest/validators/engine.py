@@ -57,4 +57,5 @@ def _base_validator(
         bad_row_mask=bad_row_mask,
         warnings_row_mask=warnings_row_mask,
         metrics=metrics,
+        issue_masks={**error_masks, **warning_masks},
     )
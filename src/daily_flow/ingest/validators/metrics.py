@@ -47,3 +47,44 @@ def get_common_ingest_metrics(
             "columns_missing_count": 0,
             "file_empty": False,
         }
+
+
+def merge_chunk_metrics(chunk_metrics: list[dict], issues: list[ValidationIssue]) -> dict:
+    """
+    Combines per-chunk metrics of a streamed file into file-level metrics:
+    counters are summed, day bounds widened, and distinct issue codes counted once.
+    """
+    merged: dict = {}
+
+    for metrics in chunk_metrics:
+        for key, value in metrics.items():
+            if key not in merged:
+                merged[key] = value
+            elif key == "min_day":
+                merged[key] = min(filter(None, [merged[key], value]), default="")
+            elif key == "max_day":
+                merged[key] = max(filter(None, [merged[key], value]), default="")
+            elif isinstance(value, int) and not isinstance(value, bool):
+                merged[key] += value
+
+    if merged:
+        merged["file_empty"] = all(m.get("file_empty", True) for m in chunk_metrics)
+        merged["has_required_columns"] = all(
+            m.get("has_required_columns", False) or m.get("file_empty", False)
+            for m in chunk_metrics
+        )
+        merged["columns_missing_count"] = max(
+            m.get("columns_missing_count", 0) for m in chunk_metrics
+        )
+        merged["error_count"] = len({i.code for i in issues if i.severity == "error"})
+        merged["warning_count"] = len({i.code for i in issues if i.severity == "warning"})
+
+    return merged
+
+
+def format_metrics_summary(metrics: dict) -> str:
+    # коротко для логу: повні метрики лежать в ingest_run.metrics
+    return ", ".join(
+        f"{key}={metrics.get(key, 0)}"
+        for key in ("rows_total", "rows_good", "rows_bad", "error_count", "warning_count")
+    )
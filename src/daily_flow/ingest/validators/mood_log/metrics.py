@@ -51,8 +51,6 @@ def get_mood_log_metrics(
     if basic_metrics["rows_total"] == 0:
         return cast(MoodLogMetrics, {**basic_metrics, **basic_extra_metrics})
 
-    mood_cols_with_value_mask = df[list(contract.mood_columns)].notna().any(axis=1)
-
     def get_count(key) -> int:
         mask = error_masks.get(key)
         if mask is None:
@@ -68,7 +66,9 @@ def get_mood_log_metrics(
         "unique_days": df["day"].dropna().nunique(),
         "min_day": min_day,
         "max_day": max_day,
-        "rows_with_any_mood": int(mood_cols_with_value_mask.sum()),
+        # рядки без жодного настрою вже позначені маскою NO_MOODS_VALUES
+        "rows_with_any_mood": basic_metrics["rows_total"]
+        - get_count(MoodLogValidationErrors.NO_MOODS_VALUES),
         "rows_missing_day": get_count(MoodLogValidationErrors.MISSING_DAY),
         "rows_duplicate_day": get_count(MoodLogValidationErrors.DAY_DUPLICATE),
         "rows_out_of_range": get_count(MoodLogValidationErrors.MOOD_IS_OUT_OF_RANGE),
@@ -0,0 +1,187 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache, lru_cache, partial
+
+import numpy as np
+import pandas as pd
+
+from daily_flow.ingest.schemas.mood_log import MoodLogIngestContract
+from daily_flow.ingest.validators.checks.common import CheckResult
+from daily_flow.ingest.validators.common import Severity, ValidationIssue
+from daily_flow.ingest.validators.mood_log.definitions import (
+    MoodLogValidationErrors,
+    MoodLogValidationWarnings,
+)
+
+SLEEP_COLUMN = "sleep"
+
+
+@dataclass(frozen=True)
+class PlanRule:
+    code: MoodLogValidationErrors | MoodLogValidationWarnings
+    severity: Severity
+    bit: int
+    message: str
+    columns: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class MoodLogValidationPlan:
+    """
+    Compiled mood_log checks: the mood block is extracted once as a float array with a NaN
+    mask, every rule sets one bit of a per-row flags array, and issues/masks are decoded
+    from the flags in the same order and shape as the per-check validators produced them.
+    """
+
+    rules: tuple[PlanRule, ...]
+    mood_columns: tuple[str, ...]
+    min_val: int
+    max_val: int
+    mostly_missing_threshold: float
+
+    def evaluate_flags(self, df: pd.DataFrame) -> np.ndarray:
+        values = df[list(self.mood_columns)].to_numpy(dtype=float, na_value=np.nan)
+        is_na = np.isnan(values)
+
+        n_columns = len(self.mood_columns)
+        na_count = is_na.sum(axis=1)
+        has_any = na_count < n_columns
+
+        if SLEEP_COLUMN in self.mood_columns:
+            sleep_na = is_na[:, self.mood_columns.index(SLEEP_COLUMN)]
+            other_na_count = na_count - sleep_na
+            n_other = n_columns - 1
+        else:
+            sleep_na = np.ones(len(df), dtype=bool)
+            other_na_count, n_other = na_count, n_columns
+
+        # NaN у порівняннях дає False, тому пропуски не псують range/integer правила
+        with np.errstate(invalid="ignore"):
+            out_of_range = ((values < self.min_val) | (values > self.max_val)).any(axis=1)
+            non_integer = (~is_na & (np.round(values) != values)).any(axis=1)
+            mostly_missing = other_na_count / max(n_other, 1) > self.mostly_missing_threshold
+
+        day_na = df["day"].isna().to_numpy()
+        duplicates = df.duplicated(subset=["day"], keep=False).to_numpy()
+
+        rule_masks = {
+            MoodLogValidationErrors.MISSING_DAY: day_na,
+            MoodLogValidationErrors.DAY_DUPLICATE: duplicates & ~day_na,
+            MoodLogValidationErrors.MOOD_IS_OUT_OF_RANGE: out_of_range & has_any,
+            MoodLogValidationErrors.MOOD_IS_ONLY_INT: non_integer,
+            MoodLogValidationErrors.NO_MOODS_VALUES: ~has_any,
+            MoodLogValidationWarnings.MANY_NAN_MOOD_VALUES: mostly_missing,
+            MoodLogValidationWarnings.SLEEP_ONLY_VALUE: (
+                has_any & (other_na_count == n_other) & ~sleep_na
+            ),
+        }
+
+        flags = np.zeros(len(df), dtype=np.uint8)
+        for rule in self.rules:
+            flags |= rule_masks[rule.code].astype(np.uint8) << rule.bit
+
+        return flags
+
+    def evaluate(self, df: pd.DataFrame) -> dict[str, CheckResult]:
+        flags = self.evaluate_flags(df)
+
+        results = {}
+        for rule in self.rules:
+            mask = (flags >> rule.bit) & 1 == 1
+            if not mask.any():
+                continue
+
+            issue = ValidationIssue(
+                code=rule.code,
+                severity=rule.severity,
+                message=rule.message,
+                count=int(mask.sum()),
+                example_index=df.index[mask][:5].tolist(),
+                columns=list(rule.columns),
+            )
+            results[rule.code] = {"issue": issue, "mask": pd.Series(mask, index=df.index)}
+
+        return results
+
+    def build_checks(self, df: pd.DataFrame) -> tuple[list[Callable], list[Callable]]:
+        # перевірки ліниві: план рахується один раз і лише після перевірки обовʼязкових колонок
+        evaluate = cache(partial(self.evaluate, df))
+
+        def check(code) -> CheckResult | None:
+            return evaluate().get(code)
+
+        error_checks = [partial(check, r.code) for r in self.rules if r.severity == "error"]
+        warning_checks = [partial(check, r.code) for r in self.rules if r.severity == "warning"]
+        return error_checks, warning_checks
+
+
+@lru_cache(maxsize=8)
+def compile_mood_log_plan(
+    contract: MoodLogIngestContract,
+    min_val: int = 1,
+    max_val: int = 4,
+    mostly_missing_threshold: float = 0.5,
+) -> MoodLogValidationPlan:
+    mood_columns = tuple(contract.mood_columns)
+    mood_without_sleep = tuple(c for c in mood_columns if c != SLEEP_COLUMN)
+    joined = ", ".join(mood_columns)
+
+    rules = (
+        PlanRule(
+            MoodLogValidationErrors.MISSING_DAY,
+            "error",
+            0,
+            "Column 'day' has missing values",
+            ("day",),
+        ),
+        PlanRule(
+            MoodLogValidationErrors.DAY_DUPLICATE,
+            "error",
+            1,
+            "Column 'day' has duplicates",
+            ("day",),
+        ),
+        PlanRule(
+            MoodLogValidationErrors.MOOD_IS_OUT_OF_RANGE,
+            "error",
+            2,
+            f"Columns: {joined} are out of range {min_val} - {max_val}",
+            mood_columns,
+        ),
+        PlanRule(
+            MoodLogValidationErrors.MOOD_IS_ONLY_INT,
+            "error",
+            3,
+            f"Columns: {joined} can be only integer",
+            mood_columns,
+        ),
+        PlanRule(
+            MoodLogValidationErrors.NO_MOODS_VALUES,
+            "error",
+            4,
+            "All of mood columns haven't any value",
+            mood_columns,
+        ),
+        PlanRule(
+            MoodLogValidationWarnings.MANY_NAN_MOOD_VALUES,
+            "warning",
+            5,
+            f"More than {int(mostly_missing_threshold * 100)}% of mood values are empty",
+            mood_columns,
+        ),
+        PlanRule(
+            MoodLogValidationWarnings.SLEEP_ONLY_VALUE,
+            "warning",
+            6,
+            "There is only sleep value without other moods",
+            mood_without_sleep,
+        ),
+    )
+
+    return MoodLogValidationPlan(
+        rules=rules,
+        mood_columns=mood_columns,
+        min_val=min_val,
+        max_val=max_val,
+        mostly_missing_threshold=mostly_missing_threshold,
+    )
@@ -11,6 +11,7 @@ from daily_flow.db.errors import (
     UnknownFieldError,
 )
 from daily_flow.db.repositories.activity.activity_repo import Activity, ActivityRepo
+from daily_flow.db.repositories.pagination import Page, PageCursor
 from daily_flow.services.activity.activity.dto import UpsertActivityDTO
 from daily_flow.services.errors import ConflictError, TemporaryError, UserInputError
 
@@ -81,6 +82,17 @@ class ActivityService:
         except (RepoError, SQLAlchemyError) as e:
             raise TemporaryError("Database error. Please try again.") from e
 
+    async def get_activities_page(
+        self, limit: int, cursor: PageCursor | None = None
+    ) -> Page[Activity]:
+        if not limit or limit <= 0:
+            raise UserInputError("limit must be > 0")
+
+        try:
+            return await self._repo.get_activities_page(limit, cursor)
+        except (RepoError, SQLAlchemyError) as e:
+            raise TemporaryError("Database error. Please try again.") from e
+
     async def get_activities_by_category(self, category_id: int) -> list[Activity]:
         if not category_id:
             raise UserInputError("Please provide category_id")
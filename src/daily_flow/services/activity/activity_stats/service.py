@@ -0,0 +1,27 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from daily_flow.db.errors import MissingRequiredFieldError, RepoError
+from daily_flow.db.repositories.activity.activity_stats_repo import (
+    ActivityStatsRepo,
+    ActivityStatsReport,
+)
+from daily_flow.services.activity.activity_usage.dto import ActivityUsagePeriodDTO
+from daily_flow.services.errors import TemporaryError, UserInputError
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityStatsService:
+    def __init__(self, repo: ActivityStatsRepo) -> None:
+        self._repo = repo
+
+    async def get_stats(self, dto: ActivityUsagePeriodDTO) -> ActivityStatsReport:
+        if dto.date_from > dto.date_to:
+            raise UserInputError("date_from must be before date_to")
+
+        try:
+            return await self._repo.get_stats(dto.date_from, dto.date_to)
+        except (MissingRequiredFieldError, RepoError, SQLAlchemyError) as e:
+            raise TemporaryError("Database error. Please try again.") from e
@@ -12,6 +12,7 @@ from daily_flow.db.errors import (
     UnknownFieldError,
 )
 from daily_flow.db.repositories.activity.activity_usage_repo import ActivityUsage, ActivityUsageRepo
+from daily_flow.db.repositories.pagination import Page, PageCursor
 from daily_flow.services.activity.activity_usage.dto import (
     ActivityUsagePeriodDTO,
     UpsertActivityUsageDTO,
@@ -108,6 +109,32 @@ class ActivityUsageService:
         except (MissingRequiredFieldError, RepoError, SQLAlchemyError) as e:
             raise TemporaryError("Database error. Please try again.") from e
 
+    async def get_activity_usages_page_by_activity(
+        self, activity_id: int, limit: int, cursor: PageCursor | None = None
+    ) -> Page[ActivityUsage]:
+        if not activity_id:
+            raise UserInputError("Please provide activity_id")
+        if not limit or limit <= 0:
+            raise UserInputError("limit must be > 0")
+
+        try:
+            return await self._repo.get_activity_usages_page_by_activity(activity_id, limit, cursor)
+        except (RepoError, SQLAlchemyError) as e:
+            raise TemporaryError("Database error. Please try again.") from e
+
+    async def get_activity_usages_page_by_period(
+        self, dto: ActivityUsagePeriodDTO, limit: int, cursor: PageCursor | None = None
+    ) -> Page[ActivityUsage]:
+        if not limit or limit <= 0:
+            raise UserInputError("limit must be > 0")
+
+        try:
+            return await self._repo.get_activity_usages_page_by_period(
+                dto.date_from, dto.date_to, limit, cursor
+            )
+        except (MissingRequiredFieldError, RepoError, SQLAlchemyError) as e:
+            raise TemporaryError("Database error. Please try again.") from e
+
     async def get_last_activity_usages(self, limit: int) -> list[ActivityUsage]:
         if not limit or limit <= 0:
             raise UserInputError("limit must be > 0")
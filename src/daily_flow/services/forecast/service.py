@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from catboost import CatBoostError, CatBoostRegressor
+from sqlalchemy.exc import SQLAlchemyError
+
+from daily_flow.analytics.feature_store import (
+    OBSERVED_COL,
+    get_feature_store_path,
+    refresh_feature_store,
+)
+from daily_flow.analytics.modeling.publish import FORECAST_MODEL_PATH
+from daily_flow.db.errors import RepoError
+from daily_flow.db.repositories.feature_store_repo import FeatureStoreRepo
+from daily_flow.services.errors import NotFoundError, TemporaryError
+
+logger = logging.getLogger(__name__)
+
+MOOD_MIN, MOOD_MAX = 1.0, 7.0
+
+
+@dataclass(frozen=True)
+class Forecast:
+    day: date
+    mood: float
+    last_logged_day: date
+    model_published_at: datetime
+
+
+@dataclass(frozen=True)
+class _NextDayVector:
+    store_mtime_ns: int
+    features: tuple[str, ...]
+    day: date
+    values: np.ndarray
+
+
+class ForecastService:
+    def __init__(
+        self, repo: FeatureStoreRepo, db_url: str, model_path: Path = FORECAST_MODEL_PATH
+    ) -> None:
+        self._repo = repo
+        self._db_url = db_url
+        self._model_path = model_path
+        self._store_path = get_feature_store_path(db_url)
+
+        self._model: CatBoostRegressor | None = None
+        self._model_mtime_ns: int | None = None
+        self._vector: _NextDayVector | None = None
+        self._lock = asyncio.Lock()
+
+    async def load_model(self) -> bool:
+        # один stat на запит: новий опублікований файл (os.replace) має інший mtime
+        try:
+            mtime_ns = self._model_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self._model is not None
+
+        if mtime_ns == self._model_mtime_ns:
+            return True
+
+        try:
+            model = await asyncio.to_thread(self._read_model)
+        except CatBoostError:
+            logger.exception("ForecastService.load_model failed (path=%s)", self._model_path)
+            return self._model is not None
+
+        self._model, self._model_mtime_ns = model, mtime_ns
+        self._vector = None
+        logger.info(
+            "Forecast model loaded: %s (%d features)", self._model_path, len(model.feature_names_)
+        )
+        return True
+
+    def _read_model(self) -> CatBoostRegressor:
+        model = CatBoostRegressor()
+        model.load_model(str(self._model_path), format="cbm")
+        return model
+
+    def _get_next_day_vector(self, features: tuple[str, ...]) -> _NextDayVector | None:
+        try:
+            store_mtime_ns = self._store_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        vector = self._vector
+        if vector and vector.store_mtime_ns == store_mtime_ns and vector.features == features:
+            return vector
+
+        # модель могли навчити на ознаках, яких уже (або ще) немає у сховищі:
+        # звіряємо назви зі схемою parquet до читання, а не ловимо KeyError
+        missing = sorted(set(features) - set(pq.read_schema(self._store_path).names))
+        if missing:
+            logger.warning(
+                "Forecast model features are missing from the feature store: %s",
+                ", ".join(missing),
+            )
+            raise NotFoundError("The forecast model does not match the stored features.")
+
+        # лише потрібні моделі колонки, а не всю матрицю ознак
+        store = pd.read_parquet(self._store_path, columns=[*features, OBSERVED_COL])
+        if store.empty or store[OBSERVED_COL].iloc[-1] != 0.0:
+            return None
+
+        self._vector = _NextDayVector(
+            store_mtime_ns=store_mtime_ns,
+            features=features,
+            day=store.index[-1].date(),
+            values=store[list(features)].iloc[[-1]].to_numpy(dtype=float),
+        )
+        return self._vector
+
+    async def warm_up(self) -> None:
+        if not await self.load_model():
+            logger.warning("Forecast model is not published yet (path=%s)", self._model_path)
+            return
+
+        try:
+            await self.predict_next_day()
+        except (NotFoundError, TemporaryError) as e:
+            logger.warning("ForecastService.warm_up skipped: %s", e)
+
+    async def predict_next_day(self) -> Forecast:
+        async with self._lock:
+            if not await self.load_model():
+                raise NotFoundError("Forecast model is not published yet.")
+
+            try:
+                if await self._repo.count_invalidated_days() or not self._store_path.exists():
+                    await refresh_feature_store(self._db_url)
+            except (RepoError, SQLAlchemyError, sqlite3.Error) as e:
+                logger.exception("ForecastService.predict_next_day failed to refresh features")
+                raise TemporaryError("Database error. Please try again.") from e
+
+            # читання parquet блокує: не тримаємо event loop, поки чекаємо під self._lock
+            vector = await asyncio.to_thread(
+                self._get_next_day_vector, tuple(self._model.feature_names_)
+            )
+            if vector is None:
+                raise NotFoundError("There is no mood data to forecast from.")
+
+            # вектор сховища — це день після останнього запису; прогноз «на завтра»
+            # має сенс, лише якщо останній записаний день — сьогодні
+            if vector.day != date.today() + timedelta(days=1):
+                raise NotFoundError(
+                    f"The last logged day ({vector.day - timedelta(days=1)}) is not today."
+                )
+
+            mood = float(self._model.predict(vector.values)[0])
+
+            return Forecast(
+                day=vector.day,
+                mood=float(np.clip(mood, MOOD_MIN, MOOD_MAX)),
+                last_logged_day=vector.day - timedelta(days=1),
+                model_published_at=datetime.fromtimestamp(self._model_mtime_ns / 1e9),
+            )
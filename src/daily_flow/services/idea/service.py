@@ -11,6 +11,7 @@ from daily_flow.db.errors import (
     UnknownFieldError,
 )
 from daily_flow.db.repositories.idea_repo import Idea, IdeaRepo, Sphere
+from daily_flow.db.repositories.pagination import Page, PageCursor
 from daily_flow.services.errors import ConflictError, TemporaryError, UserInputError
 from daily_flow.services.idea.dto import SphereToIdeaDTO, UpsertIdeaDTO, UpsertSphereDTO
 
@@ -117,6 +118,15 @@ class IdeaService:
         except (RepoError, SQLAlchemyError) as e:
             raise TemporaryError("Database error. Please try again.") from e
 
+    async def get_ideas_page(self, limit: int, cursor: PageCursor | None = None) -> Page[Idea]:
+        if not limit or limit <= 0:
+            raise UserInputError("limit must be > 0")
+
+        try:
+            return await self._repo.get_ideas_page(limit, cursor)
+        except (RepoError, SQLAlchemyError) as e:
+            raise TemporaryError("Database error. Please try again.") from e
+
     async def get_all_spheres(self) -> list[Sphere]:
         try:
             return await self._repo.get_all_spheres()
@@ -1,10 +1,21 @@
-from . import activity, common, common_mood_log, date, idea, mood_log, start, submit_form
+from . import (
+    activity,
+    common,
+    common_mood_log,
+    date,
+    forecast,
+    idea,
+    mood_log,
+    start,
+    submit_form,
+)
 
 __all__ = [
     "activity",
     "common",
     "common_mood_log",
     "date",
+    "forecast",
     "idea",
     "mood_log",
     "start",
@@ -1,3 +1,3 @@
-from . import activity, activity_category, activity_usage, category
+from . import activity, activity_category, activity_stats, activity_usage, category
 
-__all__ = ["activity", "activity_category", "activity_usage", "category"]
+__all__ = ["activity", "activity_category", "activity_stats", "activity_usage", "category"]
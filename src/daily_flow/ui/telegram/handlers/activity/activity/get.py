@@ -4,32 +4,52 @@ from aiogram import F, types
 from aiogram.fsm.context import FSMContext
 
 from daily_flow.app.container import Container
+from daily_flow.db.repositories.pagination import PageCursor
 from daily_flow.ui.telegram.handlers.activity.category.get import get_all_categories_text
 from daily_flow.ui.telegram.keyboards.activity import ActivityMenu
 from daily_flow.ui.telegram.render.activity import render_activity, render_activity_compact
 from daily_flow.ui.telegram.runtime import router
 from daily_flow.ui.telegram.states import ActivityByCategoryGetForm, ActivityGetForm
+from daily_flow.ui.telegram.utils.pagination import (
+    PageScreen,
+    get_page_keyboard,
+    page_callback_prefix,
+    parse_page_callback,
+)
 from daily_flow.ui.telegram.utils.truncate_text import truncate_text
 
 logger = logging.getLogger(__name__)
 
 
-async def get_all_activities_text(db_container: Container) -> str:
-    activities = await db_container.activity_service.get_all_activities()
+ACTIVITIES_PAGE_SIZE = 30
+
 
-    if not activities:
-        return "🎯 Поки що немає жодної активності."
+async def get_activities_page_view(
+    db_container: Container, cursor: PageCursor | None = None
+) -> tuple[str, types.InlineKeyboardMarkup | None]:
+    page = await db_container.activity_service.get_activities_page(ACTIVITIES_PAGE_SIZE, cursor)
 
-    lines = "\n".join(render_activity_compact(a) for a in activities)
+    if not page.items:
+        return "🎯 Поки що немає жодної активності.", None
+
+    lines = "\n".join(render_activity_compact(a) for a in page.items)
     text = "🎯 **Список активностей**\n\n" + lines
-    return truncate_text(text)
+    return truncate_text(text), get_page_keyboard(PageScreen.ACTIVITIES, page)
+
+
+async def get_all_activities_text(db_container: Container) -> str:
+    # підказка у формах — лише перша сторінка, гортати можна у списку активностей
+    text, _ = await get_activities_page_view(db_container)
+    return text
 
 
 @router.message(F.text == ActivityMenu.BTN_GET_ALL_ACTIVITIES)
 async def get_all_activities(message: types.Message, db_container: Container):
     try:
-        text = await get_all_activities_text(db_container)
-        await message.answer(text, reply_markup=ActivityMenu.get(), parse_mode="Markdown")
+        text, keyboard = await get_activities_page_view(db_container)
+        await message.answer(
+            text, reply_markup=keyboard or ActivityMenu.get(), parse_mode="Markdown"
+        )
     except Exception as e:
         logger.exception("Activity get_all_activities failed: %s", e)
         await message.answer(
@@ -38,6 +58,19 @@ async def get_all_activities(message: types.Message, db_container: Container):
         )
 
 
+@router.callback_query(F.data.startswith(page_callback_prefix(PageScreen.ACTIVITIES)))
+async def paginate_activities(callback: types.CallbackQuery, db_container: Container):
+    cursor, _ = parse_page_callback(callback.data)
+
+    try:
+        text, keyboard = await get_activities_page_view(db_container, cursor)
+        await callback.message.edit_text(text, reply_markup=keyboard, parse_mode="Markdown")
+        await callback.answer()
+    except Exception as e:
+        logger.exception("Activity paginate_activities failed: %s", e)
+        await callback.answer("❌ Не вдалося завантажити сторінку.")
+
+
 @router.message(F.text == ActivityMenu.BTN_GET_ACTIVITY)
 async def ask_activity_ref(message: types.Message, state: FSMContext, db_container: Container):
     await state.set_state(ActivityGetForm.waiting_for_ref)
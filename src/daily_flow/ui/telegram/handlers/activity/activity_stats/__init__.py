@@ -0,0 +1,3 @@
+from . import get
+
+__all__ = ["get"]
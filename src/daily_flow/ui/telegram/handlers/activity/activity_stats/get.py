@@ -0,0 +1,69 @@
+import logging
+from datetime import datetime, timedelta
+
+from aiogram import F, types
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from daily_flow.app.container import Container
+from daily_flow.services.activity.activity_usage.dto import ActivityUsagePeriodDTO
+from daily_flow.ui.telegram.keyboards.activity import ActivityMenu
+from daily_flow.ui.telegram.render.activity import render_activity_stats_report
+from daily_flow.ui.telegram.runtime import router
+from daily_flow.ui.telegram.utils.truncate_text import truncate_text
+
+logger = logging.getLogger(__name__)
+
+STATS_PERIODS_DAYS = (7, 30, 90, 365)
+DEFAULT_STATS_PERIOD_DAYS = 30
+
+
+def get_stats_period_keyboard() -> types.InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    for days in STATS_PERIODS_DAYS:
+        builder.button(text=f"{days} дн.", callback_data=f"activity_stats:{days}")
+
+    builder.adjust(len(STATS_PERIODS_DAYS))
+    return builder.as_markup()
+
+
+async def get_stats_text(db_container: Container, days: int) -> str:
+    now = datetime.now()
+    dto = ActivityUsagePeriodDTO(date_from=now - timedelta(days=days), date_to=now)
+
+    report = await db_container.activity_stats_service.get_stats(dto)
+    return truncate_text(render_activity_stats_report(report))
+
+
+@router.message(F.text == ActivityMenu.BTN_GET_STATS)
+async def get_activity_stats(message: types.Message, db_container: Container):
+    try:
+        text = await get_stats_text(db_container, DEFAULT_STATS_PERIOD_DAYS)
+        await message.answer(text, reply_markup=get_stats_period_keyboard(), parse_mode="Markdown")
+    except Exception as e:
+        logger.exception("ActivityStats get failed: %s", e)
+        await message.answer(
+            "❌ Сталася помилка під час підрахунку статистики.", reply_markup=ActivityMenu.get()
+        )
+
+
+@router.callback_query(F.data.startswith("activity_stats:"))
+async def change_activity_stats_period(callback: types.CallbackQuery, db_container: Container):
+    days = int(callback.data.split(":", 1)[1])
+
+    try:
+        text = await get_stats_text(db_container, days)
+        await callback.message.edit_text(
+            text, reply_markup=get_stats_period_keyboard(), parse_mode="Markdown"
+        )
+        await callback.answer()
+    except TelegramBadRequest as e:
+        # той самий період і ті самі дані: повідомлення вже актуальне
+        if "message is not modified" not in str(e):
+            logger.exception("ActivityStats change period failed: %s", e)
+            await callback.answer("❌ Не вдалося оновити статистику.")
+            return
+        await callback.answer()
+    except Exception as e:
+        logger.exception("ActivityStats change period failed: %s", e)
+        await callback.answer("❌ Не вдалося порахувати статистику.")
@@ -1,9 +1,11 @@
 import logging
+from datetime import datetime
 
 from aiogram import F, types
 from aiogram.fsm.context import FSMContext
 
 from daily_flow.app.container import Container
+from daily_flow.db.repositories.pagination import PageCursor
 from daily_flow.services.activity.activity_usage.dto import ActivityUsagePeriodDTO
 from daily_flow.ui.telegram.keyboards.activity import ActivityMenu
 from daily_flow.ui.telegram.render.activity import render_activity_usage
@@ -15,10 +17,57 @@ from daily_flow.ui.telegram.states import (
     ActivityUsagePeriodForm,
 )
 from daily_flow.ui.telegram.utils.datetime_parse import parse_to_datetime
+from daily_flow.ui.telegram.utils.pagination import (
+    PageScreen,
+    get_page_keyboard,
+    page_callback_prefix,
+    parse_page_callback,
+)
 from daily_flow.ui.telegram.utils.truncate_text import truncate_text
 
 logger = logging.getLogger(__name__)
 
+USAGES_PAGE_SIZE = 8
+
+# межі періоду їдуть у callback data, тож формат має бути коротким
+PERIOD_CALLBACK_FORMAT = "%Y%m%d%H%M"
+
+
+async def get_usages_by_activity_page_view(
+    db_container: Container, activity_id: int, cursor: PageCursor | None = None
+) -> tuple[str, types.InlineKeyboardMarkup | None]:
+    page = await db_container.activity_usage_service.get_activity_usages_page_by_activity(
+        activity_id, USAGES_PAGE_SIZE, cursor
+    )
+
+    if not page.items:
+        return "📈 Поки що немає жодного запису виконання.", None
+
+    blocks = "\n\n".join(render_activity_usage(u) for u in page.items)
+    text = truncate_text(f"📈 **Історія виконань (Activity ID={activity_id})**\n\n{blocks}")
+    return text, get_page_keyboard(PageScreen.USAGES_BY_ACTIVITY, page, str(activity_id))
+
+
+async def get_usages_by_period_page_view(
+    db_container: Container, dto: ActivityUsagePeriodDTO, cursor: PageCursor | None = None
+) -> tuple[str, types.InlineKeyboardMarkup | None]:
+    page = await db_container.activity_usage_service.get_activity_usages_page_by_period(
+        dto, USAGES_PAGE_SIZE, cursor
+    )
+
+    if not page.items:
+        return "📅 За цей період записів немає.", None
+
+    blocks = "\n\n".join(render_activity_usage(u) for u in page.items)
+    text = truncate_text(f"📅 **Виконання за період**\n\n{blocks}")
+    keyboard = get_page_keyboard(
+        PageScreen.USAGES_BY_PERIOD,
+        page,
+        dto.date_from.strftime(PERIOD_CALLBACK_FORMAT),
+        dto.date_to.strftime(PERIOD_CALLBACK_FORMAT),
+    )
+    return text, keyboard
+
 
 @router.message(F.text == ActivityMenu.BTN_GET_USAGE_BY_ID)
 async def ask_usage_id(message: types.Message, state: FSMContext):
@@ -80,20 +129,12 @@ async def perform_get_usages_by_activity(
         return await message.answer("❌ Activity ID має бути числом. Спробуй ще раз:")
 
     try:
-        usages = await db_container.activity_usage_service.get_activity_usages_by_activity(
-            activity_id
-        )
+        text, keyboard = await get_usages_by_activity_page_view(db_container, activity_id)
         await state.clear()
 
-        if not usages:
-            return await message.answer(
-                "📈 Поки що немає жодного запису виконання.", reply_markup=ActivityMenu.get()
-            )
-
-        # компактно
-        blocks = "\n\n".join(render_activity_usage(u) for u in usages)
-        text = truncate_text(f"📈 **Історія виконань (Activity ID={activity_id})**\n\n{blocks}")
-        await message.answer(text, reply_markup=ActivityMenu.get(), parse_mode="Markdown")
+        await message.answer(
+            text, reply_markup=keyboard or ActivityMenu.get(), parse_mode="Markdown"
+        )
 
     except Exception as e:
         logger.exception("ActivityUsage get_by_activity failed: %s", e)
@@ -103,6 +144,21 @@ async def perform_get_usages_by_activity(
         )
 
 
+@router.callback_query(F.data.startswith(page_callback_prefix(PageScreen.USAGES_BY_ACTIVITY)))
+async def paginate_usages_by_activity(callback: types.CallbackQuery, db_container: Container):
+    cursor, (activity_id,) = parse_page_callback(callback.data)
+
+    try:
+        text, keyboard = await get_usages_by_activity_page_view(
+            db_container, int(activity_id), cursor
+        )
+        await callback.message.edit_text(text, reply_markup=keyboard, parse_mode="Markdown")
+        await callback.answer()
+    except Exception as e:
+        logger.exception("ActivityUsage paginate_by_activity failed: %s", e)
+        await callback.answer("❌ Не вдалося завантажити сторінку.")
+
+
 @router.message(F.text == ActivityMenu.BTN_GET_LAST_USAGES)
 async def ask_limit_for_last(message: types.Message, state: FSMContext):
     await state.set_state(ActivityUsageLastForm.waiting_for_limit)
@@ -189,18 +245,13 @@ async def perform_get_usages_by_period(
 
     try:
         dto = ActivityUsagePeriodDTO(date_from=dt_from, date_to=dt_to)
-        usages = await db_container.activity_usage_service.get_activity_usages_by_period(dto)
+        text, keyboard = await get_usages_by_period_page_view(db_container, dto)
 
         await state.clear()
 
-        if not usages:
-            return await message.answer(
-                "📅 За цей період записів немає.", reply_markup=ActivityMenu.get()
-            )
-
-        blocks = "\n\n".join(render_activity_usage(u) for u in usages)
-        text = truncate_text(f"📅 **Виконання за період**\n\n{blocks}")
-        await message.answer(text, reply_markup=ActivityMenu.get(), parse_mode="Markdown")
+        await message.answer(
+            text, reply_markup=keyboard or ActivityMenu.get(), parse_mode="Markdown"
+        )
 
     except Exception as e:
         logger.exception("ActivityUsage get_by_period failed: %s", e)
@@ -209,3 +260,20 @@ async def perform_get_usages_by_period(
             "❌ Сталася помилка під час отримання записів за період.",
             reply_markup=ActivityMenu.get(),
         )
+
+
+@router.callback_query(F.data.startswith(page_callback_prefix(PageScreen.USAGES_BY_PERIOD)))
+async def paginate_usages_by_period(callback: types.CallbackQuery, db_container: Container):
+    cursor, (raw_from, raw_to) = parse_page_callback(callback.data)
+    dto = ActivityUsagePeriodDTO(
+        date_from=datetime.strptime(raw_from, PERIOD_CALLBACK_FORMAT),
+        date_to=datetime.strptime(raw_to, PERIOD_CALLBACK_FORMAT),
+    )
+
+    try:
+        text, keyboard = await get_usages_by_period_page_view(db_container, dto, cursor)
+        await callback.message.edit_text(text, reply_markup=keyboard, parse_mode="Markdown")
+        await callback.answer()
+    except Exception as e:
+        logger.exception("ActivityUsage paginate_by_period failed: %s", e)
+        await callback.answer("❌ Не вдалося завантажити сторінку.")
@@ -0,0 +1,37 @@
+import logging
+
+from aiogram import F, types
+from aiogram.filters import StateFilter
+from aiogram.fsm.context import FSMContext
+
+from daily_flow.app.container import Container
+from daily_flow.services.errors import NotFoundError, ServiceError
+from daily_flow.ui.telegram.keyboards.main import MainMenu
+from daily_flow.ui.telegram.render.forecast import render_forecast
+from daily_flow.ui.telegram.runtime import router
+
+logger = logging.getLogger(__name__)
+
+
+@router.message(StateFilter(None), F.text == MainMenu.BTN_FORECAST)
+async def forecast(message: types.Message, state: FSMContext, db_container: Container):
+    await state.clear()
+
+    try:
+        next_day_forecast = await db_container.forecast_service.predict_next_day()
+    except NotFoundError as e:
+        logger.info("Forecast is not available: %s", e)
+        await message.answer(
+            "🤷 Прогноз поки недоступний: "
+            "немає опублікованої моделі або сьогоднішнього запису настрою.",
+            reply_markup=MainMenu.get(),
+        )
+        return
+    except ServiceError as e:
+        logger.error("Service error: %s", e)
+        await message.answer("❌ Сталася помилка сервісу.", reply_markup=MainMenu.get())
+        return
+
+    await message.answer(
+        render_forecast(next_day_forecast), reply_markup=MainMenu.get(), parse_mode="Markdown"
+    )
@@ -4,34 +4,51 @@ from aiogram import F, types
 from aiogram.fsm.context import FSMContext
 
 from daily_flow.app.container import Container
+from daily_flow.db.repositories.pagination import PageCursor
 from daily_flow.ui.telegram.handlers.idea.sphere.get import get_all_spheres_text
 from daily_flow.ui.telegram.keyboards.idea import IdeaMenu
 from daily_flow.ui.telegram.render.idea import render_idea
 from daily_flow.ui.telegram.runtime import router
 from daily_flow.ui.telegram.states import IdeaBySphereGetForm
+from daily_flow.ui.telegram.utils.pagination import (
+    PageScreen,
+    get_page_keyboard,
+    page_callback_prefix,
+    parse_page_callback,
+)
+from daily_flow.ui.telegram.utils.truncate_text import truncate_text
 
 logger = logging.getLogger(__name__)
 
 
-async def get_all_ideas_text(db_container: Container) -> str:
-    ideas = await db_container.idea_service.get_all_ideas()
+IDEAS_PAGE_SIZE = 10
+
+
+async def get_ideas_page_view(
+    db_container: Container, cursor: PageCursor | None = None
+) -> tuple[str, types.InlineKeyboardMarkup | None]:
+    page = await db_container.idea_service.get_ideas_page(IDEAS_PAGE_SIZE, cursor)
 
-    if not ideas:
-        return "💡 Поки що немає жодної ідеї.\n\nСтвори першу через «✨ Додати/оновити ідею»."
+    if not page.items:
+        return "💡 Поки що немає жодної ідеї.\n\nСтвори першу через «✨ Додати/оновити ідею».", None
 
-    ideas_text = "\n".join(render_idea(i) for i in ideas)
+    ideas_text = "\n".join(render_idea(i) for i in page.items)
 
-    text = "💡 **Список ідей**:\n" + ideas_text
-    if len(text) > 3500:
-        text = text[:3500] + "\n…"
+    text = truncate_text("💡 **Список ідей**:\n" + ideas_text)
+    return text, get_page_keyboard(PageScreen.IDEAS, page)
+
+
+async def get_all_ideas_text(db_container: Container) -> str:
+    # підказка у формах — лише перша сторінка, гортати можна у «📚 Список ідей»
+    text, _ = await get_ideas_page_view(db_container)
     return text
 
 
 @router.message(F.text == IdeaMenu.BTN_GET_ALL_IDEAS)
 async def get_all_ideas(message: types.Message, db_container: Container):
     try:
-        text = await get_all_ideas_text(db_container)
-        await message.answer(text, reply_markup=IdeaMenu.get(), parse_mode="Markdown")
+        text, keyboard = await get_ideas_page_view(db_container)
+        await message.answer(text, reply_markup=keyboard or IdeaMenu.get(), parse_mode="Markdown")
     except Exception as e:
         logger.exception("Idea get_all_ideas failed: %s", e)
         await message.answer(
@@ -39,6 +56,19 @@ async def get_all_ideas(message: types.Message, db_container: Container):
         )
 
 
+@router.callback_query(F.data.startswith(page_callback_prefix(PageScreen.IDEAS)))
+async def paginate_ideas(callback: types.CallbackQuery, db_container: Container):
+    cursor, _ = parse_page_callback(callback.data)
+
+    try:
+        text, keyboard = await get_ideas_page_view(db_container, cursor)
+        await callback.message.edit_text(text, reply_markup=keyboard, parse_mode="Markdown")
+        await callback.answer()
+    except Exception as e:
+        logger.exception("Idea paginate_ideas failed: %s", e)
+        await callback.answer("❌ Не вдалося завантажити сторінку.")
+
+
 @router.message(F.text == IdeaMenu.BTN_IDEAS_BY_SPHERE)
 async def ask_sphere_id_for_ideas(
     message: types.Message, state: FSMContext, db_container: Container
@@ -26,6 +26,7 @@ class ActivityMenu:
     BTN_GET_USAGES_BY_PERIOD = "📅 Виконання за період"
     BTN_DELETE_USAGE = "🗑️ Видалити запис виконання"
     BTN_DELETE_USAGES_BY_ACTIVITY = "🧹 Очистити історію активності"
+    BTN_GET_STATS = "📊 Статистика активностей"
 
     @classmethod
     def get(cls):
@@ -53,6 +54,7 @@ class ActivityMenu:
         builder.button(text=cls.BTN_GET_USAGES_BY_PERIOD)
         builder.button(text=cls.BTN_DELETE_USAGE)
         builder.button(text=cls.BTN_DELETE_USAGES_BY_ACTIVITY)
+        builder.button(text=cls.BTN_GET_STATS)
 
         builder.button(text=MainMenu.BTN_MENU)
 
@@ -6,6 +6,7 @@ class MainMenu:
     BTN_MOOD = "❤️ З емоціями"
     BTN_IDEAS = "💡 З ідеями"
     BTN_ACTIVITY = "🎯 З активностями"
+    BTN_FORECAST = "🔮 Прогноз на завтра"
     BTN_MENU = "🏠 Меню"
 
     @classmethod
@@ -15,6 +16,7 @@ class MainMenu:
         builder.button(text=cls.BTN_MOOD)
         builder.button(text=cls.BTN_IDEAS)
         builder.button(text=cls.BTN_ACTIVITY)
+        builder.button(text=cls.BTN_FORECAST)
         builder.button(text=cls.BTN_MENU)
-        builder.adjust(2, 2, 1)
+        builder.adjust(2, 2, 2)
         return builder.as_markup(resize_keyboard=True)
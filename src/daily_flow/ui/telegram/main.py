@@ -2,9 +2,11 @@ import logging
 
 from aiogram import Bot
 
+from daily_flow.analytics.datasets.reader import close_analytics_connections
 from daily_flow.app.container import build_container
 from daily_flow.config.config import BOT_TOKEN
 from daily_flow.config.db import load_db_settings
+from daily_flow.db.engine import dispose_engine
 from daily_flow.ui.telegram import handlers as handlers
 from daily_flow.ui.telegram.runtime import dp, router
 
@@ -26,4 +28,9 @@ async def build_telegram_bot_main():
 
     await bot.delete_webhook(drop_pending_updates=True)
 
-    await dp.start_polling(bot, db_container=db_container)
+    try:
+        await dp.start_polling(bot, db_container=db_container)
+    finally:
+        logger.info("Repo cache: %s", db_container.repo_cache.stats())
+        await dispose_engine(db_container.engine)
+        close_analytics_connections()
@@ -1,4 +1,8 @@
 from daily_flow.db.repositories.activity.activity_repo import Activity
+from daily_flow.db.repositories.activity.activity_stats_repo import (
+    ActivityStatsReport,
+    UsageStats,
+)
 from daily_flow.db.repositories.activity.activity_usage_repo import ActivityUsage
 from daily_flow.db.repositories.activity.category_repo import Category
 
@@ -83,3 +87,45 @@ def render_assign_category_result(is_inserted: bool, values: dict) -> str:
         f"🎯 Activity ID: `{activity_id}`\n"
         f"🏷️ Category ID: `{category_id}`"
     )
+
+
+def _delta(value: float | None) -> str:
+    return f"{value:+.1f}" if value is not None else "—"
+
+
+def _render_usage_stats(st: UsageStats) -> str:
+    return (
+        f"   {st.usages_count}× за {st.active_days} дн. | 🕒 {st.last_used_at:%d.%m %H:%M}\n"
+        f"   🙂 {_delta(st.mood_delta)} | ⚡ {_delta(st.energy_delta)} | "
+        f"⭐ {_delta(st.rating_delta)}\n"
+        f"   🔥 Серія: {st.current_streak} (рекорд {st.longest_streak})"
+    )
+
+
+def render_activity_stats_report(report: ActivityStatsReport, top_n: int = 10) -> str:
+    header = (
+        "📊 **Статистика активностей**\n"
+        f"📅 {report.date_from:%d.%m.%Y} – {report.date_to:%d.%m.%Y}\n"
+        "Зміни — середнє «після − до»."
+    )
+    if not report.activities:
+        return f"{header}\n\nЗа цей період виконань немає."
+
+    activities = "\n".join(
+        f"• `{a.activity_id}` **{_truncate(a.title, 60)}**\n{_render_usage_stats(a.stats)}"
+        for a in report.activities[:top_n]
+    )
+    text = (
+        f"{header}\n\n🎯 **Активності** (топ {min(top_n, len(report.activities))} "
+        f"з {len(report.activities)})\n{activities}"
+    )
+
+    if report.categories:
+        categories = "\n".join(
+            f"• `{c.category_id}` **{_truncate(c.name, 60)}** ({c.activities_count} акт.)\n"
+            f"{_render_usage_stats(c.stats)}"
+            for c in report.categories[:top_n]
+        )
+        text += f"\n\n🏷️ **Категорії**\n{categories}"
+
+    return text
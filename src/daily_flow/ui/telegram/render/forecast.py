@@ -0,0 +1,11 @@
+from daily_flow.services.forecast.service import Forecast
+
+
+def render_forecast(forecast: Forecast) -> str:
+    return f"""🔮 *Прогноз настрою на {forecast.day:%d-%m-%Y}*
+
+📈 Очікуваний настрій: *{forecast.mood:.1f}* з 7
+
+📅 За даними до {forecast.last_logged_day:%d-%m-%Y}
+🤖 Модель від {forecast.model_published_at:%d-%m-%Y %H:%M}
+"""
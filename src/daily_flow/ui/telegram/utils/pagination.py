@@ -0,0 +1,45 @@
+from enum import StrEnum
+
+from aiogram import types
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from daily_flow.db.repositories.pagination import Page, PageCursor, PageDirection
+
+
+class PageScreen(StrEnum):
+    IDEAS = "ideas"
+    ACTIVITIES = "activities"
+    USAGES_BY_ACTIVITY = "usages_activity"
+    USAGES_BY_PERIOD = "usages_period"
+
+
+def page_callback_prefix(screen: PageScreen) -> str:
+    return f"page_{screen}:"
+
+
+def get_page_keyboard(
+    screen: PageScreen, page: Page, *args: str
+) -> types.InlineKeyboardMarkup | None:
+    """
+    ⬅️/➡️ buttons for a list screen; page items must have an id. args (activity id, period
+    bounds) go to callback data as is, so together with the cursor they must fit 64 bytes.
+    """
+    if not page.has_prev and not page.has_next:
+        return None
+
+    def mk(direction: PageDirection, row_id: int) -> str:
+        return page_callback_prefix(screen) + ":".join((direction, str(row_id), *args))
+
+    builder = InlineKeyboardBuilder()
+    if page.has_prev:
+        builder.button(text="⬅️ Назад", callback_data=mk(PageDirection.PREV, page.items[0].id))
+    if page.has_next:
+        builder.button(text="Далі ➡️", callback_data=mk(PageDirection.NEXT, page.items[-1].id))
+
+    builder.adjust(2)
+    return builder.as_markup()
+
+
+def parse_page_callback(data: str) -> tuple[PageCursor, list[str]]:
+    _, direction, row_id, *args = data.split(":")
+    return PageCursor(row_id=int(row_id), direction=PageDirection(direction)), args
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+PIPELINE_QUEUE_SIZE = 2
+
+_DONE = object()
+
+
+async def iter_in_thread(
+    items: Iterable[T], maxsize: int = PIPELINE_QUEUE_SIZE
+) -> AsyncIterator[T]:
+    """
+    Runs a blocking iterator (Excel/CSV reading, pandas transforms, payload building) in a
+    worker thread and hands its items to the event loop through a bounded queue. The
+    producer blocks once maxsize items are waiting, so a slow consumer (the DB writer)
+    bounds memory, while the next item is already being prepared. Use with
+    contextlib.aclosing, so an early exit stops the worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(item, error: BaseException | None = None) -> None:
+        asyncio.run_coroutine_threadsafe(queue.put((item, error)), loop).result()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                put(item)
+            put(_DONE)
+        except BaseException as e:
+            put(_DONE, e)
+
+    producer = asyncio.ensure_future(asyncio.to_thread(produce))
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        # звільняємо чергу, щоб потік, заблокований на put, дійшов до перевірки stop
+        while not producer.done():
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.wait({producer}, timeout=0.05)
+        producer.result()
@@ -0,0 +1,103 @@
+import sys
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+try:
+    import resource
+except ImportError:  # Windows: без peak RSS
+    resource = None
+
+T = TypeVar("T")
+
+_END = object()
+
+
+def get_peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+
+    # ru_maxrss — пік RSS процесу: кілобайти на Linux, байти на macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak /= 1024
+    return round(peak / 1024, 1)
+
+
+@dataclass
+class StageTiming:
+    seconds: float = 0.0
+    calls: int = 0
+    peak_rss_mb: float | None = None
+
+
+class StageProfiler:
+    """
+    Per-stage wall-clock timers (perf_counter) with the process peak RSS sampled at the end
+    of every stage. Stages may run in worker threads and repeat per batch/chunk: timings
+    are summed and calls counted. A disabled profiler records nothing.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._stages: dict[str, StageTiming] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def _record(self, name: str, seconds: float) -> None:
+        peak_rss_mb = get_peak_rss_mb()
+        with self._lock:
+            timing = self._stages.setdefault(name, StageTiming())
+            timing.seconds += seconds
+            timing.calls += 1
+            timing.peak_rss_mb = peak_rss_mb
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, time.perf_counter() - started)
+
+    def iter_stage(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        # час стадії — це час отримання кожного елемента з ледачого джерела (читання файлу)
+        iterator = iter(items)
+        while True:
+            with self.stage(name):
+                item = next(iterator, _END)
+            if item is _END:
+                return
+            yield item
+
+    def to_metrics(self) -> dict[str, Any]:
+        with self._lock:
+            stages = {
+                name: {**asdict(timing), "seconds": round(timing.seconds, 6)}
+                for name, timing in self._stages.items()
+            }
+
+        return {
+            "total_seconds": round(time.perf_counter() - self._started, 6),
+            "peak_rss_mb": get_peak_rss_mb(),
+            "stages": stages,
+        }
+
+    def format(self) -> str:
+        metrics = self.to_metrics()
+        lines = [
+            f"{name:<12} {stage['seconds']:>9.3f}s  x{stage['calls']:<6} "
+            f"peak RSS {stage['peak_rss_mb']} MB"
+            for name, stage in metrics["stages"].items()
+        ]
+        lines.append(
+            f"{'total':<12} {metrics['total_seconds']:>9.3f}s  peak RSS {metrics['peak_rss_mb']} MB"
+        )
+        return "\n".join(lines)